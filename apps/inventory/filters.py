@@ -60,6 +60,7 @@ class ProductVariantStatusFilter(django_filters.FilterSet):
     category = django_filters.CharFilter(
         field_name="product__category", lookup_expr="icontains"
     )
+    low_stock = django_filters.BooleanFilter(method="filter_low_stock")
 
     class Meta:
         model = ProductVariantStatus
@@ -69,4 +70,11 @@ class ProductVariantStatusFilter(django_filters.FilterSet):
             "product_code",
             "variant_code",
             "category",
+            "low_stock",
         ]
+
+    def filter_low_stock(self, queryset, name, value):
+        # 저장된 기말재고 기준 재고부족(최소재고 이하) 행
+        if value:
+            return queryset.filter(ending_stock__lte=F("variant__min_stock"))
+        return queryset
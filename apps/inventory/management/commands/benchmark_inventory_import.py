@@ -0,0 +1,266 @@
+import io
+import json
+import time
+import tracemalloc
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from openpyxl import Workbook
+import pandas as pd
+from rest_framework.test import APIRequestFactory
+
+from apps.inventory.models import InventoryItem, ProductVariant
+from apps.inventory.utils.excel import EXCEL_HEADER_ROW, REQUIRED_COLUMNS
+from apps.inventory.views import ProductVariantExcelUploadView
+
+BENCH_PREFIX = "BIMP"
+BATCH_SIZE = 5000
+
+# 업로드 양식 컬럼 (필수 + 신규 상품 기본값)
+BENCH_COLUMNS = [*REQUIRED_COLUMNS, "카테고리", "대분류", "중분류"]
+
+
+class QueryCounter:
+    """connection.execute_wrapper용 쿼리 수 집계"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "엑셀 업로드 처리량 벤치마크: 합성 파일(신규 / 기존 / AUTO SKU 행)을 "
+        "업로드 뷰로 반영하며 시간, 쿼리 수, 최대 메모리 측정 (모든 변경은 롤백)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 100000],
+            help="파일 행 수 목록 (기본 1000 10000 100000)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["xlsx", "csv", "parquet"],
+            default="xlsx",
+            help="업로드 파일 형식 (기본 xlsx, load_excel 양식)",
+        )
+        parser.add_argument("--year", type=int, default=2025)
+        parser.add_argument("--month", type=int, default=6)
+        parser.add_argument(
+            "--existing-ratio",
+            type=float,
+            default=0.4,
+            help="이미 등록된 variant 행 비율 (기본 0.4)",
+        )
+        parser.add_argument(
+            "--auto-ratio",
+            type=float,
+            default=0.1,
+            help="상품코드 없는(AUTO SKU) 행 비율 (기본 0.1)",
+        )
+        parser.add_argument(
+            "--skip-memory",
+            action="store_true",
+            help="최대 메모리 측정 생략 (tracemalloc 실행이 느림)",
+        )
+        parser.add_argument(
+            "--output", help="측정 결과를 JSON으로 저장할 경로"
+        )
+
+    def handle(self, *args, **options):
+        if options["existing_ratio"] + options["auto_ratio"] > 1:
+            raise CommandError("--existing-ratio + --auto-ratio는 1 이하여야 합니다.")
+
+        results = []
+        for rows in options["rows"]:
+            results.extend(self.run_size(rows, options))
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"{'rows':>8}{'phase':>10}{'wall(s)':>10}{'rows/s':>10}"
+            f"{'queries':>9}{'peak(MB)':>10}  summary"
+        )
+        for r in results:
+            peak = "-" if r["peak_mb"] is None else f"{r['peak_mb']:.1f}"
+            self.stdout.write(
+                f"{r['rows']:>8}{r['phase']:>10}{r['wall_s']:>10.2f}"
+                f"{r['rows'] / r['wall_s']:>10.0f}{r['queries']:>9}{peak:>10}  "
+                f"{r['summary']}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"[SAVED] {options['output']}"))
+
+    def run_size(self, rows, options):
+        """
+        행 수 하나 측정 (트랜잭션 안에서 실행 후 전체 롤백)
+        - upload: 첫 업로드 (시간 / 쿼리 수)
+        - memory: 같은 첫 업로드를 tracemalloc으로 다시 실행 (최대 메모리)
+        - reupload: 첫 업로드 반영 후 같은 파일 재업로드 (변경 없음)
+        """
+        content = self.build_file(rows, options)
+        self.stdout.write(
+            f"[FILE] rows={rows} format={options['format']} "
+            f"size={len(content) / 1e6:.1f}MB"
+        )
+
+        results = []
+        with transaction.atomic():
+            self.seed_existing(rows, options)
+
+            upload = self.measure(content, options, rollback=True)
+            if not options["skip_memory"]:
+                upload["peak_mb"] = self.measure(
+                    content, options, rollback=True, trace_memory=True
+                )["peak_mb"]
+            results.append({"rows": rows, "phase": "upload", **upload})
+
+            self.measure(content, options, rollback=False)
+            reupload = self.measure(content, options, rollback=True)
+            results.append({"rows": rows, "phase": "reupload", **reupload})
+
+            transaction.set_rollback(True)
+
+        return results
+
+    def seed_existing(self, rows, options):
+        """파일의 기존 variant 행에 해당하는 상품 / variant 미리 생성"""
+        existing = int(rows * options["existing_ratio"])
+
+        products = InventoryItem.objects.bulk_create(
+            [
+                InventoryItem(product_id=f"{BENCH_PREFIX}{i:07d}", name=f"{BENCH_PREFIX} 상품 {i}")
+                for i in range(existing)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        ProductVariant.objects.bulk_create(
+            [
+                ProductVariant(
+                    product=product,
+                    option="A",
+                    variant_code=f"{product.product_id}-A",
+                )
+                for product in products
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    def build_rows(self, rows, options):
+        """
+        행 구성 (앞에서부터)
+        - 기존 variant: BIMP0000000-A ... (seed_existing에서 생성)
+        - AUTO SKU: 상품코드 없음, 행마다 다른 variant
+        - 나머지: 신규 상품 / variant
+        """
+        existing = int(rows * options["existing_ratio"])
+        auto = int(rows * options["auto_ratio"])
+
+        for i in range(rows):
+            if i < existing or i >= existing + auto:
+                code, option = f"{BENCH_PREFIX}{i:07d}-A", "A"
+            else:
+                # AUTO SKU 상품 키는 상품명 앞 3글자 → 옵션으로 variant 구분
+                code, option = None, f"A{i}"
+
+            yield [
+                code,
+                f"{BENCH_PREFIX} 상품 {i}",
+                "",
+                option,
+                "",
+                i % 100,
+                i % 7,
+                i % 11,
+                i % 5,
+                i % 3,
+                "일반",
+                "의류",
+                "상의",
+            ]
+
+    def build_file(self, rows, options):
+        if options["format"] == "xlsx":
+            # load_excel 양식: 제목 행 + 빈 행 + 3번째 행 헤더
+            # (write_only 파일은 <dimension>이 없어 읽을 때 시트 전체를 한 번 더 훑음
+            #  → 엑셀 저장 파일과 같도록 일반 모드로 생성)
+            workbook = Workbook()
+            sheet = workbook.active
+            sheet.append([f"{BENCH_PREFIX} {rows}행"])
+            for _ in range(EXCEL_HEADER_ROW - 1):
+                sheet.append([])
+            sheet.append(BENCH_COLUMNS)
+            for row in self.build_rows(rows, options):
+                sheet.append(row)
+
+            buffer = io.BytesIO()
+            workbook.save(buffer)
+            return buffer.getvalue()
+
+        df = pd.DataFrame(self.build_rows(rows, options), columns=BENCH_COLUMNS)
+        if options["format"] == "csv":
+            return df.to_csv(index=False).encode("utf-8-sig")
+
+        buffer = io.BytesIO()
+        try:
+            df.to_parquet(buffer, index=False)
+        except ImportError as e:
+            raise CommandError(f"Parquet 파일 생성 실패: {e}")
+        return buffer.getvalue()
+
+    def measure(self, content, options, rollback, trace_memory=False):
+        """업로드 뷰 1회 실행 → {"wall_s", "queries", "peak_mb", "summary"}"""
+        request = APIRequestFactory().post(
+            f"/?year={options['year']}&month={options['month']}",
+            {"file": SimpleUploadedFile(f"bench.{options['format']}", content)},
+            format="multipart",
+        )
+        view = ProductVariantExcelUploadView.as_view()
+        counter = QueryCounter()
+
+        with transaction.atomic():
+            if trace_memory:
+                tracemalloc.start()
+
+            started = time.perf_counter()
+            with connection.execute_wrapper(counter):
+                response = view(request)
+            wall = time.perf_counter() - started
+
+            peak = None
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+
+            if rollback:
+                transaction.set_rollback(True)
+
+        if response.status_code != 201:
+            raise CommandError(f"업로드 실패: {response.data}")
+
+        summary = response.data["summary"]
+        return {
+            "wall_s": wall,
+            "queries": counter.count,
+            "peak_mb": peak,
+            "summary": {
+                key: summary[key]
+                for key in (
+                    "created_variants",
+                    "skipped_variants",
+                    "created_status",
+                    "updated_status",
+                    "unchanged_status",
+                )
+            },
+        }
@@ -0,0 +1,253 @@
+import random
+import re
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.inventory.models import (
+    InventoryAdjustment,
+    InventoryItem,
+    ProductVariant,
+    ProductVariantStatus,
+)
+
+BENCH_PREFIX = "BENCH"
+BATCH_SIZE = 5000
+
+# before 측정 시 임시 삭제하는 인덱스
+# - 0008_monthly_lookup_indexes에서 추가한 인덱스 전부
+# - pvs_month_ending_stock_idx (0007): (year, month) 접두 인덱스라 남겨 두면
+#   before에서도 월 조회가 인덱스를 타 비교가 공정하지 않음
+BENCH_INDEXES = [
+    "pvs_month_ending_stock_idx",
+    "adj_variant_month_idx",
+    "pvs_month_product_idx",
+    "products_product_id_trgm_idx",
+    "products_name_trgm_idx",
+    "products_category_trgm_idx",
+    "variants_variant_code_trgm_idx",
+]
+
+EXECUTION_TIME_RE = re.compile(r"Execution Time: ([\d.]+) ms")
+
+
+class Command(BaseCommand):
+    help = (
+        "재고 조회 인덱스 벤치마크: 시드 데이터 생성 후 "
+        "인덱스 유무(before/after)별 실행 계획과 시간 비교 "
+        "(한 트랜잭션에서 실행 후 전체 롤백, DEBUG 또는 --i-know 필요)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--variants", type=int, default=100000, help="시드 variant 수 (기본 100000)"
+        )
+        parser.add_argument("--year", type=int, default=2025)
+        parser.add_argument("--month", type=int, default=6)
+        parser.add_argument(
+            "--months", type=int, default=12, help="variant당 생성할 월 수 (기본 12)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="쿼리별 반복 측정 횟수 (최솟값 사용)"
+        )
+        parser.add_argument(
+            "--plans", action="store_true", help="실행 계획 전문 출력"
+        )
+        parser.add_argument(
+            "--i-know",
+            action="store_true",
+            help=(
+                "DEBUG가 아닌 DB에서도 실행 (측정 동안 재고 테이블에 "
+                "ACCESS EXCLUSIVE 잠금이 걸림)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL에서만 실행할 수 있습니다.")
+
+        # before 측정의 DROP INDEX는 롤백 전까지 테이블 전체를 잠금
+        if not settings.DEBUG and not options["i_know"]:
+            raise CommandError(
+                "DEBUG가 아닌 환경입니다. 운영 DB가 아닌지 확인 후 --i-know로 실행하세요."
+            )
+
+        # 시드 / ANALYZE / 측정 전부 한 트랜잭션 → 항상 롤백 (DB에 남는 것 없음)
+        with transaction.atomic():
+            self.seed(options)
+
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE products")
+                cursor.execute("ANALYZE product_variants")
+                cursor.execute("ANALYZE inventory_productvariantstatus")
+                cursor.execute("ANALYZE inventory_adjustments")
+
+            queries = self.build_queries(options)
+
+            after = {name: self.explain(qs, options) for name, qs in queries}
+
+            # before: 인덱스 삭제 후 측정 (롤백으로 복구)
+            with connection.cursor() as cursor:
+                for index in BENCH_INDEXES:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index}")
+            before = {name: self.explain(qs, options) for name, qs in queries}
+
+            transaction.set_rollback(True)
+
+        self.stdout.write("")
+        self.stdout.write(f"{'query':<28}{'before(ms)':>12}{'after(ms)':>12}")
+        for name, _ in queries:
+            self.stdout.write(
+                f"{name:<28}{before[name][0]:>12.2f}{after[name][0]:>12.2f}"
+            )
+
+        if options["plans"]:
+            for name, _ in queries:
+                self.stdout.write(f"\n=== {name} (before) ===\n{before[name][1]}")
+                self.stdout.write(f"\n=== {name} (after) ===\n{after[name][1]}")
+
+    def seed(self, options):
+        """
+        시드 데이터 생성 (product_id가 BENCH로 시작, 호출 측 트랜잭션에서 롤백)
+        - 상품 1개당 variant 4개, variant당 --months개 월 재고 행
+        - variant 5개 중 1개꼴로 월마다 재고조정 2건
+        """
+        total = options["variants"]
+        year, month = options["year"], options["month"]
+        rng = random.Random(42)
+        words = ["코튼", "린넨", "울", "데님", "니트", "셔츠", "팬츠", "자켓"]
+        categories = ["상의", "하의", "아우터", "잡화", "일반"]
+
+        with transaction.atomic():
+            products = InventoryItem.objects.bulk_create(
+                [
+                    InventoryItem(
+                        product_id=f"{BENCH_PREFIX}{i:07d}",
+                        name=f"{rng.choice(words)} {rng.choice(words)} {i}",
+                        category=rng.choice(categories),
+                    )
+                    for i in range((total + 3) // 4)
+                ],
+                batch_size=BATCH_SIZE,
+            )
+
+            variants = ProductVariant.objects.bulk_create(
+                [
+                    ProductVariant(
+                        product=products[i // 4],
+                        option=f"옵션{i % 4}",
+                        variant_code=f"{BENCH_PREFIX}-V{i:07d}",
+                    )
+                    for i in range(total)
+                ],
+                batch_size=BATCH_SIZE,
+            )
+
+            months = []
+            y, m = year, month
+            for _ in range(options["months"]):
+                months.append((y, m))
+                y, m = (y - 1, 12) if m == 1 else (y, m - 1)
+
+            for y, m in months:
+                ProductVariantStatus.objects.bulk_create(
+                    [
+                        ProductVariantStatus(
+                            year=y,
+                            month=m,
+                            product_id=v.product_id,
+                            variant=v,
+                            warehouse_stock_start=rng.randint(0, 100),
+                            store_stock_start=rng.randint(0, 50),
+                        )
+                        for v in variants
+                    ],
+                    batch_size=BATCH_SIZE,
+                )
+
+            InventoryAdjustment.objects.bulk_create(
+                [
+                    InventoryAdjustment(
+                        variant=v,
+                        year=y,
+                        month=m,
+                        delta=rng.randint(-5, 5),
+                        reason="benchmark",
+                        created_by="benchmark",
+                    )
+                    for y, m in months
+                    for v in variants[::5]
+                    for _ in range(2)
+                ],
+                batch_size=BATCH_SIZE,
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[SEED] (rollback 예정) products={len(products)} variants={len(variants)} "
+                f"months={len(months)}"
+            )
+        )
+
+    def build_queries(self, options):
+        year, month = options["year"], options["month"]
+        sample = (
+            ProductVariant.objects.filter(variant_code__startswith=BENCH_PREFIX)
+            .order_by("variant_code")
+            .values_list("id", flat=True)
+        )
+        page_ids = list(sample[1000:1100])
+
+        monthly = ProductVariantStatus.objects.filter(year=year, month=month)
+
+        return [
+            (
+                "monthly_list_page",
+                monthly.select_related("product", "variant").order_by(
+                    "product__product_id", "variant__variant_code"
+                )[:100],
+            ),
+            (
+                "adjustment_page_sum",
+                InventoryAdjustment.objects.filter(
+                    variant_id__in=page_ids, year=year, month=month
+                ).order_by("-created_at"),
+            ),
+            (
+                "adjustment_single_sum",
+                InventoryAdjustment.objects.filter(
+                    variant_id=page_ids[0], year=year, month=month
+                ).order_by(),
+            ),
+            (
+                "status_product_code",
+                monthly.filter(product__product_id__icontains="00123"),
+            ),
+            (
+                "status_variant_code",
+                monthly.filter(variant__variant_code__icontains="V00456"),
+            ),
+            (
+                "status_category",
+                monthly.filter(product__category__icontains="아우터")[:100],
+            ),
+            (
+                "variant_product_name",
+                ProductVariant.objects.filter(product__name__icontains="린넨 데님 12"),
+            ),
+        ]
+
+    def explain(self, queryset, options):
+        """EXPLAIN ANALYZE 실행 → (최소 실행 시간 ms, 마지막 실행 계획)"""
+        sql, params = queryset.query.sql_with_params()
+        best, plan = None, ""
+
+        with connection.cursor() as cursor:
+            for _ in range(max(options["repeat"], 1)):
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+                elapsed = float(EXECUTION_TIME_RE.search(plan).group(1))
+                best = elapsed if best is None else min(best, elapsed)
+
+        return best, plan
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.inventory.models import ProductVariant
+from apps.inventory.services.recompute import recompute_forward
+
+
+class Command(BaseCommand):
+    help = "지정한 달 이후 모든 달의 이월 기초재고 / 기말재고 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, required=True, help="시작 연도")
+        parser.add_argument("--month", type=int, required=True, help="시작 월")
+        parser.add_argument(
+            "--variant",
+            action="append",
+            dest="variant_codes",
+            help="재계산할 variant_code (여러 번 지정 가능, 미입력 시 전체)",
+        )
+
+    def handle(self, *args, **options):
+        if not (1 <= options["month"] <= 12):
+            raise CommandError("month는 1~12 사이여야 합니다.")
+
+        variant_ids = None
+        if options["variant_codes"]:
+            variant_ids = list(
+                ProductVariant.objects.filter(
+                    variant_code__in=options["variant_codes"]
+                ).values_list("id", flat=True)
+            )
+            if len(variant_ids) != len(set(options["variant_codes"])):
+                raise CommandError("존재하지 않는 variant_code가 있습니다.")
+
+        result = recompute_forward(
+            options["year"], options["month"], variant_ids=variant_ids
+        )
+
+        for row in result["months"]:
+            self.stdout.write(f"[UPDATED] {row['year']}-{row['month']}: {row['updated']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"[OK] {result['updated']} rows updated")
+        )
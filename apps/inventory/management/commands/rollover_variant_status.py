@@ -1,26 +1,62 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
-from apps.inventory.utils.monthly_snapshot import rollover_variant_status
+from apps.inventory.services.rollover import (
+    ROLLOVER_CHUNK_SIZE,
+    ROLLOVER_MODES,
+    RolloverLocked,
+    rollover_month,
+)
 
 
 class Command(BaseCommand):
-    help = "전달 ProductVariantStatus를 기준으로 다음 달 상품 목록 생성"
+    help = "전달 ProductVariantStatus를 기준으로 이번 달 상품 목록 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year", type=int, help="생성할 연도 (미입력 시 이번 달 기준)"
+        )
+        parser.add_argument(
+            "--month", type=int, help="생성할 월 (미입력 시 이번 달 기준)"
+        )
+        parser.add_argument(
+            "--mode",
+            choices=ROLLOVER_MODES,
+            default="structure",
+            help="carry: 기말재고 이월 / structure: 상품 목록만 (기본)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=ROLLOVER_CHUNK_SIZE,
+            help=f"chunk당 variant 수 (기본 {ROLLOVER_CHUNK_SIZE})",
+        )
 
     def handle(self, *args, **options):
-        today = timezone.now().date()
+        today = timezone.localdate()
+        year = options["year"] or today.year
+        month = options["month"] or today.month
+
+        if not (1 <= month <= 12):
+            raise CommandError("month는 1~12 사이여야 합니다.")
 
-        # 전달 기준
-        if today.month == 1:
-            year, month = today.year - 1, 12
-        else:
-            year, month = today.year, today.month - 1
+        def progress(done, total):
+            self.stdout.write(f"[PROGRESS] {done}/{total}")
 
-        result = rollover_variant_status(year, month)
+        try:
+            result = rollover_month(
+                year,
+                month,
+                mode=options["mode"],
+                chunk_size=options["chunk_size"],
+                progress=progress,
+            )
+        except RolloverLocked as e:
+            raise CommandError(str(e))
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"[OK] {result['year']}-{result['month']} "
-                f"{result['created_count']} rows created"
+                f"[OK] {result['year']}-{result['month']} ({result['mode']}) "
+                f"{result['created']} rows created, {result['skipped']} skipped"
             )
         )
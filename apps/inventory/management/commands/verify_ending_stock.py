@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.inventory.models import ProductVariantStatus
+from apps.inventory.services.ending_stock import (
+    find_ending_stock_drift,
+    refresh_ending_stock,
+)
+
+
+class Command(BaseCommand):
+    help = "저장된 ending_stock을 재계산 값과 비교해 불일치(drift) 행을 보고"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, help="검사할 연도 (미입력 시 전체)")
+        parser.add_argument("--month", type=int, help="검사할 월 (미입력 시 전체)")
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="불일치 행의 ending_stock을 재계산 값으로 갱신",
+        )
+
+    def handle(self, *args, **options):
+        queryset = ProductVariantStatus.objects.all()
+
+        if options["year"]:
+            queryset = queryset.filter(year=options["year"])
+        if options["month"]:
+            queryset = queryset.filter(month=options["month"])
+
+        drifted = list(find_ending_stock_drift(queryset))
+
+        for row in drifted:
+            self.stdout.write(
+                f"[DRIFT] {row.year}-{row.month} {row.variant.variant_code}: "
+                f"stored={row.ending_stock} expected={row.expected_ending_stock}"
+            )
+
+        if not drifted:
+            self.stdout.write(
+                self.style.SUCCESS(f"[OK] {queryset.count()} rows checked, no drift")
+            )
+            return
+
+        if options["fix"]:
+            with transaction.atomic():
+                fixed = refresh_ending_stock(
+                    ProductVariantStatus.objects.filter(
+                        pk__in=[row.pk for row in drifted]
+                    )
+                )
+            self.stdout.write(self.style.SUCCESS(f"[FIXED] {fixed} rows updated"))
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"[WARN] {len(drifted)} rows drifted (run with --fix to repair)"
+                )
+            )
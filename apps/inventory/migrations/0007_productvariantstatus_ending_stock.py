@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_repair_products_is_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productvariantstatus',
+            name='ending_stock',
+            field=models.IntegerField(default=0),
+        ),
+        # 기존 행 ending_stock 채우기
+        migrations.RunSQL(
+            sql="""
+            UPDATE inventory_productvariantstatus AS s
+               SET ending_stock = s.warehouse_stock_start
+                                + s.store_stock_start
+                                + s.inbound_quantity
+                                - s.store_sales
+                                - s.online_sales
+                                + COALESCE((
+                                    SELECT SUM(a.delta)
+                                      FROM inventory_adjustments AS a
+                                     WHERE a.variant_id = s.variant_id
+                                       AND a.year = s.year
+                                       AND a.month = s.month
+                                  ), 0);
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='productvariantstatus',
+            index=models.Index(fields=['year', 'month', 'ending_stock'], name='pvs_month_ending_stock_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:00
+
+from django.db import migrations, models
+
+
+# icontains 필터용 trigram 인덱스
+# - Django(PostgreSQL)의 icontains는 UPPER("col"::text) LIKE UPPER(%s)로 변환되므로
+#   같은 표현식에 인덱스를 걸어야 플래너가 사용
+# - pg_trgm 확장이 없거나 설치 권한이 없는 환경에서는 건너뜀 (마이그레이션 실패 방지)
+TRIGRAM_INDEXES = [
+    ("products_product_id_trgm_idx", "products", "product_id"),
+    ("products_name_trgm_idx", "products", "name"),
+    ("products_category_trgm_idx", "products", "category"),
+    ("variants_variant_code_trgm_idx", "product_variants", "variant_code"),
+]
+
+CREATE_TRIGRAM_INDEXES = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        RAISE NOTICE 'pg_trgm not available, skipping trigram indexes';
+        RETURN;
+    END IF;
+
+    -- 확장 생성 권한이 없는 역할이면 건너뜀 (이 블록만 롤백)
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+%s
+    EXCEPTION WHEN insufficient_privilege THEN
+        RAISE NOTICE 'no privilege to create pg_trgm, skipping trigram indexes';
+    END;
+END
+$$;
+""" % "\n".join(
+    f"        CREATE INDEX IF NOT EXISTS {name} ON {table} "
+    f"USING gin (UPPER({column}::text) gin_trgm_ops);"
+    for name, table, column in TRIGRAM_INDEXES
+)
+
+DROP_TRIGRAM_INDEXES = "\n".join(
+    f"DROP INDEX IF EXISTS {name};" for name, _, _ in TRIGRAM_INDEXES
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_productvariantstatus_ending_stock'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventoryadjustment',
+            index=models.Index(fields=['variant', 'year', 'month'], name='adj_variant_month_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productvariantstatus',
+            index=models.Index(fields=['year', 'month', 'product'], name='pvs_month_product_idx'),
+        ),
+        migrations.RunSQL(
+            sql=CREATE_TRIGRAM_INDEXES,
+            reverse_sql=DROP_TRIGRAM_INDEXES,
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:22
+
+import apps.inventory.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0009_updated_at_watermarks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventoryImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField(default=apps.inventory.models.current_year)),
+                ('month', models.IntegerField(default=apps.inventory.models.current_month)),
+                ('file', models.FileField(blank=True, upload_to='inventory_imports/%Y/%m/')),
+                ('file_name', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('total_rows', models.IntegerField(default=0)),
+                ('processed_rows', models.IntegerField(default=0, help_text='커밋 완료된 행 수 (chunk 단위)')),
+                ('summary', models.JSONField(blank=True, default=dict)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'inventory_import_jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
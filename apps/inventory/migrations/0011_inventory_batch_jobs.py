@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_inventory_import_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventoryBatchJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('ROLLOVER', 'Rollover'), ('RECOMPUTE', 'Recompute')], max_length=20)),
+                ('year', models.IntegerField()),
+                ('month', models.IntegerField()),
+                ('params', models.JSONField(blank=True, default=dict, help_text='mode (이월) / variant_ids (재계산)')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('total', models.IntegerField(default=0)),
+                ('done', models.IntegerField(default=0, help_text='처리 완료된 행 수 (chunk 단위)')),
+                ('result', models.JSONField(blank=True, default=dict)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'inventory_batch_jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
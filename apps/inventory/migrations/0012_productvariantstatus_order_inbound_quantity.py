@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+# 기존 행의 발주 입고분 채우기
+# - 같은 월(설정 시간대 기준 completed_at)의 완료 발주 수량 합
+# - 이미 수기로 덮어쓴 행은 입고량을 넘지 않도록 LEAST
+BACKFILL_SQL = """
+UPDATE inventory_productvariantstatus AS s
+   SET order_inbound_quantity = GREATEST(LEAST(s.inbound_quantity, inbound.quantity), 0)
+  FROM (
+      SELECT i.variant_id,
+             EXTRACT(YEAR FROM o.completed_at AT TIME ZONE %(tz)s)::int AS year,
+             EXTRACT(MONTH FROM o.completed_at AT TIME ZONE %(tz)s)::int AS month,
+             SUM(i.quantity) AS quantity
+        FROM order_items AS i
+        JOIN orders AS o ON o.id = i.order_id
+       WHERE o.status = 'COMPLETED' AND o.completed_at IS NOT NULL
+       GROUP BY 1, 2, 3
+  ) AS inbound
+ WHERE s.variant_id = inbound.variant_id
+   AND s.year = inbound.year
+   AND s.month = inbound.month
+"""
+
+
+def backfill_order_inbound(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(BACKFILL_SQL, {"tz": settings.TIME_ZONE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0011_inventory_batch_jobs'),
+        ('orders', '0002_order_completed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productvariantstatus',
+            name='order_inbound_quantity',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_order_inbound, migrations.RunPython.noop),
+    ]
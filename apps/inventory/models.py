@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import F, Sum
 from django.conf import settings
 from django.utils import timezone
 
@@ -10,10 +11,23 @@ def current_month():
     return timezone.now().month
 
 
+class UpdatedAtMixin:
+    """
+    update_fields 지정 저장에도 updated_at(auto_now) 갱신
+    (조건부 GET의 변경 기준값으로 사용)
+    """
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "updated_at" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "updated_at"]
+        super().save(*args, **kwargs)
+
+
 ######
 # ProductVariantStatus + InventoryItem + ProductVariant = 엑셀 화면
 
-class InventoryItem(models.Model):
+class InventoryItem(UpdatedAtMixin, models.Model):
     product_id = models.CharField(max_length=50, unique=True, default="P00000")
     big_category = models.CharField(max_length=50, blank=True)   # 대분류
     middle_category = models.CharField(max_length=50, blank=True)  # 중분류
@@ -22,6 +36,7 @@ class InventoryItem(models.Model):
     name = models.CharField(max_length=255, blank=True) # 오프라인 이름
     online_name = models.CharField(max_length=255, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     management_code = models.CharField(max_length=50, blank=True, null=True) # 사용 안 함, DB 유지용으로 남김.
     is_active = models.BooleanField(default=True)
   
@@ -35,7 +50,7 @@ class InventoryItem(models.Model):
 
 
 # Product (Snapshot - 정적인 정보)
-class ProductVariant(models.Model):
+class ProductVariant(UpdatedAtMixin, models.Model):
     product = models.ForeignKey(
         InventoryItem, on_delete=models.CASCADE, related_name="variants"
     )  
@@ -76,7 +91,7 @@ class ProductVariant(models.Model):
         return f"{self.variant_code}({self.option})"
 
 # Product (Active - 동적인 정보)
-class ProductVariantStatus(models.Model):
+class ProductVariantStatus(UpdatedAtMixin, models.Model):
     year = models.IntegerField()
     month = models.IntegerField()
 
@@ -86,16 +101,124 @@ class ProductVariantStatus(models.Model):
     warehouse_stock_start = models.IntegerField(default=0)  # 월초창고
     store_stock_start = models.IntegerField(default=0)      # 월초매장
 
-    inbound_quantity = models.IntegerField(default=0)       # 당월입고 (나중에 order가 해당 내용 조정)
+    inbound_quantity = models.IntegerField(default=0)       # 당월입고 (수기 / 엑셀 입력 + 완료 발주)
+    # inbound_quantity 중 완료 발주로 반영된 수량 (발주 대사 기준, 수기 / 엑셀 입력분과 구분)
+    order_inbound_quantity = models.IntegerField(default=0)
 
     store_sales = models.IntegerField(default=0)            # 매장판매
     online_sales = models.IntegerField(default=0)           # 쇼핑몰판매
 
+    # 기말재고 = 기초재고 + 입고 - 판매 + 재고조정 합
+    # 조회 시 계산하지 않고 쓰기 시점에 유지 (정렬/재고부족 필터용)
+    ending_stock = models.IntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     version = models.IntegerField(default=0)
 
+    # ending_stock 계산에 참여하는 필드
+    STOCK_FIELDS = (
+        "warehouse_stock_start",
+        "store_stock_start",
+        "inbound_quantity",
+        "store_sales",
+        "online_sales",
+    )
+
     class Meta:
         unique_together = ("year", "month", "variant")
+        indexes = [
+            models.Index(
+                fields=["year", "month", "ending_stock"],
+                name="pvs_month_ending_stock_idx",
+            ),
+            # 월별 목록: filter(year, month) + product 조인/정렬
+            models.Index(
+                fields=["year", "month", "product"],
+                name="pvs_month_product_idx",
+            ),
+        ]
+
+    @staticmethod
+    def base_stock_expression():
+        # 재고조정을 제외한 기말재고 (DB 표현식)
+        return (
+            F("warehouse_stock_start")
+            + F("store_stock_start")
+            + F("inbound_quantity")
+            - F("store_sales")
+            - F("online_sales")
+        )
+
+    def calculate_base_stock(self):
+        # 재고조정을 제외한 기말재고
+        return (
+            self.warehouse_stock_start
+            + self.store_stock_start
+            + self.inbound_quantity
+            - self.store_sales
+            - self.online_sales
+        )
+
+    def calculate_ending_stock(self):
+        # 재고조정 합을 DB에서 다시 읽어 기말재고 전체 재계산
+        adjustment_total = (
+            InventoryAdjustment.objects.filter(
+                variant_id=self.variant_id,
+                year=self.year,
+                month=self.month,
+            ).aggregate(total=Sum("delta"))["total"]
+            or 0
+        )
+        return self.calculate_base_stock() + adjustment_total
+
+    def apply_stock_changes(self, changes):
+        """
+        재고 필드 변경 + ending_stock 증분을 UPDATE 한 번으로 반영
+        - changes: {필드명: 값}, STOCK_FIELDS만 허용 (정수 변환 실패 시 ValueError / TypeError)
+        - ending_stock은 DB 현재 값 기준 F() 증분
+          → 읽은 뒤 커밋된 재고조정 / 발주 입고 증분도 잃지 않음
+        - version 증가 (bulk 저장 CAS에서 충돌로 감지)
+        - 반영 후 변경된 필드를 DB에서 다시 읽어 self 갱신
+        """
+        values = {field: int(value) for field, value in changes.items()}
+
+        # 기말재고 = 기초재고 + 입고 - 판매 → 필드별 (새 값 - 현재 값) 반영
+        ending_stock = F("ending_stock")
+        for field, value in values.items():
+            if field in ("store_sales", "online_sales"):
+                ending_stock = ending_stock - (models.Value(value) - F(field))
+            else:
+                ending_stock = ending_stock + (models.Value(value) - F(field))
+
+        ProductVariantStatus.objects.filter(pk=self.pk).update(
+            **values,
+            ending_stock=ending_stock,
+            version=F("version") + 1,
+            updated_at=timezone.now(),
+        )
+        self.refresh_from_db(
+            fields=[*values, "ending_stock", "version", "updated_at"]
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        ending_stock을 직접 지정하지 않은 저장이면 재계산
+        - 신규 생성 / update_fields 없는 전체 저장
+        - update_fields에 재고 필드만 포함된 경우
+        """
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is None:
+            self.ending_stock = self.calculate_ending_stock()
+        elif "ending_stock" not in update_fields and set(update_fields) & set(
+            self.STOCK_FIELDS
+        ):
+            self.ending_stock = self.calculate_ending_stock()
+            kwargs["update_fields"] = [*update_fields, "ending_stock"]
+
+        super().save(*args, **kwargs)
+
 
 
 
@@ -116,7 +239,152 @@ class InventoryAdjustment(models.Model):
     class Meta:
         db_table = "inventory_adjustments"
         ordering = ["-created_at"]
+        indexes = [
+            # 행별/페이지별 조정 합계: filter(variant, year, month)
+            models.Index(
+                fields=["variant", "year", "month"],
+                name="adj_variant_month_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+
+        # 수정 전 (variant, year, month): 키가 바뀌면 이전 월 기말재고도 재계산
+        previous_key = None
+        if not adding:
+            previous_key = (
+                InventoryAdjustment.objects.filter(pk=self.pk)
+                .values_list("variant_id", "year", "month")
+                .first()
+            )
+
+        super().save(*args, **kwargs)
+
+        status_qs = ProductVariantStatus.objects.filter(
+            variant_id=self.variant_id,
+            year=self.year,
+            month=self.month,
+        )
+
+        if adding:
+            # 신규 조정: 해당 월 기말재고에 delta 누적
+            status_qs.update(
+                ending_stock=F("ending_stock") + self.delta,
+                updated_at=timezone.now(),
+            )
+            return
+
+        # 기존 조정 수정: 현재 키 행 + (키가 바뀌었으면) 이전 키 행 재계산
+        if previous_key and previous_key != (self.variant_id, self.year, self.month):
+            variant_id, year, month = previous_key
+            status_qs = status_qs | ProductVariantStatus.objects.filter(
+                variant_id=variant_id, year=year, month=month
+            )
+
+        for status_obj in status_qs:
+            status_obj.ending_stock = status_obj.calculate_ending_stock()
+            status_obj.save(update_fields=["ending_stock"])
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        ProductVariantStatus.objects.filter(
+            variant_id=self.variant_id,
+            year=self.year,
+            month=self.month,
+        ).update(
+            ending_stock=F("ending_stock") - self.delta,
+            updated_at=timezone.now(),
+        )
+
+        return result
 
     def __str__(self):
         return f"Adjustment for {self.variant.variant_code}: {self.delta}"
-    
\ No newline at end of file
+    
+
+# 엑셀 업로드 백그라운드 작업 (업로드 파일 보관 + 진행 상황)
+class InventoryImportJob(models.Model):
+    STATUS_PENDING = "PENDING"
+    STATUS_RUNNING = "RUNNING"
+    STATUS_SUCCEEDED = "SUCCEEDED"
+    STATUS_FAILED = "FAILED"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    year = models.IntegerField(default=current_year)
+    month = models.IntegerField(default=current_month)
+    file = models.FileField(upload_to="inventory_imports/%Y/%m/", blank=True)
+    file_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    total_rows = models.IntegerField(default=0)
+    processed_rows = models.IntegerField(
+        default=0, help_text="커밋 완료된 행 수 (chunk 단위)"
+    )
+    summary = models.JSONField(default=dict, blank=True)
+    errors = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "inventory_import_jobs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Import job {self.pk} ({self.year}-{self.month}): {self.status}"
+
+
+# 월 이월 / 이후 달 재계산 백그라운드 작업 (진행 상황)
+class InventoryBatchJob(models.Model):
+    KIND_ROLLOVER = "ROLLOVER"
+    KIND_RECOMPUTE = "RECOMPUTE"
+
+    KIND_CHOICES = [
+        (KIND_ROLLOVER, "Rollover"),
+        (KIND_RECOMPUTE, "Recompute"),
+    ]
+
+    STATUS_PENDING = "PENDING"
+    STATUS_RUNNING = "RUNNING"
+    STATUS_SUCCEEDED = "SUCCEEDED"
+    STATUS_FAILED = "FAILED"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    year = models.IntegerField()
+    month = models.IntegerField()
+    params = models.JSONField(
+        default=dict, blank=True, help_text="mode (이월) / variant_ids (재계산)"
+    )
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    total = models.IntegerField(default=0)
+    done = models.IntegerField(default=0, help_text="처리 완료된 행 수 (chunk 단위)")
+    result = models.JSONField(default=dict, blank=True)
+    errors = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "inventory_batch_jobs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.kind} job {self.pk} ({self.year}-{self.month}): {self.status}"
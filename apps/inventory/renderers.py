@@ -0,0 +1,87 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경은 표준 json으로 대체
+    orjson = None
+
+
+class FileDownloadRenderer(BaseRenderer):
+    """
+    ?format=csv / ?format=xlsx 파일 다운로드용 Renderer
+
+    - 실제 파일은 뷰에서 스트리밍 응답으로 직접 생성
+    - content negotiation 통과 및 에러 응답(dict) 출력 용도
+    """
+
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if isinstance(data, bytes):
+            return data
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+class CSVRenderer(FileDownloadRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class XLSXRenderer(FileDownloadRenderer):
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    format = "xlsx"
+
+
+def to_columnar(rows):
+    """
+    dict 목록 → {"columns": [...], "rows": [[...], ...]}
+    - 컬럼 순서는 첫 행 기준 (같은 serializer 결과라 모든 행의 키가 동일)
+    """
+    rows = list(rows)
+    columns = list(rows[0].keys()) if rows else []
+    return {
+        "columns": columns,
+        "rows": [[row.get(column) for column in columns] for row in rows],
+    }
+
+
+class CompactJSONRenderer(BaseRenderer):
+    """
+    ?format=compact 컬럼형 JSON Renderer (대용량 목록/Export용)
+
+    - list 응답: {"columns": [...], "rows": [[...], ...]}
+    - 페이지 응답: count/next/previous 유지, results → columns + rows
+    - 그 외(에러/단건 dict)는 그대로 출력
+    - orjson 설치 시 orjson으로 인코딩 (없으면 표준 json)
+    """
+
+    media_type = "application/vnd.crimson.compact+json"
+    format = "compact"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if isinstance(data, list):
+            data = to_columnar(data)
+        elif isinstance(data, dict) and isinstance(data.get("results"), list):
+            data = {
+                **{key: value for key, value in data.items() if key != "results"},
+                **to_columnar(data["results"]),
+            }
+
+        if orjson is not None:
+            return orjson.dumps(data, default=encoders.JSONEncoder().default)
+
+        return json.dumps(
+            data,
+            cls=encoders.JSONEncoder,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
@@ -1,15 +1,18 @@
 from rest_framework import serializers
-from django.db.models import Sum
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 
 from apps.inventory.utils.variant_code import build_variant_code
+from apps.inventory.services.adjustment_summary import build_adjustment_summary
 
 
 from .models import (
     InventoryItem,
     ProductVariant,
     InventoryAdjustment,
-    ProductVariantStatus
+    ProductVariantStatus,
+    InventoryImportJob,
+    InventoryBatchJob,
 )
 
 ####### Base Serializer: InventoryItem, ProductVariant, InventoryAdjustment
@@ -74,40 +77,28 @@ class ProductVariantSerializer(serializers.ModelSerializer):
         return fields
 
 
-    def get_stock(self, obj):
-        today = timezone.now()
-        year = today.year
-        month = today.month
-
-        try:
-            status = ProductVariantStatus.objects.get(
-                variant=obj,
-                year=year,
-                month=month,
+    @staticmethod
+    def annotate_stock(queryset):
+        """
+        stock 필드용: 이번 달 기말재고(ProductVariantStatus.ending_stock)를 annotate
+        → 목록 직렬화 시 variant마다 쿼리하지 않음
+        """
+        today = timezone.localdate()
+        return queryset.annotate(
+            current_stock=Subquery(
+                ProductVariantStatus.objects.filter(
+                    variant_id=OuterRef("pk"),
+                    year=today.year,
+                    month=today.month,
+                ).values("ending_stock")[:1]
             )
-        except ProductVariantStatus.DoesNotExist:
-            return 0
-
-        initial_stock = (
-            status.warehouse_stock_start + status.store_stock_start
-        )
-        total_sales = status.store_sales + status.online_sales
-
-        adjustment_quantity = (
-            InventoryAdjustment.objects.filter(
-                variant=obj,
-                year=year,
-                month=month,
-            ).aggregate(total=Sum("delta"))["total"]
-            or 0
         )
 
-        return (
-            initial_stock
-            + status.inbound_quantity
-            - total_sales
-            + adjustment_quantity
-        )
+    def get_stock(self, obj):
+        # 이번 달 기말재고 (쓰기 시점에 유지되는 ending_stock, 행 없으면 0)
+        if not hasattr(obj, "current_stock"):
+            obj = self.annotate_stock(ProductVariant.objects.filter(pk=obj.pk)).get()
+        return obj.current_stock or 0
 
 class InventoryAdjustmentSerializer(serializers.ModelSerializer):
     variant_code = serializers.CharField(source="variant.variant_code", read_only=True)
@@ -130,6 +121,22 @@ class InventoryAdjustmentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+class ProductVariantStatusListSerializer(serializers.ListSerializer):
+    """
+    many=True 직렬화용
+    페이지(또는 Export) 전체의 재고조정 내역을 한 번에 불러와
+    각 행 Serializer에 context로 전달 → 행 수와 무관하게 쿼리 수 고정
+    """
+
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+
+        if "adjustment_summary" not in self.context:
+            self.context["adjustment_summary"] = build_adjustment_summary(rows)
+
+        return super().to_representation(rows)
+
+
 class ProductVariantStatusSerializer(serializers.ModelSerializer):
     """
     엑셀 한 행을 그대로 표현하기 위한 Serializer
@@ -155,7 +162,7 @@ class ProductVariantStatusSerializer(serializers.ModelSerializer):
     total_sales = serializers.SerializerMethodField()      # 판매물량 합
     adjustment_quantity = serializers.SerializerMethodField()
     adjustment_status = serializers.SerializerMethodField() 
-    ending_stock = serializers.SerializerMethodField()     # 기말재고
+    ending_stock = serializers.IntegerField(read_only=True)  # 기말재고 (쓰기 시점에 저장된 값)
 
     class Meta:
         model = ProductVariantStatus
@@ -189,6 +196,7 @@ class ProductVariantStatusSerializer(serializers.ModelSerializer):
             "ending_stock",
             "version"
         ]
+        list_serializer_class = ProductVariantStatusListSerializer
 
     def get_initial_stock(self, obj):
         # 기초재고 = 월초창고 + 월초매장
@@ -198,45 +206,33 @@ class ProductVariantStatusSerializer(serializers.ModelSerializer):
         # 판매물량 합 = 매장 판매 + 온라인 판매
         return obj.store_sales + obj.online_sales
 
+    def _get_adjustment_summary(self, obj):
+        """
+        (variant, year, month) 단위 재고조정 집계
+        - 목록 조회: ListSerializer가 미리 계산한 값 사용
+        - 단건 조회: 해당 행만 한 번 조회 후 재사용
+        """
+        summary = self.context.get("adjustment_summary")
+        if summary is None:
+            summary = build_adjustment_summary([obj])
+            self.context["adjustment_summary"] = summary
+
+        return summary.get(
+            (obj.variant_id, obj.year, obj.month),
+            {"total": 0, "entries": []},
+        )
+
     def get_adjustment_quantity(self, obj):
         # 재고조정 합
-        return (
-            InventoryAdjustment.objects.filter(
-                variant=obj.variant,
-                year=obj.year,
-                month=obj.month,
-            ).aggregate(total=Sum("delta"))["total"]
-            or 0
-        )
-    
+        return self._get_adjustment_summary(obj)["total"]
+
     def get_adjustment_status(self, obj):
         """
         adjustment_status = [{책임자, quantity}, ...]
         """
-        adjustments = InventoryAdjustment.objects.filter(
-            variant=obj.variant,
-            year=obj.year,
-            month=obj.month,
-        ).values("created_by", "delta")
-
-        return [
-            {
-                "created_by": adj["created_by"],
-                "quantity": adj["delta"],
-            }
-            for adj in adjustments
-        ]
+        return self._get_adjustment_summary(obj)["entries"]
 
 
-    def get_ending_stock(self, obj):
-        # 기초재고 - 판매물량 합 + 재고 조정 합
-        return (
-            self.get_initial_stock(obj)
-            + obj.inbound_quantity
-            - self.get_total_sales(obj)
-            + self.get_adjustment_quantity(obj)
-        )
-
 ####### 변형 Serializer: InventoryItem (+ ProductVariant)
 
 class InventoryItemWithVariantsSerializer(serializers.ModelSerializer):
@@ -505,3 +501,63 @@ class ProductCategorySerializer(serializers.ModelSerializer):
             "middle_category",
             "category",
         ]
+
+
+# 엑셀 업로드 백그라운드 작업 상태
+class InventoryImportJobSerializer(serializers.ModelSerializer):
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = InventoryImportJob
+        fields = [
+            "id",
+            "status",
+            "year",
+            "month",
+            "file_name",
+            "total_rows",
+            "processed_rows",
+            "progress",
+            "summary",
+            "errors",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        # 처리 비율 (0~100, 행 수 확인 전에는 0)
+        if not obj.total_rows:
+            return 100 if obj.status == InventoryImportJob.STATUS_SUCCEEDED else 0
+        return round(obj.processed_rows * 100 / obj.total_rows, 1)
+
+
+class InventoryBatchJobSerializer(serializers.ModelSerializer):
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = InventoryBatchJob
+        fields = [
+            "id",
+            "kind",
+            "status",
+            "year",
+            "month",
+            "params",
+            "total",
+            "done",
+            "progress",
+            "result",
+            "errors",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        # 처리 비율 (0~100, 전체 행 수를 모르는 작업은 완료 시 100)
+        if not obj.total:
+            return 100 if obj.status == InventoryBatchJob.STATUS_SUCCEEDED else 0
+        return round(obj.done * 100 / obj.total, 1)
@@ -0,0 +1,45 @@
+from collections import defaultdict
+
+from apps.inventory.models import InventoryAdjustment
+
+
+def build_adjustment_summary(statuses):
+    """
+    ProductVariantStatus 여러 행의 재고조정 내역을 한 번의 쿼리로 집계
+
+    - key: (variant_id, year, month)
+    - value: {"total": 조정 합계, "entries": [{created_by, quantity}, ...]}
+    - 조정 내역이 없는 행은 결과에 포함되지 않음
+    """
+
+    keys = {(s.variant_id, s.year, s.month) for s in statuses}
+    if not keys:
+        return {}
+
+    adjustments = (
+        InventoryAdjustment.objects.filter(
+            variant_id__in={k[0] for k in keys},
+            year__in={k[1] for k in keys},
+            month__in={k[2] for k in keys},
+        )
+        .order_by("-created_at")
+        .values_list("variant_id", "year", "month", "created_by", "delta")
+    )
+
+    summary = defaultdict(lambda: {"total": 0, "entries": []})
+
+    for variant_id, year, month, created_by, delta in adjustments:
+        key = (variant_id, year, month)
+        # variant/year/month 조합이 교차되며 섞여 들어온 행은 제외
+        if key not in keys:
+            continue
+
+        summary[key]["total"] += delta
+        summary[key]["entries"].append(
+            {
+                "created_by": created_by,
+                "quantity": delta,
+            }
+        )
+
+    return dict(summary)
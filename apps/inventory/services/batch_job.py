@@ -0,0 +1,82 @@
+from django.utils import timezone
+
+from apps.inventory.models import InventoryBatchJob
+from apps.inventory.services.recompute import recompute_forward
+from apps.inventory.services.rollover import RolloverLocked, rollover_month
+
+
+def _start(job_id, kind):
+    job = InventoryBatchJob.objects.get(pk=job_id, kind=kind)
+    job.status = InventoryBatchJob.STATUS_RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=["status", "started_at"])
+    return job
+
+
+def _finish(job, result):
+    InventoryBatchJob.objects.filter(pk=job.pk).update(
+        status=InventoryBatchJob.STATUS_SUCCEEDED,
+        result=result,
+        finished_at=timezone.now(),
+    )
+
+
+def _fail(job, errors):
+    InventoryBatchJob.objects.filter(pk=job.pk).update(
+        status=InventoryBatchJob.STATUS_FAILED,
+        errors=errors,
+        finished_at=timezone.now(),
+    )
+
+
+def run_rollover_job(job_id):
+    """
+    월 이월 작업 실행 (InventoryBatchJob 진행 상황 갱신)
+
+    - chunk마다 커밋되므로 done / total도 chunk마다 갱신 → 작업 조회 API에서 바로 보임
+    - 같은 월 이월이 실행 중이면 FAILED (errors에 사유)
+    - 실패 시 앞서 커밋된 chunk는 유지 (다시 실행하면 남은 variant만 이월)
+
+    반환값: rollover_month 결과
+    """
+    job = _start(job_id, InventoryBatchJob.KIND_ROLLOVER)
+
+    def progress(done, total):
+        InventoryBatchJob.objects.filter(pk=job.pk).update(done=done, total=total)
+
+    try:
+        result = rollover_month(
+            job.year, job.month, mode=job.params.get("mode", "carry"),
+            progress=progress,
+        )
+    except RolloverLocked as e:
+        _fail(job, [{"detail": str(e)}])
+        return None
+    except Exception as e:
+        _fail(job, [{"detail": str(e)}])
+        raise
+
+    _finish(job, result)
+    return result
+
+
+def run_recompute_job(job_id):
+    """
+    이후 달 재계산 작업 실행 (InventoryBatchJob 진행 상황 갱신)
+    - 한 트랜잭션으로 처리 → 완료 시 done = 바뀐 행 수
+
+    반환값: recompute_forward 결과
+    """
+    job = _start(job_id, InventoryBatchJob.KIND_RECOMPUTE)
+
+    try:
+        result = recompute_forward(
+            job.year, job.month, job.params.get("variant_ids")
+        )
+    except Exception as e:
+        _fail(job, [{"detail": str(e)}])
+        raise
+
+    InventoryBatchJob.objects.filter(pk=job.pk).update(done=result["updated"])
+    _finish(job, result)
+    return result
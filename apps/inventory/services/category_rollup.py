@@ -0,0 +1,100 @@
+from django.db import connection
+
+from apps.inventory.models import (
+    InventoryAdjustment,
+    InventoryItem,
+    ProductVariantStatus,
+)
+
+# 집계 컬럼 (응답 키 순서)
+SUM_FIELDS = (
+    "warehouse_stock_start",
+    "store_stock_start",
+    "inbound_quantity",
+    "store_sales",
+    "online_sales",
+    "adjustment_total",
+    "ending_stock",
+)
+
+# GROUPING(big, middle, category) 비트값 → 집계 수준
+# (롤업된 컬럼의 비트가 1)
+ROLLUP_LEVELS = {
+    0: "category",
+    1: "middle_category",
+    3: "big_category",
+    7: "total",
+}
+
+ROLLUP_SQL = f"""
+WITH adjustment AS (
+    SELECT variant_id, SUM(delta) AS total
+      FROM {InventoryAdjustment._meta.db_table}
+     WHERE year = %(year)s AND month = %(month)s
+     GROUP BY variant_id
+)
+SELECT GROUPING(p.big_category, p.middle_category, p.category) AS grouping_id,
+       p.big_category,
+       p.middle_category,
+       p.category,
+       COUNT(*) AS variant_count,
+       COALESCE(SUM(s.warehouse_stock_start), 0),
+       COALESCE(SUM(s.store_stock_start), 0),
+       COALESCE(SUM(s.inbound_quantity), 0),
+       COALESCE(SUM(s.store_sales), 0),
+       COALESCE(SUM(s.online_sales), 0),
+       COALESCE(SUM(a.total), 0),
+       COALESCE(SUM(s.ending_stock), 0)
+  FROM {ProductVariantStatus._meta.db_table} AS s
+  JOIN {InventoryItem._meta.db_table} AS p ON p.id = s.product_id
+  LEFT JOIN adjustment AS a ON a.variant_id = s.variant_id
+ WHERE s.year = %(year)s AND s.month = %(month)s
+ GROUP BY ROLLUP (p.big_category, p.middle_category, p.category)
+ ORDER BY GROUPING(p.big_category), p.big_category,
+          GROUPING(p.middle_category), p.middle_category,
+          GROUPING(p.category), p.category
+"""
+
+
+def build_category_rollup(year, month):
+    """
+    월별 카테고리 집계 (대분류 > 중분류 > 카테고리)
+    - GROUP BY ROLLUP 한 번으로 소계/합계까지 계산
+    - 반환값: (rows, total)
+      rows: 카테고리 행 + 중분류/대분류 소계 행 (소계는 하위 행 뒤에 위치)
+      total: 전체 합계 (해당 월 데이터가 없으면 0으로 채움)
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(ROLLUP_SQL, {"year": year, "month": month})
+        records = cursor.fetchall()
+
+    rows = []
+    total = None
+
+    for grouping_id, big, middle, category, count, *sums in records:
+        level = ROLLUP_LEVELS[grouping_id]
+        row = {
+            "level": level,
+            "big_category": big if grouping_id < 7 else None,
+            "middle_category": middle if grouping_id < 3 else None,
+            "category": category if grouping_id < 1 else None,
+            "variant_count": count,
+            **dict(zip(SUM_FIELDS, sums)),
+        }
+
+        if level == "total":
+            total = row
+        else:
+            rows.append(row)
+
+    if total is None:
+        total = {
+            "level": "total",
+            "big_category": None,
+            "middle_category": None,
+            "category": None,
+            "variant_count": 0,
+            **{field: 0 for field in SUM_FIELDS},
+        }
+
+    return rows, total
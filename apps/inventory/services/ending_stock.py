@@ -0,0 +1,54 @@
+from django.db.models import F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Now
+
+from apps.inventory.models import InventoryAdjustment, ProductVariantStatus
+
+
+def adjustment_total_expression():
+    """
+    ProductVariantStatus 행 기준 같은 (variant, year, month)의 재고조정 합
+    (annotate / update에서 사용하는 상관 서브쿼리)
+    """
+    totals = (
+        InventoryAdjustment.objects.filter(
+            variant_id=OuterRef("variant_id"),
+            year=OuterRef("year"),
+            month=OuterRef("month"),
+        )
+        .order_by()
+        .values("variant_id")
+        .annotate(total=Sum("delta"))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(totals, output_field=IntegerField()),
+        Value(0),
+    )
+
+
+def expected_ending_stock_expression():
+    # 기초재고 + 입고 - 판매 + 재고조정 합
+    return ProductVariantStatus.base_stock_expression() + adjustment_total_expression()
+
+
+def refresh_ending_stock(queryset):
+    """
+    대상 행의 ending_stock을 UPDATE 한 번으로 재계산
+    - 반환값: 갱신된 행 수
+    """
+    return queryset.order_by().update(
+        ending_stock=expected_ending_stock_expression(),
+        updated_at=Now(),
+    )
+
+
+def find_ending_stock_drift(queryset):
+    """
+    저장된 ending_stock과 재계산 값이 다른 행 조회
+    """
+    return (
+        queryset.annotate(expected_ending_stock=expected_ending_stock_expression())
+        .exclude(ending_stock=F("expected_ending_stock"))
+        .select_related("variant")
+        .order_by("year", "month", "variant__variant_code")
+    )
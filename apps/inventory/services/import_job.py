@@ -0,0 +1,114 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.inventory.models import InventoryImportJob
+from apps.inventory.services.inventory_import import (
+    IMPORT_SUMMARY_KEYS,
+    import_normalized_rows,
+    normalize_rows,
+)
+from apps.inventory.utils.cache import (
+    invalidate_catalog_cache,
+    invalidate_variant_status_cache,
+)
+from apps.inventory.utils.excel import REQUIRED_COLUMNS, stream_upload
+
+# 백그라운드 업로드: 한 트랜잭션(= 진행률 갱신 단위)으로 처리할 행 수
+IMPORT_JOB_CHUNK_SIZE = 5000
+
+
+def _fail(job, errors):
+    InventoryImportJob.objects.filter(pk=job.pk).update(
+        status=InventoryImportJob.STATUS_FAILED,
+        errors=errors,
+        finished_at=timezone.now(),
+    )
+
+
+def run_import_job(job_id, chunk_size=None):
+    """
+    보관된 업로드 파일(엑셀 / CSV / Parquet) → 재고 반영 (InventoryImportJob 진행 상황 갱신)
+
+    롤백 정책
+    1. 파일을 한 번 끝까지 읽으며 필수 컬럼 / 전체 행 정규화(숫자 변환)를 먼저 검사
+       → 실패 시 아무것도 쓰지 않고 FAILED
+    2. 파일을 다시 읽으며 chunk_size 행씩 각자 트랜잭션으로 커밋
+       (진행률도 같은 트랜잭션에서 갱신 / 두 번 모두 stream_upload → 메모리 일정)
+       → chunk 실패 시 해당 chunk만 롤백, 앞서 커밋된 chunk는 유지하고 FAILED
+         (processed_rows = 반영된 행 수, 같은 파일 재업로드 시 upsert로 이어서 반영)
+    3. 성공 시 보관 파일 삭제 (실패한 작업 파일은 확인용으로 유지)
+
+    반환값: 작업 summary
+    """
+    chunk_size = chunk_size or IMPORT_JOB_CHUNK_SIZE
+    job = InventoryImportJob.objects.get(pk=job_id)
+    job.status = InventoryImportJob.STATUS_RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=["status", "started_at"])
+
+    # 1차: 전체 행 검사 (필수 컬럼 / 숫자 변환) → 실패 시 아무것도 쓰지 않음
+    try:
+        total_rows = 0
+        with job.file.open("rb") as file:
+            columns, batches = stream_upload(
+                file, job.file_name, batch_size=chunk_size
+            )
+
+            missing_cols = [c for c in REQUIRED_COLUMNS if c not in columns]
+            if missing_cols:
+                raise ValueError(f"필수 컬럼 누락: {missing_cols}")
+
+            for df in batches:
+                total_rows += len(normalize_rows(df))
+    except Exception as e:
+        _fail(job, [{"rows": None, "detail": str(e)}])
+        raise
+
+    summary = {"year": job.year, "month": job.month}
+    summary.update(dict.fromkeys(IMPORT_SUMMARY_KEYS, 0))
+
+    InventoryImportJob.objects.filter(pk=job.pk).update(
+        total_rows=total_rows, summary=summary
+    )
+
+    # 2차: batch마다 커밋
+    with job.file.open("rb") as file:
+        _, batches = stream_upload(file, job.file_name, batch_size=chunk_size)
+
+        for df in batches:
+            try:
+                with transaction.atomic():
+                    result = import_normalized_rows(
+                        normalize_rows(df), job.year, job.month
+                    )
+
+                    for key in IMPORT_SUMMARY_KEYS:
+                        summary[key] += result[key]
+
+                    InventoryImportJob.objects.filter(pk=job.pk).update(
+                        processed_rows=F("processed_rows") + len(df),
+                        summary=summary,
+                    )
+            except Exception as e:
+                # 원본 파일 행 번호 기준 (stream_upload batch index)
+                _fail(job, [{
+                    "rows": [int(df.index[0]), int(df.index[-1])],
+                    "detail": str(e),
+                }])
+                raise
+
+            # 변경 없는 chunk는 캐시 유지
+            if result["created_status"] or result["updated_status"]:
+                invalidate_variant_status_cache(job.year, job.month)
+            if result["created_variants"] or result["created_products"]:
+                invalidate_catalog_cache()
+
+    job.file.delete(save=False)
+    InventoryImportJob.objects.filter(pk=job.pk).update(
+        status=InventoryImportJob.STATUS_SUCCEEDED,
+        file="",
+        finished_at=timezone.now(),
+    )
+
+    return summary
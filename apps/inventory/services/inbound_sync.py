@@ -0,0 +1,231 @@
+from datetime import date
+
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Sum, Value, When
+from django.utils import timezone
+
+from apps.inventory.models import (
+    InventoryAdjustment,
+    ProductVariant,
+    ProductVariantStatus,
+)
+from apps.inventory.utils.cache import invalidate_variant_status_cache
+from apps.orders.models import Order, OrderItem
+
+STATUS_TABLE = ProductVariantStatus._meta.db_table
+ADJUSTMENT_TABLE = InventoryAdjustment._meta.db_table
+VARIANT_TABLE = ProductVariant._meta.db_table
+ORDER_TABLE = Order._meta.db_table
+ORDER_ITEM_TABLE = OrderItem._meta.db_table
+
+# 완료 발주 → 월별 발주 입고분 대사 (평소에는 complete_order가 증분 반영)
+# - 기준: COMPLETED 주문의 completed_at (설정 시간대 기준 날짜)
+# - 대사 대상은 order_inbound_quantity(발주 입고분)만
+#   → inbound_quantity의 수기 / 엑셀 입력분(= inbound_quantity - order_inbound_quantity)은 유지
+# - inbound: variant별 완료 발주 수량 합 (집계 한 번)
+# - expected: 완료 발주가 있는 variant + 발주 입고분이 남아 있지만 완료 발주가 없는 행(→ 0)
+# - current: 문장 실행 전 발주 입고분 (불일치 보고용)
+# - inserted: 해당 월 행이 없는 variant → 새 행 (기말재고 = 입고 + 해당 월 재고조정 합)
+# - updated: 발주 입고분이 다른 행만 UPDATE
+#   (입고량 / 기말재고는 발주 입고분 차이만큼 증분, version 증가)
+INBOUND_SYNC_SQL = f"""
+WITH inbound AS (
+    SELECT i.variant_id, SUM(i.quantity) AS quantity
+      FROM {ORDER_ITEM_TABLE} AS i
+      JOIN {ORDER_TABLE} AS o ON o.id = i.order_id
+     WHERE o.status = %(completed)s
+       AND (o.completed_at AT TIME ZONE %(tz)s)::date >= %(start)s
+       AND (o.completed_at AT TIME ZONE %(tz)s)::date < %(end)s
+     GROUP BY i.variant_id
+),
+expected AS (
+    SELECT variant_id, quantity FROM inbound
+    UNION ALL
+    SELECT s.variant_id, 0
+      FROM {STATUS_TABLE} AS s
+     WHERE s.year = %(year)s AND s.month = %(month)s
+       AND s.order_inbound_quantity <> 0
+       AND NOT EXISTS (
+           SELECT 1 FROM inbound WHERE inbound.variant_id = s.variant_id
+       )
+),
+current AS (
+    SELECT s.variant_id, s.order_inbound_quantity
+      FROM {STATUS_TABLE} AS s
+      JOIN expected ON expected.variant_id = s.variant_id
+     WHERE s.year = %(year)s AND s.month = %(month)s
+),
+adjustment AS (
+    SELECT a.variant_id, SUM(a.delta) AS total
+      FROM {ADJUSTMENT_TABLE} AS a
+      JOIN inbound ON inbound.variant_id = a.variant_id
+     WHERE a.year = %(year)s AND a.month = %(month)s
+     GROUP BY a.variant_id
+),
+inserted AS (
+    INSERT INTO {STATUS_TABLE} (
+        year, month, product_id, variant_id,
+        warehouse_stock_start, store_stock_start, inbound_quantity,
+        order_inbound_quantity, store_sales, online_sales, ending_stock,
+        version, created_at, updated_at
+    )
+    SELECT %(year)s, %(month)s, v.product_id, inbound.variant_id,
+           0, 0, inbound.quantity,
+           inbound.quantity, 0, 0, inbound.quantity + COALESCE(a.total, 0),
+           0, NOW(), NOW()
+      FROM inbound
+      JOIN {VARIANT_TABLE} AS v ON v.id = inbound.variant_id
+      LEFT JOIN adjustment AS a ON a.variant_id = inbound.variant_id
+    ON CONFLICT (year, month, variant_id) DO NOTHING
+    RETURNING variant_id, order_inbound_quantity
+),
+updated AS (
+    UPDATE {STATUS_TABLE} AS s
+       SET inbound_quantity = s.inbound_quantity - s.order_inbound_quantity + expected.quantity,
+           order_inbound_quantity = expected.quantity,
+           ending_stock = s.ending_stock - s.order_inbound_quantity + expected.quantity,
+           version = s.version + 1,
+           updated_at = NOW()
+      FROM expected
+     WHERE s.year = %(year)s AND s.month = %(month)s
+       AND s.variant_id = expected.variant_id
+       AND s.order_inbound_quantity <> expected.quantity
+    RETURNING s.variant_id, s.order_inbound_quantity
+)
+SELECT (SELECT COUNT(*) FROM expected),
+       COALESCE(
+           (SELECT json_agg(
+                       json_build_object(
+                           'variant_code', v.variant_code,
+                           'before', current.order_inbound_quantity,
+                           'after', fixed.order_inbound_quantity
+                       )
+                       ORDER BY v.variant_code
+                   )
+              FROM (SELECT * FROM inserted UNION ALL SELECT * FROM updated) AS fixed
+              JOIN {VARIANT_TABLE} AS v ON v.id = fixed.variant_id
+              LEFT JOIN current ON current.variant_id = fixed.variant_id),
+           '[]'::json
+       )
+"""
+
+def month_range(year, month):
+    # [해당 월 1일, 다음 달 1일)
+    start = date(year, month, 1)
+    if month == 12:
+        return start, date(year + 1, 1, 1)
+    return start, date(year, month + 1, 1)
+
+
+def sync_inbound_from_orders(year, month):
+    """
+    {year}/{month} 완료 발주 수량 ↔ ProductVariantStatus.order_inbound_quantity 대사
+
+    - 평소 발주 입고분은 complete_order / delete_order에서 증분 반영 → 이 함수는 어긋난 행만 바로잡음
+    - 입고량(inbound_quantity) 중 수기 / 엑셀 입력분은 건드리지 않고 발주 입고분 차이만 반영
+    - 완료 발주가 없어졌는데 발주 입고분이 남은 행은 0으로 되돌림
+    - 월 구분은 DB에서 설정 시간대(TIME_ZONE) 기준 completed_at 날짜로 계산
+    - 집계 / 신규 행 INSERT / 입고량 UPDATE를 SQL 한 번으로 처리
+    - 바로잡은 행이 있을 때만 캐시 무효화
+
+    반환값: {"checked": 대사한 variant 수, "updated": 바로잡은 행 수,
+             "discrepancies": [{"variant_code", "before", "after"}]}
+      before / after = 기존 / 바로잡은 발주 입고분 (행이 없었으면 before None)
+    """
+    start, end = month_range(year, month)
+    params = {
+        "year": year,
+        "month": month,
+        "start": start,
+        "end": end,
+        "completed": Order.STATUS_COMPLETED,
+        "tz": timezone.get_current_timezone_name(),
+    }
+
+    # 문장 하나 → 따로 트랜잭션을 열지 않아도 원자적
+    with connection.cursor() as cursor:
+        cursor.execute(INBOUND_SYNC_SQL, params)
+        checked, discrepancies = cursor.fetchone()
+
+    if discrepancies:
+        invalidate_variant_status_cache(year, month)
+
+    return {
+        "checked": checked,
+        "updated": len(discrepancies),
+        "discrepancies": discrepancies,
+    }
+
+
+def apply_inbound_deltas(year, month, deltas):
+    """
+    {variant_id: 증감 수량} → 해당 월 inbound_quantity / order_inbound_quantity /
+    ending_stock에 F() 증분
+    (호출 측 트랜잭션 안에서 실행)
+
+    - 행이 없는 variant는 입고 0 행을 먼저 만들고 (증가분만, 동시 생성은 무시)
+      UPDATE 한 번으로 모든 행에 증분 → 동시에 완료된 주문끼리도 값이 섞이지 않음
+    - 감소분(완료 취소)은 이미 있는 행에만 반영
+    - 반환값: 갱신된 행 수
+    """
+    deltas = {variant_id: delta for variant_id, delta in deltas.items() if delta}
+    if not deltas:
+        return 0
+
+    existing = set(
+        ProductVariantStatus.objects.filter(
+            year=year, month=month, variant_id__in=list(deltas)
+        ).values_list("variant_id", flat=True)
+    )
+    missing = [
+        variant_id
+        for variant_id, delta in deltas.items()
+        if delta > 0 and variant_id not in existing
+    ]
+
+    if missing:
+        adjustment_totals = dict(
+            InventoryAdjustment.objects.filter(
+                year=year, month=month, variant_id__in=missing
+            )
+            .values("variant_id")
+            .annotate(total=Sum("delta"))
+            .values_list("variant_id", "total")
+        )
+        ProductVariantStatus.objects.bulk_create(
+            [
+                ProductVariantStatus(
+                    year=year,
+                    month=month,
+                    product_id=product_id,
+                    variant_id=variant_id,
+                    ending_stock=adjustment_totals.get(variant_id, 0),
+                )
+                for variant_id, product_id in ProductVariant.objects.filter(
+                    pk__in=missing
+                ).values_list("pk", "product_id")
+            ],
+            ignore_conflicts=True,
+        )
+
+    delta = Case(
+        *[
+            When(variant_id=variant_id, then=Value(value))
+            for variant_id, value in deltas.items()
+        ],
+        output_field=IntegerField(),
+    )
+    updated = ProductVariantStatus.objects.filter(
+        year=year, month=month, variant_id__in=list(deltas)
+    ).update(
+        inbound_quantity=F("inbound_quantity") + delta,
+        order_inbound_quantity=F("order_inbound_quantity") + delta,
+        ending_stock=F("ending_stock") + delta,
+        version=F("version") + 1,
+        updated_at=timezone.now(),
+    )
+
+    if updated:
+        invalidate_variant_status_cache(year, month)
+
+    return updated
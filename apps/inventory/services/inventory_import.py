@@ -0,0 +1,310 @@
+import pandas as pd
+from django.db.models import Sum
+
+from apps.inventory.models import (
+    InventoryAdjustment,
+    InventoryItem,
+    ProductVariant,
+    ProductVariantStatus,
+)
+from apps.inventory.services.variant_resolver import VariantResolverIndex
+from apps.inventory.utils.excel import int_column, str_column
+from apps.inventory.utils.variant_code import (
+    generate_internal_variant_code,
+    normalize,
+)
+
+# bulk_create / upsert 한 번에 보낼 행 수
+IMPORT_BATCH_SIZE = 2000
+
+# (엑셀 컬럼명, ProductVariantStatus 필드)
+STOCK_COLUMNS = [
+    ("월초창고 재고", "warehouse_stock_start"),
+    ("월초매장 재고", "store_stock_start"),
+    ("당월입고물량", "inbound_quantity"),
+    ("매장 판매물량", "store_sales"),
+    ("쇼핑몰 판매물량", "online_sales"),
+]
+
+# import 결과 summary 키 (batch별 결과는 더해서 합산)
+IMPORT_SUMMARY_KEYS = (
+    "total_rows",
+    "created_products",
+    "created_variants",
+    "skipped_variants",
+    "created_status",
+    "updated_status",
+    "unchanged_status",
+)
+
+# 신규 상품 생성 시 기본값 (엑셀 컬럼명, InventoryItem 필드)
+PRODUCT_COLUMNS = [
+    ("카테고리", "category"),
+    ("대분류", "big_category"),
+    ("중분류", "middle_category"),
+    ("설명", "description"),
+]
+
+
+def _slug(values):
+    # variant_code.slug 컬럼 버전
+    slugged = values.str.strip().str.replace(r"\s+", "", regex=True).str.upper()
+    return slugged.where(slugged != "", "DEFAULT")
+
+
+def normalize_rows(df):
+    """
+    업로드 DataFrame → 정규화된 컬럼 DataFrame (행 순서 유지)
+    - 행별 처리(safe_str / build_variant_code)와 같은 규칙을 컬럼 단위로 적용
+    - 수량 변환 실패 시 ValueError("[상품명] 컬럼 숫자 변환 실패: 값")
+    """
+    raw_code = str_column(df, "상품코드")
+    product_name = str_column(df, "오프라인 품목명")
+    product_name = product_name.where(product_name != "", "상품명 없음")
+    option = str_column(df, "옵션")
+    detail_option = str_column(df, "상세옵션")
+
+    # 상품코드 "P001-A" → 상품 P001 / "-" 없으면 코드 전체
+    product_id = raw_code.str.split("-", n=1).str[0].fillna("")
+
+    # 정식 SKU: {product_id}-{옵션}[-{상세옵션}]
+    detail_suffix = ("-" + _slug(detail_option)).where(detail_option != "", "")
+    variant_code = product_id + "-" + _slug(option) + detail_suffix
+
+    # product_id 없는 행: 내부 AUTO SKU (상품명 기준 해시)
+    auto = product_id == ""
+    if auto.any():
+        auto_codes = pd.Series(
+            [
+                generate_internal_variant_code(
+                    normalize(name)[:3] or "PRD", opt, name
+                )
+                for name, opt in zip(product_name[auto], option[auto])
+            ],
+            index=auto[auto].index,
+        )
+        variant_code = variant_code.where(~auto, auto_codes)
+        product_id = product_id.where(
+            ~auto, variant_code.str.split("-", n=1).str[0]
+        )
+
+    rows = pd.DataFrame(
+        {
+            "product_id": product_id,
+            "variant_code": variant_code,
+            "product_name": product_name,
+            "online_name": str_column(df, "온라인 품목명"),
+            "option": option,
+            "detail_option": detail_option,
+        },
+        index=df.index,
+    )
+
+    for col, field in PRODUCT_COLUMNS:
+        rows[field] = str_column(df, col)
+
+    for col, field in STOCK_COLUMNS:
+        values, invalid = int_column(df, col)
+        if invalid.any():
+            first = invalid.idxmax()
+            raise ValueError(
+                f"[{product_name[first]}] {col} 숫자 변환 실패: {df[col][first]}"
+            )
+        rows[field] = values
+
+    return rows.reset_index(drop=True)
+
+
+def _get_or_create_products(rows):
+    """
+    product_id별 상품 조회, 없으면 파일에서 처음 나온 행 기준으로 생성
+    - 반환값: ({product_id: InventoryItem}, 생성 수)
+    """
+    product_ids = rows["product_id"].unique().tolist()
+    products = InventoryItem.objects.in_bulk(product_ids, field_name="product_id")
+
+    first_rows = rows.drop_duplicates("product_id", keep="first")
+    new_products = [
+        InventoryItem(
+            product_id=row.product_id,
+            name=row.product_name,
+            online_name=row.online_name,
+            category=row.category,
+            big_category=row.big_category,
+            middle_category=row.middle_category,
+            description=row.description,
+        )
+        for row in first_rows.itertuples(index=False)
+        if row.product_id not in products
+    ]
+
+    InventoryItem.objects.bulk_create(new_products, batch_size=IMPORT_BATCH_SIZE)
+    products.update({product.product_id: product for product in new_products})
+
+    return products, len(new_products)
+
+
+def _resolve_variants(rows, products):
+    """
+    행별 variant 결정 (VariantResolverIndex, 없으면 새로 생성)
+    - 새 variant는 인덱스에 등록 → 같은 파일의 뒤쪽 행은 새 variant로 매칭
+    - 반환값: (행별 ProductVariant 목록, 신규 variant 목록)
+    """
+    index = VariantResolverIndex.build(
+        variant_codes=rows["variant_code"].unique().tolist(),
+        product_ids=[product.pk for product in products.values()],
+    )
+
+    resolved, new_variants = [], []
+
+    for product_id, code, opt, detail, online_name in zip(
+        rows["product_id"],
+        rows["variant_code"],
+        rows["option"],
+        rows["detail_option"],
+        rows["online_name"],
+    ):
+        product = products[product_id]
+        variant = index.resolve(product, opt, detail, code)
+
+        if variant is None:
+            variant = ProductVariant(
+                product=product,
+                option=opt,
+                detail_option=detail,
+                variant_code=code,
+                price=0,
+                min_stock=0,
+                channels=["online", "offline"] if online_name else ["offline"],
+                is_active=True,
+            )
+            new_variants.append(variant)
+            index.add(variant)
+
+        resolved.append(variant)
+
+    return resolved, new_variants
+
+
+def import_inventory_rows(df, year, month):
+    """
+    업로드 DataFrame 한 묶음 반영 (호출 측에서 transaction 관리, 필수)
+
+    - 상품 / variant: 미리 읽어 dict 매칭, 신규는 bulk_create
+    - 월별 재고: 현재 값과 비교해 새 행 / 바뀐 행만 (year, month, variant) 기준 upsert
+      (바뀐 행은 version 증가, 같은 variant가 여러 번 나오면 마지막 행 기준)
+      기존 행은 select_for_update로 잠근 뒤 비교 → 동시 쓰기와 version / 기말재고가 섞이지 않음
+      → 변경 없는 파일 재업로드는 조회만 발생
+    - ending_stock: 기초재고 + 입고 - 판매 + 해당 월 재고조정 합
+
+    반환값: {"total_rows", "created_products", "created_variants",
+             "skipped_variants", "created_status", "updated_status",
+             "unchanged_status"}
+    """
+    return import_normalized_rows(normalize_rows(df), year, month)
+
+
+def import_inventory_batches(batches, year, month):
+    """
+    stream_excel batch 여러 개 차례로 반영 (호출 측에서 transaction 관리)
+    - 뒤 batch의 같은 variant 행은 upsert로 덮어씀 → 한 번에 읽은 것과 같은 결과
+    """
+    summary = dict.fromkeys(IMPORT_SUMMARY_KEYS, 0)
+    for df in batches:
+        result = import_inventory_rows(df, year, month)
+        for key in IMPORT_SUMMARY_KEYS:
+            summary[key] += result[key]
+    return summary
+
+
+def import_normalized_rows(rows, year, month):
+    """normalize_rows 결과 반영 (import_inventory_rows 참고)"""
+    summary = dict.fromkeys(IMPORT_SUMMARY_KEYS, 0)
+    summary["total_rows"] = len(rows)
+    if rows.empty:
+        return summary
+
+    products, summary["created_products"] = _get_or_create_products(rows)
+
+    resolved, new_variants = _resolve_variants(rows, products)
+    ProductVariant.objects.bulk_create(new_variants, batch_size=IMPORT_BATCH_SIZE)
+
+    summary["created_variants"] = len(new_variants)
+    summary["skipped_variants"] = len(rows) - len(new_variants)
+
+    # variant별 마지막 행
+    rows["variant_pk"] = [variant.pk for variant in resolved]
+    latest = rows.drop_duplicates("variant_pk", keep="last")
+    variant_pks = latest["variant_pk"].tolist()
+
+    stock_fields = [field for _, field in STOCK_COLUMNS]
+
+    # 현재 값: variant_id → (product_id, 재고 필드..., ending_stock, version)
+    # - 비교 / upsert가 끝날 때(호출 측 트랜잭션 커밋)까지 행 잠금
+    #   → 그 사이 PATCH / 벌크 저장 / 재고조정·입고 F() 증분은 커밋 후 새 값 위에 반영
+    #     (version / ending_stock을 읽은 값 기준으로 써도 덮어쓰지 않음)
+    # - variant_id 순으로 잠가 동시 업로드끼리 교착 방지
+    current = {
+        values[0]: values[1:]
+        for values in ProductVariantStatus.objects.select_for_update()
+        .filter(year=year, month=month, variant_id__in=variant_pks)
+        .order_by("variant_id")
+        .values_list(
+            "variant_id", "product_id", *stock_fields, "ending_stock", "version"
+        )
+    }
+    adjustment_totals = dict(
+        InventoryAdjustment.objects.filter(
+            year=year, month=month, variant_id__in=variant_pks
+        )
+        .values("variant_id")
+        .annotate(total=Sum("delta"))
+        .values_list("variant_id", "total")
+    )
+
+    # 값이 바뀐 행 / 새 행만 upsert (변경 없는 행은 쓰지 않음)
+    statuses = []
+
+    for row in latest.itertuples(index=False):
+        stock = {field: int(getattr(row, field)) for field in stock_fields}
+        status_obj = ProductVariantStatus(
+            year=year,
+            month=month,
+            product=products[row.product_id],
+            variant_id=row.variant_pk,
+            **stock,
+        )
+        status_obj.ending_stock = (
+            status_obj.calculate_base_stock()
+            + adjustment_totals.get(row.variant_pk, 0)
+        )
+
+        existing = current.get(row.variant_pk)
+        if existing is None:
+            summary["created_status"] += 1
+        else:
+            incoming = (
+                status_obj.product_id,
+                *stock.values(),
+                status_obj.ending_stock,
+            )
+            if incoming == existing[:-1]:
+                summary["unchanged_status"] += 1
+                continue
+
+            status_obj.version = existing[-1] + 1
+            summary["updated_status"] += 1
+
+        statuses.append(status_obj)
+
+    ProductVariantStatus.objects.bulk_create(
+        statuses,
+        batch_size=IMPORT_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["year", "month", "variant"],
+        update_fields=[
+            "product", *stock_fields, "ending_stock", "version", "updated_at"
+        ],
+    )
+
+    return summary
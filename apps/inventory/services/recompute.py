@@ -0,0 +1,120 @@
+from collections import Counter
+
+from django.db import connection, transaction
+
+from apps.inventory.models import InventoryAdjustment, ProductVariantStatus
+from apps.inventory.utils.cache import invalidate_variant_status_cache
+
+STATUS_TABLE = ProductVariantStatus._meta.db_table
+ADJUSTMENT_TABLE = InventoryAdjustment._meta.db_table
+
+# 시작 월 이후 기초재고를 variant별 누적합으로 한 번에 재계산
+# - idx: 월 번호 (year * 12 + month - 1)
+# - anchor: 시작 월 행 또는 바로 전 달 행이 없는 행 (기초재고 그대로 유지)
+# - anchor가 아닌 행: 기초재고 합(창고 + 매장) = anchor 기초재고 + 이전 행들의 증감 합
+#   (매장 기초재고는 유지하고 창고 기초재고로 맞춤)
+# - 증감(flow) = 입고 - 판매 + 재고조정 합
+# - 값이 실제로 바뀌는 행만 UPDATE
+FORWARD_RECOMPUTE_SQL = f"""
+WITH adjustment AS (
+    SELECT variant_id, year * 12 + month - 1 AS idx, SUM(delta) AS total
+      FROM {ADJUSTMENT_TABLE}
+     WHERE year * 12 + month - 1 >= %(start)s
+       {{variant_filter}}
+     GROUP BY variant_id, year, month
+),
+base AS (
+    SELECT s.id,
+           s.variant_id,
+           s.year * 12 + s.month - 1 AS idx,
+           s.warehouse_stock_start,
+           s.store_stock_start,
+           s.inbound_quantity - s.store_sales - s.online_sales
+             + COALESCE(a.total, 0) AS flow
+      FROM {STATUS_TABLE} AS s
+      LEFT JOIN adjustment AS a
+        ON a.variant_id = s.variant_id AND a.idx = s.year * 12 + s.month - 1
+     WHERE s.year * 12 + s.month - 1 >= %(start)s
+       {{status_filter}}
+),
+marked AS (
+    SELECT base.*,
+           CASE WHEN idx = %(start)s
+                  OR LAG(idx) OVER (PARTITION BY variant_id ORDER BY idx)
+                     IS DISTINCT FROM idx - 1
+                THEN 1 ELSE 0
+           END AS is_anchor
+      FROM base
+),
+chained AS (
+    SELECT marked.*,
+           SUM(is_anchor) OVER (PARTITION BY variant_id ORDER BY idx) AS chain
+      FROM marked
+),
+computed AS (
+    SELECT id,
+           store_stock_start,
+           flow,
+           CASE WHEN is_anchor = 1 THEN warehouse_stock_start
+                ELSE FIRST_VALUE(warehouse_stock_start + store_stock_start) OVER chain_window
+                     + COALESCE(SUM(flow) OVER (
+                           chain_window
+                           ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                       ), 0)
+                     - store_stock_start
+           END AS new_warehouse
+      FROM chained
+    WINDOW chain_window AS (PARTITION BY variant_id, chain ORDER BY idx)
+)
+UPDATE {STATUS_TABLE} AS s
+   SET warehouse_stock_start = c.new_warehouse,
+       ending_stock = c.new_warehouse + c.store_stock_start + c.flow,
+       version = s.version + 1,
+       updated_at = NOW()
+  FROM computed AS c
+ WHERE s.id = c.id
+   AND (s.warehouse_stock_start, s.ending_stock)
+       IS DISTINCT FROM (c.new_warehouse, c.new_warehouse + c.store_stock_start + c.flow)
+RETURNING s.year, s.month
+"""
+
+
+def recompute_forward(year, month, variant_ids=None):
+    """
+    {year}/{month} 이후 모든 달의 이월 기초재고 / 기말재고 재계산
+
+    - 시작 월의 기초재고는 그대로 두고, 이후 달은 바로 전 달 기말재고로 맞춤
+    - 중간에 빠진 달이 있으면 그 다음 행부터 새로 시작 (기초재고 유지)
+    - variant_ids 지정 시 해당 variant만
+    - 값이 바뀐 행만 UPDATE (version 증가)
+
+    반환값: {"updated": 행 수, "months": [{"year", "month", "updated"}]}
+    """
+    params = {"start": year * 12 + month - 1}
+    variant_filter = status_filter = ""
+
+    if variant_ids is not None:
+        params["variant_ids"] = list(variant_ids)
+        variant_filter = "AND variant_id = ANY(%(variant_ids)s)"
+        status_filter = "AND s.variant_id = ANY(%(variant_ids)s)"
+
+    sql = FORWARD_RECOMPUTE_SQL.format(
+        variant_filter=variant_filter,
+        status_filter=status_filter,
+    )
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            changed = Counter(cursor.fetchall())
+
+        for changed_year, changed_month in changed:
+            invalidate_variant_status_cache(changed_year, changed_month)
+
+    return {
+        "updated": sum(changed.values()),
+        "months": [
+            {"year": y, "month": m, "updated": count}
+            for (y, m), count in sorted(changed.items())
+        ],
+    }
@@ -0,0 +1,199 @@
+from django.db import connection, transaction
+
+from apps.inventory.models import InventoryAdjustment, ProductVariantStatus
+from apps.inventory.utils.cache import invalidate_variant_status_cache
+
+# 이월 방식
+# - carry: 저번 달 기말재고 → 이번 달 창고 기초재고
+# - structure: 상품 목록만 복사 (재고 필드 0)
+ROLLOVER_MODES = ("carry", "structure")
+
+# 한 번의 INSERT ... SELECT로 처리할 variant 수
+ROLLOVER_CHUNK_SIZE = 5000
+
+# pg advisory lock 키 (네임스페이스, year * 100 + month)
+ROLLOVER_LOCK_NAMESPACE = 7301
+
+STATUS_TABLE = ProductVariantStatus._meta.db_table
+ADJUSTMENT_TABLE = InventoryAdjustment._meta.db_table
+
+# 저번 달 variant_id 기준 chunk 하나 이월
+# - 저번 달 기말재고: 기초재고 + 입고 - 판매 + 저번 달 재고조정 합
+# - 이번 달 기말재고: 기초재고 + 이번 달에 이미 등록된 재고조정 합
+# - 이미 있는 (year, month, variant)는 ON CONFLICT로 건너뜀
+ROLLOVER_CHUNK_SQL = f"""
+WITH source AS (
+    SELECT s.product_id,
+           s.variant_id,
+           s.warehouse_stock_start
+             + s.store_stock_start
+             + s.inbound_quantity
+             - s.store_sales
+             - s.online_sales AS base_stock
+      FROM {STATUS_TABLE} AS s
+     WHERE s.year = %(prev_year)s AND s.month = %(prev_month)s
+       AND s.variant_id > %(after)s
+     ORDER BY s.variant_id
+     LIMIT %(limit)s
+),
+prev_adjustment AS (
+    SELECT a.variant_id, SUM(a.delta) AS total
+      FROM {ADJUSTMENT_TABLE} AS a
+      JOIN source ON source.variant_id = a.variant_id
+     WHERE a.year = %(prev_year)s AND a.month = %(prev_month)s
+     GROUP BY a.variant_id
+),
+target_adjustment AS (
+    SELECT a.variant_id, SUM(a.delta) AS total
+      FROM {ADJUSTMENT_TABLE} AS a
+      JOIN source ON source.variant_id = a.variant_id
+     WHERE a.year = %(year)s AND a.month = %(month)s
+     GROUP BY a.variant_id
+),
+carried AS (
+    SELECT source.product_id,
+           source.variant_id,
+           CASE WHEN %(carry)s
+                THEN source.base_stock + COALESCE(pa.total, 0)
+                ELSE 0
+           END AS start_stock,
+           COALESCE(ta.total, 0) AS target_adjustment
+      FROM source
+      LEFT JOIN prev_adjustment AS pa ON pa.variant_id = source.variant_id
+      LEFT JOIN target_adjustment AS ta ON ta.variant_id = source.variant_id
+),
+inserted AS (
+    INSERT INTO {STATUS_TABLE} (
+        year, month, product_id, variant_id,
+        warehouse_stock_start, store_stock_start, inbound_quantity,
+        order_inbound_quantity, store_sales, online_sales, ending_stock,
+        version, created_at, updated_at
+    )
+    SELECT %(year)s, %(month)s, product_id, variant_id,
+           start_stock, 0, 0,
+           0, 0, 0, start_stock + target_adjustment,
+           0, NOW(), NOW()
+      FROM carried
+    ON CONFLICT (year, month, variant_id) DO NOTHING
+    RETURNING 1
+)
+SELECT (SELECT COUNT(*) FROM source),
+       (SELECT COUNT(*) FROM inserted),
+       (SELECT MAX(variant_id) FROM source)
+"""
+
+
+class RolloverLocked(Exception):
+    """같은 월 이월이 이미 실행 중"""
+
+
+def previous_month(year, month):
+    if month == 1:
+        return year - 1, 12
+    return year, month - 1
+
+
+def next_month(year, month):
+    if month == 12:
+        return year + 1, 1
+    return year, month + 1
+
+
+def _try_lock(cursor, year, month):
+    cursor.execute(
+        "SELECT pg_try_advisory_lock(%s, %s)",
+        [ROLLOVER_LOCK_NAMESPACE, year * 100 + month],
+    )
+    return cursor.fetchone()[0]
+
+
+def _unlock(cursor, year, month):
+    cursor.execute(
+        "SELECT pg_advisory_unlock(%s, %s)",
+        [ROLLOVER_LOCK_NAMESPACE, year * 100 + month],
+    )
+
+
+def is_rollover_locked(year, month):
+    """
+    같은 대상 월 이월이 실행 중인지 확인 (잠금을 잡았다가 바로 해제)
+    - 백그라운드 작업 등록 전 409 판단용
+    """
+    with connection.cursor() as cursor:
+        if not _try_lock(cursor, year, month):
+            return True
+        _unlock(cursor, year, month)
+    return False
+
+
+def rollover_month(
+    year, month, mode="carry", chunk_size=ROLLOVER_CHUNK_SIZE, progress=None
+):
+    """
+    저번 달 ProductVariantStatus → {year}/{month} 스냅샷 생성
+
+    - mode: "carry"(기말재고 이월) / "structure"(재고 0)
+    - 저번 달 행을 variant_id 순으로 chunk_size개씩 INSERT ... SELECT
+      (chunk마다 커밋 → 잠금 시간 제한)
+    - progress(done, total): chunk 처리 후 호출
+    - 같은 대상 월 동시 실행 시 RolloverLocked
+
+    반환값: {"year", "month", "mode", "source", "created", "skipped"}
+      skipped = 이번 달에 이미 있던 variant 수
+    """
+    if mode not in ROLLOVER_MODES:
+        raise ValueError(f"mode는 {', '.join(ROLLOVER_MODES)} 중 하나여야 합니다.")
+
+    prev_year, prev_month = previous_month(year, month)
+    params = {
+        "year": year,
+        "month": month,
+        "prev_year": prev_year,
+        "prev_month": prev_month,
+        "carry": mode == "carry",
+        "limit": chunk_size,
+    }
+
+    with connection.cursor() as cursor:
+        if not _try_lock(cursor, year, month):
+            raise RolloverLocked(f"{year}-{month} 이월이 이미 실행 중입니다.")
+
+        try:
+            total = ProductVariantStatus.objects.filter(
+                year=prev_year, month=prev_month
+            ).count()
+
+            done = created = 0
+            after = 0
+
+            while True:
+                with transaction.atomic():
+                    cursor.execute(ROLLOVER_CHUNK_SQL, {**params, "after": after})
+                    source_count, created_count, last_variant_id = cursor.fetchone()
+
+                    if created_count:
+                        invalidate_variant_status_cache(year, month)
+
+                if not source_count:
+                    break
+
+                done += source_count
+                created += created_count
+                after = last_variant_id
+
+                if progress:
+                    progress(done, total)
+
+                if source_count < chunk_size:
+                    break
+        finally:
+            _unlock(cursor, year, month)
+
+    return {
+        "year": year,
+        "month": month,
+        "mode": mode,
+        "source": done,
+        "created": created,
+        "skipped": done - created,
+    }
@@ -0,0 +1,179 @@
+from django.db import connection, transaction
+
+from apps.inventory.models import ProductVariant, ProductVariantStatus
+from apps.inventory.utils.cache import invalidate_variant_status_cache
+
+# UPDATE 한 번에 보낼 행 수
+BULK_SAVE_BATCH_SIZE = 1000
+
+STATUS_TABLE = ProductVariantStatus._meta.db_table
+STOCK_FIELDS = ProductVariantStatus.STOCK_FIELDS
+
+# 충돌 행에 돌려주는 서버 값
+SERVER_VALUE_FIELDS = (*STOCK_FIELDS, "ending_stock")
+
+# version 일치 행만 UPDATE (compare-and-swap)
+# - v.{필드}가 NULL이면 기존 값 유지
+# - ending_stock: 재고 필드 변경분만큼 증분 (재고조정 합은 그대로)
+# - SET 식의 s.* 는 모두 UPDATE 전 값
+BULK_SAVE_SQL = f"""
+UPDATE {STATUS_TABLE} AS s
+   SET warehouse_stock_start = COALESCE(v.warehouse_stock_start, s.warehouse_stock_start),
+       store_stock_start = COALESCE(v.store_stock_start, s.store_stock_start),
+       inbound_quantity = COALESCE(v.inbound_quantity, s.inbound_quantity),
+       store_sales = COALESCE(v.store_sales, s.store_sales),
+       online_sales = COALESCE(v.online_sales, s.online_sales),
+       ending_stock = s.ending_stock
+           + COALESCE(v.warehouse_stock_start, s.warehouse_stock_start) - s.warehouse_stock_start
+           + COALESCE(v.store_stock_start, s.store_stock_start) - s.store_stock_start
+           + COALESCE(v.inbound_quantity, s.inbound_quantity) - s.inbound_quantity
+           - COALESCE(v.store_sales, s.store_sales) + s.store_sales
+           - COALESCE(v.online_sales, s.online_sales) + s.online_sales,
+       version = s.version + 1,
+       updated_at = NOW()
+  FROM (VALUES {{values}}) AS v(
+           id, version, warehouse_stock_start, store_stock_start,
+           inbound_quantity, store_sales, online_sales
+       )
+ WHERE s.id = v.id AND s.version = v.version
+RETURNING s.id, s.version, {", ".join(f"s.{field}" for field in SERVER_VALUE_FIELDS)}
+"""
+VALUES_ROW = "(%s::bigint, %s::int, %s::int, %s::int, %s::int, %s::int, %s::int)"
+
+
+def _server_values(values):
+    # (version, 재고 필드..., ending_stock) → dict
+    return dict(zip(("version", *SERVER_VALUE_FIELDS), values))
+
+
+def _conflict(variant_code, client_version, server):
+    return {
+        "variant_code": variant_code,
+        "server_version": server["version"],
+        "client_version": client_version,
+        "server_values": {field: server[field] for field in SERVER_VALUE_FIELDS},
+    }
+
+
+def bulk_save_statuses(year, month, rows, batch_size=BULK_SAVE_BATCH_SIZE):
+    """
+    월별 재고 여러 행 저장 (version 기반 compare-and-swap)
+
+    - variant_code / 월별 행을 각각 쿼리 한 번으로 조회
+    - 서버 version과 다른 행은 바로 conflicts
+    - 나머지는 batch_size 행씩 UPDATE ... FROM (VALUES ...) WHERE version = client_version
+      → 조회 이후 다른 요청이 먼저 저장한 행은 UPDATE되지 않고 conflicts
+    - 같은 variant_code가 여러 번 나오면 첫 행만 저장, 뒤 행은 conflicts
+      (한 행씩 저장할 때 version이 이미 올라가 충돌하던 것과 같은 결과)
+    - conflicts에는 현재 서버 값(server_values) 포함
+
+    반환값: {"updated": 저장된 행 수, "conflicts": [...], "errors": [...]}
+    """
+    conflicts, errors = [], []
+
+    codes = [row.get("variant_code") for row in rows if row.get("variant_code")]
+    variant_ids = dict(
+        ProductVariant.objects.filter(
+            variant_code__in=codes, is_active=True
+        ).values_list("variant_code", "id")
+    )
+    # variant_id → 월별 행 pk / pk → 현재 서버 값 (쿼리 한 번)
+    status_ids, servers = {}, {}
+    for values in ProductVariantStatus.objects.filter(
+        year=year, month=month, variant_id__in=variant_ids.values()
+    ).values_list("pk", "variant_id", "version", *SERVER_VALUE_FIELDS):
+        status_ids[values[1]] = values[0]
+        servers[values[0]] = _server_values(values[2:])
+
+    pending, duplicates, seen = [], [], set()
+
+    with transaction.atomic():
+        for row in rows:
+            variant_code = row.get("variant_code")
+            client_version = row.get("version")
+
+            if not variant_code:
+                continue
+
+            variant_id = variant_ids.get(variant_code)
+            if variant_id is None:
+                errors.append({
+                    "variant_code": variant_code,
+                    "error": "존재하지 않는 variant"
+                })
+                continue
+
+            status_id = status_ids.get(variant_id)
+            if status_id is None:
+                errors.append({
+                    "variant_code": variant_code,
+                    "error": "해당 월 재고 데이터 없음"
+                })
+                continue
+
+            if variant_code in seen:
+                duplicates.append((variant_code, client_version, status_id))
+                continue
+            seen.add(variant_code)
+
+            if client_version != servers[status_id]["version"]:
+                conflicts.append(
+                    _conflict(variant_code, client_version, servers[status_id])
+                )
+                continue
+
+            changes = {k: v for k, v in row.items() if k in STOCK_FIELDS}
+            if not changes:
+                continue
+
+            try:
+                values = [
+                    int(changes[field]) if field in changes else None
+                    for field in STOCK_FIELDS
+                ]
+            except (TypeError, ValueError):
+                errors.append({
+                    "variant_code": variant_code,
+                    "error": "수량 필드는 정수여야 합니다."
+                })
+                continue
+
+            pending.append((variant_code, client_version, status_id, values))
+
+        saved = {}
+        with connection.cursor() as cursor:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                params = []
+                for _, client_version, status_id, values in batch:
+                    params.extend([status_id, client_version, *values])
+
+                cursor.execute(
+                    BULK_SAVE_SQL.format(values=", ".join([VALUES_ROW] * len(batch))),
+                    params,
+                )
+                for values in cursor.fetchall():
+                    saved[values[0]] = _server_values(values[1:])
+
+        # 조회 이후 다른 요청이 먼저 저장한 행 → 현재 값 다시 읽어 충돌 처리
+        lost = [item for item in pending if item[2] not in saved]
+        if lost:
+            for values in ProductVariantStatus.objects.filter(
+                pk__in=[status_id for _, _, status_id, _ in lost]
+            ).values_list("pk", "version", *SERVER_VALUE_FIELDS):
+                servers[values[0]] = _server_values(values[1:])
+        for variant_code, client_version, status_id, _ in lost:
+            conflicts.append(
+                _conflict(variant_code, client_version, servers[status_id])
+            )
+
+        servers.update(saved)
+        for variant_code, client_version, status_id in duplicates:
+            conflicts.append(
+                _conflict(variant_code, client_version, servers[status_id])
+            )
+
+        if saved:
+            invalidate_variant_status_cache(year, month)
+
+    return {"updated": len(saved), "conflicts": conflicts, "errors": errors}
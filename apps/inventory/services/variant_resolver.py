@@ -1,26 +1,81 @@
+from django.db.models import Q
+
 from apps.inventory.models import ProductVariant
 
+# 인덱스에 읽어 두는 필드 (매칭 키 + pk)
+INDEX_FIELDS = ("id", "product_id", "option", "detail_option", "variant_code")
+
+
+class VariantResolverIndex:
+    """
+    import / 일괄 작업용 variant 매칭 인덱스
+
+    - build(): 필요한 variant를 쿼리 한 번으로 읽어 dict 구성
+    - resolve(): resolve_variant와 같은 우선순위로 dict 조회 (DB 조회 없음)
+    - add(): 작업 중 새로 만든 variant 등록 → 같은 파일 뒤쪽 행에서 바로 매칭
+
+    같은 키에 variant가 여러 개면 variant_code 순 첫 번째
+    (ProductVariant 기본 정렬, resolve_variant의 .first()와 동일)
+    """
+
+    def __init__(self, variants=()):
+        self.by_code = {}
+        self.by_options = {}
+        self.by_blank = {}
+
+        for variant in variants:
+            self.add(variant)
+
+    @classmethod
+    def build(cls, variant_codes=(), product_ids=(), fields=INDEX_FIELDS):
+        """
+        variant_code 목록 / 상품 pk 목록에 해당하는 variant로 인덱스 생성
+        - fields만 읽음 (None이면 전체 필드)
+        """
+        variants = ProductVariant.objects.filter(
+            Q(variant_code__in=list(variant_codes))
+            | Q(product_id__in=list(product_ids))
+        ).order_by("variant_code")
+
+        if fields:
+            variants = variants.only(*fields)
+
+        return cls(variants)
+
+    def add(self, variant):
+        self.by_code.setdefault(variant.variant_code, variant)
+        self.by_options.setdefault(
+            (variant.product_id, variant.option, variant.detail_option), variant
+        )
+        if variant.option == "":
+            self.by_blank.setdefault(variant.product_id, variant)
+
+    def resolve(self, product, option, detail_option, variant_code):
+        """
+        1. variant_code 일치
+        2. 옵션 있으면 (상품, 옵션, 상세옵션) / 없으면 (상품, 옵션 "")
+        - 없으면 None
+        """
+        if variant_code:
+            variant = self.by_code.get(variant_code)
+            if variant is not None:
+                return variant
+
+        if option:
+            return self.by_options.get((product.pk, option, detail_option))
+
+        return self.by_blank.get(product.pk)
+
+
 def resolve_variant(product, option, detail_option, variant_code):
     """
     - 기존 Variant 있으면 반환
     - 없으면 None
+    (행 하나 조회용, 여러 행은 VariantResolverIndex 사용)
     """
-
-    if variant_code:
-        existing = ProductVariant.objects.filter(
-            variant_code=variant_code
-        ).first()
-        if existing:
-            return existing
-
-    if option:
-        return ProductVariant.objects.filter(
-            product=product,
-            option=option,
-            detail_option=detail_option,
-        ).first()
-
-    return ProductVariant.objects.filter(
-        product=product,
-        option="",
-    ).first()
+    index = VariantResolverIndex.build(
+        variant_codes=[variant_code] if variant_code else [],
+        product_ids=[product.pk],
+        fields=None,
+    )
+    return index.resolve(product, option, detail_option, variant_code)
@@ -0,0 +1,22 @@
+from celery import shared_task
+
+from apps.inventory.services.batch_job import run_recompute_job, run_rollover_job
+from apps.inventory.services.import_job import run_import_job
+
+
+@shared_task
+def rollover_month_task(job_id):
+    """월 이월 백그라운드 작업 (진행 상황은 InventoryBatchJob에 기록)"""
+    return run_rollover_job(job_id)
+
+
+@shared_task
+def recompute_forward_task(job_id):
+    """지난 달 수정 후 이후 달 이월 재고 재계산 백그라운드 작업 (진행 상황은 InventoryBatchJob에 기록)"""
+    return run_recompute_job(job_id)
+
+
+@shared_task
+def import_inventory_job_task(job_id):
+    """엑셀 업로드 백그라운드 작업 (진행 상황은 InventoryImportJob에 기록)"""
+    return run_import_job(job_id)
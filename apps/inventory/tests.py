@@ -1,4 +1,5 @@
 import io
+import json
 import pandas as pd
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -10,7 +11,9 @@ from apps.inventory.models import (
     InventoryItem,
     ProductVariant,
     InventoryAdjustment,
-    ProductVariantStatus
+    ProductVariantStatus,
+    InventoryImportJob,
+    InventoryBatchJob,
 )
 
 from apps.orders.models import (
@@ -1036,6 +1039,94 @@ class SyncInboundFromOrdersTest(APITestCase):
             variant=self.variant
         )
         self.assertEqual(status_obj.inbound_quantity, 7)
+        self.assertEqual(status_obj.ending_stock, 7)
+        self.assertEqual(
+            res.data["discrepancies"],
+            [{"variant_code": "P80000-A", "before": None, "after": 7}],
+        )
+
+    def test_sync_inbound_fixes_only_discrepancies(self):
+        # 수기 입력 입고 2 (발주 입고분 0) → 완료 발주 7이 빠져 있음
+        status_obj = ProductVariantStatus.objects.create(
+            year=2026,
+            month=2,
+            product=self.product,
+            variant=self.variant,
+            warehouse_stock_start=10,
+            inbound_quantity=2,
+        )
+        self.assertEqual(status_obj.ending_stock, 12)
+
+        url = reverse("inventory-sync-inbound", args=[2026, 2])
+
+        with self.assertNumQueries(1):
+            res = self.client.post(url)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual((res.data["checked"], res.data["updated"]), (1, 1))
+        self.assertEqual(
+            res.data["discrepancies"],
+            [{"variant_code": "P80000-A", "before": 0, "after": 7}],
+        )
+
+        # 수기 입력분 2는 유지, 발주 입고분 7만 더함
+        status_obj.refresh_from_db()
+        self.assertEqual(status_obj.inbound_quantity, 9)
+        self.assertEqual(status_obj.order_inbound_quantity, 7)
+        self.assertEqual(status_obj.ending_stock, 19)
+        self.assertEqual(status_obj.version, 1)
+
+        # 같은 발주로 다시 대사 → 불일치 없음
+        res = self.client.post(url)
+        self.assertEqual(res.data["updated"], 0)
+        self.assertEqual(res.data["discrepancies"], [])
+        status_obj.refresh_from_db()
+        self.assertEqual(status_obj.version, 1)
+
+    def test_sync_inbound_reverts_order_inbound_without_completed_orders(self):
+        url = reverse("inventory-sync-inbound", args=[2026, 2])
+        self.client.post(url)
+
+        # 수기로 입고 3 추가 후, 완료 발주가 (complete / delete 흐름 밖에서) 사라짐
+        ProductVariantStatus.objects.filter(
+            year=2026, month=2, variant=self.variant
+        ).update(inbound_quantity=10, ending_stock=10)
+        self.order.delete()
+
+        res = self.client.post(url)
+        self.assertEqual(
+            res.data["discrepancies"],
+            [{"variant_code": "P80000-A", "before": 7, "after": 0}],
+        )
+        status_obj = ProductVariantStatus.objects.get(
+            year=2026, month=2, variant=self.variant
+        )
+        self.assertEqual(
+            (status_obj.inbound_quantity, status_obj.order_inbound_quantity), (3, 0)
+        )
+        self.assertEqual(status_obj.ending_stock, 3)
+
+    def test_sync_inbound_buckets_month_in_local_timezone(self):
+        # 한국 시간 2026-03-01 01:00 (UTC 2026-02-28 16:00) → 3월 입고
+        self.order.completed_at = timezone.make_aware(
+            datetime(2026, 3, 1, 1)
+        )
+        self.order.save(update_fields=["completed_at"])
+
+        res = self.client.post(
+            reverse("inventory-sync-inbound", args=[2026, 2])
+        )
+        self.assertEqual(res.data["checked"], 0)
+
+        res = self.client.post(
+            reverse("inventory-sync-inbound", args=[2026, 3])
+        )
+        self.assertEqual(res.data["updated"], 1)
+        self.assertEqual(
+            ProductVariantStatus.objects.get(
+                year=2026, month=3, variant=self.variant
+            ).inbound_quantity,
+            7,
+        )
 
 
 class VariantStatusBulkUpdateTest(APITestCase):
@@ -1080,6 +1171,106 @@ class VariantStatusBulkUpdateTest(APITestCase):
         self.status.refresh_from_db()
         self.assertEqual(self.status.inbound_quantity, 99)
 
+    def test_bulk_update_conflicts_and_errors_in_constant_queries(self):
+        other = ProductVariant.objects.create(
+            product=self.product,
+            variant_code="P70000-B",
+            option="B"
+        )
+        other_status = ProductVariantStatus.objects.create(
+            year=2026,
+            month=3,
+            product=self.product,
+            variant=other,
+            store_sales=2,
+            version=4,
+        )
+
+        payload = {
+            "year": 2026,
+            "month": 3,
+            "rows": [
+                {"variant_code": "P70000-A", "store_sales": 1, "version": 0},
+                {"variant_code": "P70000-B", "store_sales": 9, "version": 3},
+                {"variant_code": "P70000-A", "store_sales": 5, "version": 0},
+                {"variant_code": "NOPE-A", "store_sales": 1, "version": 0},
+            ],
+        }
+
+        # variant 조회 + 월별 행 조회 + UPDATE (+ savepoint 2)
+        with self.assertNumQueries(5):
+            res = self.client.patch(
+                reverse("variant-status-bulk"), payload, format="json"
+            )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["updated"], 1)
+
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.store_sales, 1)
+        self.assertEqual(self.status.ending_stock, 0)
+        self.assertEqual(self.status.version, 1)
+
+        conflicts = {
+            (c["variant_code"], c["server_version"]): c
+            for c in res.data["conflicts"]
+        }
+        self.assertEqual(set(conflicts), {("P70000-B", 4), ("P70000-A", 1)})
+        self.assertEqual(
+            conflicts[("P70000-B", 4)]["server_values"],
+            {
+                "warehouse_stock_start": 0,
+                "store_stock_start": 0,
+                "inbound_quantity": 0,
+                "store_sales": 2,
+                "online_sales": 0,
+                "ending_stock": -2,
+            },
+        )
+        self.assertEqual(
+            conflicts[("P70000-A", 1)]["server_values"]["store_sales"], 1
+        )
+        self.assertEqual(
+            res.data["errors"],
+            [{"variant_code": "NOPE-A", "error": "존재하지 않는 variant"}],
+        )
+
+        other_status.refresh_from_db()
+        self.assertEqual((other_status.store_sales, other_status.version), (2, 4))
+
+    def test_bulk_update_rejects_row_changed_after_read(self):
+        # 조회 이후 다른 요청이 먼저 저장한 경우: version 조건 UPDATE가 0행
+        from unittest import mock
+        from apps.inventory.services import status_bulk_save
+
+        original = status_bulk_save.BULK_SAVE_SQL
+
+        class RacingSQL(str):
+            def format(self, **kwargs):
+                ProductVariantStatus.objects.filter(pk=status_pk).update(
+                    inbound_quantity=5, version=1
+                )
+                return original.format(**kwargs)
+
+        status_pk = self.status.pk
+        with mock.patch.object(
+            status_bulk_save, "BULK_SAVE_SQL", RacingSQL(original)
+        ):
+            result = status_bulk_save.bulk_save_statuses(
+                2026,
+                3,
+                [{"variant_code": "P70000-A", "inbound_quantity": 99, "version": 0}],
+            )
+
+        self.assertEqual(result["updated"], 0)
+        self.assertEqual(len(result["conflicts"]), 1)
+        self.assertEqual(result["conflicts"][0]["server_version"], 1)
+        self.assertEqual(
+            result["conflicts"][0]["server_values"]["inbound_quantity"], 5
+        )
+
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.inbound_quantity, 5)
+
 class VariantStatusDeleteTest(APITestCase):
 
     def setUp(self):
@@ -1112,3 +1303,1671 @@ class VariantStatusDeleteTest(APITestCase):
         self.assertEqual(
             ProductVariantStatus.objects.count(), 0
         )
+
+
+class VariantStatusAdjustmentBatchTest(APITestCase):
+    """
+    재고 현황 목록 조회 시 재고조정 합계/내역을 일괄 계산
+    - 행 수와 무관하게 쿼리 수 고정
+    """
+
+    def _create_rows(self, count, start=0):
+        for i in range(start, start + count):
+            product = InventoryItem.objects.create(
+                product_id=f"P9{i:04d}",
+                name=f"배치 상품 {i}",
+            )
+            variant = ProductVariant.objects.create(
+                product=product,
+                variant_code=f"P9{i:04d}-A",
+                option="A",
+            )
+            ProductVariantStatus.objects.create(
+                year=2026,
+                month=5,
+                product=product,
+                variant=variant,
+                warehouse_stock_start=10,
+            )
+            InventoryAdjustment.objects.create(
+                variant=variant,
+                year=2026,
+                month=5,
+                delta=-1,
+                reason="실사",
+                created_by="관리자",
+            )
+
+    def _count_queries(self):
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        # ORM 직접 생성은 응답 캐시를 무효화하지 않음
+        cache.clear()
+
+        url = reverse("variant-status-list")
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(
+                url, {"year": 2026, "month": 5, "page_size": 200}
+            )
+        self.assertEqual(res.status_code, 200)
+        return len(ctx.captured_queries), res
+
+    def test_query_count_is_constant(self):
+        self._create_rows(2)
+        small, _ = self._count_queries()
+
+        self._create_rows(8, start=2)
+        large, res = self._count_queries()
+
+        self.assertEqual(small, large)
+        self.assertEqual(len(res.data["results"]), 10)
+
+        row = res.data["results"][0]
+        self.assertEqual(row["adjustment_quantity"], -1)
+        self.assertEqual(
+            row["adjustment_status"],
+            [{"created_by": "관리자", "quantity": -1}],
+        )
+        self.assertEqual(row["ending_stock"], 9)
+
+
+class VariantStatusEndingStockTest(APITestCase):
+    """
+    ProductVariantStatus.ending_stock 쓰기 시점 유지
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ending",
+            password="pass1234",
+            first_name="기말"
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.product = InventoryItem.objects.create(
+            product_id="P88000",
+            name="기말재고 상품"
+        )
+        self.variant = ProductVariant.objects.create(
+            product=self.product,
+            variant_code="P88000-A",
+            option="A",
+            min_stock=5,
+        )
+        self.status = ProductVariantStatus.objects.create(
+            year=2026,
+            month=6,
+            product=self.product,
+            variant=self.variant,
+            warehouse_stock_start=10,
+            store_stock_start=5,
+            inbound_quantity=5,
+            store_sales=3,
+            online_sales=2,
+        )
+
+    def test_ending_stock_maintained_on_writes(self):
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 15)
+
+        # 재고 조정 등록 → 누적
+        self.client.post(
+            reverse("inventory-adjustments"),
+            {
+                "variant_code": self.variant.variant_code,
+                "year": 2026,
+                "month": 6,
+                "delta": -4,
+                "reason": "파손",
+            },
+            format="json",
+        )
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 11)
+
+        # 셀 단위 PATCH
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 6, "P88000-A"]),
+            {"store_sales": 10},
+            format="json",
+        )
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 4)
+        # PATCH도 version 증가 → 벌크 저장 CAS는 새 version 기준
+        self.assertEqual(self.status.version, 1)
+
+        # 벌크 저장
+        self.client.patch(
+            reverse("variant-status-bulk"),
+            {
+                "year": 2026,
+                "month": 6,
+                "rows": [
+                    {
+                        "variant_code": "P88000-A",
+                        "inbound_quantity": 15,
+                        "version": 1,
+                    }
+                ],
+            },
+            format="json",
+        )
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 14)
+
+    def test_patch_keeps_adjustment_committed_after_read(self):
+        from unittest import mock
+
+        apply_stock_changes = ProductVariantStatus.apply_stock_changes
+
+        # PATCH가 행을 읽은 뒤 다른 요청의 재고조정(F() 증분)이 먼저 커밋된 상황
+        def interleaved(status_obj, changes):
+            InventoryAdjustment.objects.create(
+                variant=self.variant,
+                year=2026,
+                month=6,
+                delta=5,
+                reason="실사",
+                created_by="관리자",
+            )
+            return apply_stock_changes(status_obj, changes)
+
+        with mock.patch.object(
+            ProductVariantStatus, "apply_stock_changes", interleaved
+        ):
+            res = self.client.patch(
+                reverse("variant-status-detail", args=[2026, 6, "P88000-A"]),
+                {"store_sales": 1},
+                format="json",
+            )
+        self.assertEqual(res.status_code, 200)
+
+        # 15 + 재고조정 5 + 판매 감소 2
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 22)
+        self.assertEqual(self.status.ending_stock, self.status.calculate_ending_stock())
+        self.assertEqual(res.data["ending_stock"], 22)
+
+    def test_moving_adjustment_to_another_month_recomputes_both(self):
+        july = ProductVariantStatus.objects.create(
+            year=2026,
+            month=7,
+            product=self.product,
+            variant=self.variant,
+            warehouse_stock_start=20,
+        )
+        adjustment = InventoryAdjustment.objects.create(
+            variant=self.variant,
+            year=2026,
+            month=6,
+            delta=-4,
+            reason="파손",
+            created_by="관리자",
+        )
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 11)
+
+        adjustment.month = 7
+        adjustment.save()
+
+        self.status.refresh_from_db()
+        july.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 15)
+        self.assertEqual(july.ending_stock, 16)
+
+    def test_low_stock_filter_and_ordering(self):
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 6, "P88000-A"]),
+            {"store_sales": 13},
+            format="json",
+        )
+
+        res = self.client.get(
+            reverse("variant-status-list"),
+            {"year": 2026, "month": 6, "low_stock": "true", "ordering": "-ending_stock"},
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.data["results"]), 1)
+        self.assertEqual(res.data["results"][0]["ending_stock"], 5)
+
+    def test_verify_command_reports_and_fixes_drift(self):
+        from django.core.management import call_command
+
+        ProductVariantStatus.objects.filter(pk=self.status.pk).update(ending_stock=999)
+
+        out = io.StringIO()
+        call_command("verify_ending_stock", "--year", "2026", "--fix", stdout=out)
+        self.assertIn("[DRIFT]", out.getvalue())
+
+        self.status.refresh_from_db()
+        self.assertEqual(self.status.ending_stock, 15)
+
+
+    def test_serializer_stock_reads_annotated_ending_stock(self):
+        from apps.inventory.serializers import ProductVariantSerializer
+
+        today = timezone.localdate()
+        other = ProductVariant.objects.create(
+            product=self.product, variant_code="P88000-B", option="B"
+        )
+        ProductVariantStatus.objects.create(
+            year=today.year,
+            month=today.month,
+            product=self.product,
+            variant=self.variant,
+            warehouse_stock_start=7,
+        )
+
+        queryset = ProductVariantSerializer.annotate_stock(
+            ProductVariant.objects.filter(pk__in=[self.variant.pk, other.pk]).order_by("pk")
+        )
+        serializer = ProductVariantSerializer()
+
+        # 목록 1회 조회 후 variant별 추가 쿼리 없음 (조정 합계 재계산 안 함)
+        with self.assertNumQueries(1):
+            stocks = [serializer.get_stock(v) for v in queryset]
+        self.assertEqual(stocks, [7, 0])
+
+        # annotate 없는 단건은 ending_stock 1회 조회
+        with self.assertNumQueries(1):
+            self.assertEqual(serializer.get_stock(self.variant), 7)
+
+
+class ProductVariantExportFileTest(APITestCase):
+    """
+    Export API 파일 다운로드 (format=csv / xlsx)
+    - 업로드 양식과 동일한 컬럼 → 그대로 재업로드 가능
+    """
+
+    def setUp(self):
+        self.product = InventoryItem.objects.create(
+            product_id="P66000",
+            name="다운로드 상품",
+            category="문구",
+        )
+        self.variant = ProductVariant.objects.create(
+            product=self.product,
+            variant_code="P66000-블랙",
+            option="블랙",
+        )
+        ProductVariantStatus.objects.create(
+            year=2026,
+            month=7,
+            product=self.product,
+            variant=self.variant,
+            warehouse_stock_start=30,
+            store_stock_start=5,
+            inbound_quantity=10,
+            store_sales=4,
+            online_sales=1,
+        )
+        InventoryAdjustment.objects.create(
+            variant=self.variant,
+            year=2026,
+            month=7,
+            delta=-2,
+            reason="분실",
+            created_by="관리자",
+        )
+
+    def test_export_csv(self):
+        url = reverse("variant-export")
+        res = self.client.get(url, {"year": 2026, "month": 7, "format": "csv"})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("text/csv", res["Content-Type"])
+
+        content = b"".join(res.streaming_content).decode("utf-8-sig")
+        df = pd.read_csv(io.StringIO(content))
+
+        self.assertEqual(len(df), 1)
+        row = df.iloc[0]
+        self.assertEqual(row["상품코드"], "P66000-블랙")
+        self.assertEqual(row["월초창고 재고"], 30)
+        self.assertEqual(row["재고조정"], -2)
+        self.assertEqual(row["기말 재고"], 38)
+
+    def test_export_xlsx_round_trip(self):
+        url = reverse("variant-export")
+        res = self.client.get(url, {"year": 2026, "month": 7, "format": "xlsx"})
+        self.assertEqual(res.status_code, 200)
+
+        content = b"".join(res.streaming_content)
+        upload_file = SimpleUploadedFile(
+            "inventory.xlsx",
+            content,
+            content_type=(
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            ),
+        )
+
+        res = self.client.post(
+            reverse("variant-excel-upload") + "?year=2026&month=8",
+            {"file": upload_file},
+            format="multipart",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["summary"]["skipped_variants"], 1)
+
+        copied = ProductVariantStatus.objects.get(
+            year=2026, month=8, variant=self.variant
+        )
+        self.assertEqual(copied.warehouse_stock_start, 30)
+        self.assertEqual(copied.inbound_quantity, 10)
+        self.assertEqual(copied.online_sales, 1)
+
+
+class VariantStatusKeysetPaginationTest(APITestCase):
+    """
+    pagination=cursor: (product_id, variant_code) 기준 Keyset 페이지네이션
+    """
+
+    def setUp(self):
+        for pid in ["P55001", "P55002"]:
+            product = InventoryItem.objects.create(product_id=pid, name=pid)
+            for opt in ["A", "B", "C"]:
+                variant = ProductVariant.objects.create(
+                    product=product,
+                    variant_code=f"{pid}-{opt}",
+                    option=opt,
+                )
+                ProductVariantStatus.objects.create(
+                    year=2026,
+                    month=9,
+                    product=product,
+                    variant=variant,
+                )
+
+    def _get(self, url, params=None):
+        res = self.client.get(url, params)
+        self.assertEqual(res.status_code, 200)
+        return res.data
+
+    def test_forward_and_backward(self):
+        url = reverse("variant-status-list")
+        data = self._get(
+            url, {"year": 2026, "month": 9, "pagination": "cursor", "page_size": 4}
+        )
+        self.assertNotIn("count", data)
+        self.assertIsNone(data["previous"])
+
+        first_page = [r["variant_code"] for r in data["results"]]
+        self.assertEqual(
+            first_page, ["P55001-A", "P55001-B", "P55001-C", "P55002-A"]
+        )
+
+        data = self._get(data["next"])
+        self.assertEqual(
+            [r["variant_code"] for r in data["results"]], ["P55002-B", "P55002-C"]
+        )
+        self.assertIsNone(data["next"])
+
+        data = self._get(data["previous"])
+        self.assertEqual([r["variant_code"] for r in data["results"]], first_page)
+        self.assertIsNone(data["previous"])
+
+    def test_with_count_and_invalid_cursor(self):
+        url = reverse("variant-status-list")
+        data = self._get(
+            url,
+            {"year": 2026, "month": 9, "pagination": "cursor", "with_count": "true"},
+        )
+        self.assertEqual(data["count"], 6)
+
+        res = self.client.get(
+            url, {"year": 2026, "month": 9, "pagination": "cursor", "cursor": "broken"}
+        )
+        self.assertEqual(res.status_code, 404)
+
+
+class VariantStatusResponseCacheTest(APITestCase):
+    """
+    월별 재고 현황 응답 캐시
+    - 동일 요청은 캐시에서 응답 (목록 조회 없음, ETag 기준값 집계 4번만)
+    - 해당 월 수정 API 호출 시 무효화
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+        self.product = InventoryItem.objects.create(
+            product_id="P44000",
+            name="캐시 상품",
+        )
+        self.variant = ProductVariant.objects.create(
+            product=self.product,
+            variant_code="P44000-A",
+            option="A",
+        )
+        ProductVariantStatus.objects.create(
+            year=2026,
+            month=10,
+            product=self.product,
+            variant=self.variant,
+            inbound_quantity=1,
+        )
+
+    def _list(self):
+        return self.client.get(
+            reverse("variant-status-list"), {"year": 2026, "month": 10}
+        )
+
+    def test_cached_until_month_is_modified(self):
+        self.assertEqual(self._list().data["results"][0]["inbound_quantity"], 1)
+
+        with self.assertNumQueries(4):
+            res = self._list()
+        self.assertEqual(res.data["results"][0]["inbound_quantity"], 1)
+
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 10, "P44000-A"]),
+            {"inbound_quantity": 5},
+            format="json",
+        )
+        self.assertEqual(self._list().data["results"][0]["inbound_quantity"], 5)
+
+    def test_other_month_write_keeps_cache(self):
+        self._list()
+
+        ProductVariantStatus.objects.create(
+            year=2026,
+            month=11,
+            product=self.product,
+            variant=self.variant,
+        )
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 11, "P44000-A"]),
+            {"inbound_quantity": 3},
+            format="json",
+        )
+
+        with self.assertNumQueries(4):
+            self._list()
+
+    def test_pagination_links_follow_request_host(self):
+        params = {"year": 2026, "month": 10, "page_size": 1}
+        ProductVariantStatus.objects.create(
+            year=2026,
+            month=10,
+            product=self.product,
+            variant=ProductVariant.objects.create(
+                product=self.product, variant_code="P44000-B", option="B"
+            ),
+        )
+
+        res = self.client.get(
+            reverse("variant-status-list"), params, HTTP_HOST="erp.example.com"
+        )
+        self.assertTrue(res.data["next"].startswith("http://erp.example.com/"))
+
+        # 같은 쿼리라도 다른 host로 들어오면 그 host 기준 링크
+        res = self.client.get(
+            reverse("variant-status-list"), params, HTTP_HOST="10.0.0.5:8000"
+        )
+        self.assertTrue(res.data["next"].startswith("http://10.0.0.5:8000/"))
+
+    def test_catalog_change_invalidates(self):
+        self._list()
+
+        self.client.patch(
+            reverse("variant-detail", args=["P44000-A"]),
+            {"name": "이름 변경"},
+            format="json",
+        )
+        self.assertEqual(
+            self._list().data["results"][0]["offline_name"], "이름 변경"
+        )
+
+
+class VariantStatusSummaryTest(APITestCase):
+    """
+    월별 카테고리 집계 (GROUP BY ROLLUP)
+    - 카테고리 행 / 중분류·대분류 소계 / 전체 합계
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+        def make(product_id, big, middle, category, **stock):
+            product = InventoryItem.objects.create(
+                product_id=product_id,
+                name=product_id,
+                big_category=big,
+                middle_category=middle,
+                category=category,
+            )
+            variant = ProductVariant.objects.create(
+                product=product,
+                variant_code=f"{product_id}-A",
+                option="A",
+            )
+            ProductVariantStatus.objects.create(
+                year=2026,
+                month=3,
+                product=product,
+                variant=variant,
+                **stock,
+            )
+            return variant
+
+        self.tee = make(
+            "P55001", "의류", "상의", "티셔츠",
+            warehouse_stock_start=10, inbound_quantity=5, store_sales=2,
+        )
+        make(
+            "P55002", "의류", "상의", "셔츠",
+            store_stock_start=4, online_sales=1,
+        )
+        make(
+            "P55003", "의류", "하의", "팬츠",
+            warehouse_stock_start=7,
+        )
+        make(
+            "P55004", "잡화", "가방", "백팩",
+            warehouse_stock_start=3,
+        )
+        InventoryAdjustment.objects.create(
+            variant=self.tee,
+            year=2026,
+            month=3,
+            delta=-1,
+            reason="파손",
+            created_by="tester",
+        )
+
+    def test_rollup_rows_and_total(self):
+        res = self.client.get(
+            reverse("variant-status-summary"), {"year": 2026, "month": 3}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        rows = {
+            (r["level"], r["big_category"], r["middle_category"], r["category"]): r
+            for r in res.data["rows"]
+        }
+
+        tee = rows[("category", "의류", "상의", "티셔츠")]
+        self.assertEqual(tee["adjustment_total"], -1)
+        self.assertEqual(tee["ending_stock"], 12)
+
+        top = rows[("middle_category", "의류", "상의", None)]
+        self.assertEqual(top["variant_count"], 2)
+        self.assertEqual(top["ending_stock"], 15)
+
+        clothes = rows[("big_category", "의류", None, None)]
+        self.assertEqual(clothes["variant_count"], 3)
+        self.assertEqual(clothes["warehouse_stock_start"], 17)
+
+        total = res.data["total"]
+        self.assertEqual(total["variant_count"], 4)
+        self.assertEqual(total["ending_stock"], 25)
+        self.assertEqual(total["adjustment_total"], -1)
+
+        # 소계 행은 하위 행 뒤에 위치
+        levels = [r["level"] for r in res.data["rows"]]
+        self.assertEqual(levels[-1], "big_category")
+        self.assertEqual(len(levels), 4 + 3 + 2)
+
+    def test_empty_month_and_validation(self):
+        res = self.client.get(
+            reverse("variant-status-summary"), {"year": 2026, "month": 4}
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["rows"], [])
+        self.assertEqual(res.data["total"]["ending_stock"], 0)
+
+        res = self.client.get(reverse("variant-status-summary"), {"year": 2026})
+        self.assertEqual(res.status_code, 400)
+
+
+class CompactFormatTest(APITestCase):
+    """
+    ?format=compact 컬럼형 응답 (columns + rows)
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+        self.product = InventoryItem.objects.create(
+            product_id="P66000",
+            name="컴팩트 상품",
+        )
+        for code in ("P66000-A", "P66000-B"):
+            variant = ProductVariant.objects.create(
+                product=self.product,
+                variant_code=code,
+                option=code[-1],
+            )
+            ProductVariantStatus.objects.create(
+                year=2026,
+                month=5,
+                product=self.product,
+                variant=variant,
+                warehouse_stock_start=3,
+            )
+
+    def test_status_list_keeps_pagination_keys(self):
+        res = self.client.get(
+            reverse("variant-status-list"),
+            {"year": 2026, "month": 5, "format": "compact"},
+        )
+        self.assertEqual(res.status_code, 200)
+
+        body = json.loads(res.content)
+        self.assertEqual(body["count"], 2)
+        self.assertNotIn("results", body)
+
+        codes = [row[body["columns"].index("variant_code")] for row in body["rows"]]
+        self.assertEqual(codes, ["P66000-A", "P66000-B"])
+
+        # 일반 JSON 응답과 같은 값
+        normal = self.client.get(
+            reverse("variant-status-list"), {"year": 2026, "month": 5}
+        ).data["results"]
+        self.assertEqual(
+            [dict(zip(body["columns"], row)) for row in body["rows"]],
+            json.loads(json.dumps(normal)),
+        )
+
+    def test_export_and_variant_list(self):
+        res = self.client.get(
+            reverse("variant-export"),
+            {"year": 2026, "month": 5, "format": "compact"},
+        )
+        body = json.loads(res.content)
+        self.assertEqual(len(body["rows"]), 2)
+        self.assertIn("ending_stock", body["columns"])
+
+        res = self.client.get(reverse("variant"), {"format": "compact"})
+        body = json.loads(res.content)
+        self.assertEqual(body["count"], 2)
+        self.assertIn("variant_code", body["columns"])
+
+    def test_error_response_unchanged(self):
+        res = self.client.get(
+            reverse("variant-status-list"), {"year": 2026, "format": "compact"}
+        )
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("detail", json.loads(res.content))
+
+
+class ConditionalGetTest(APITestCase):
+    """
+    조건부 GET (ETag)
+    - 변경 없으면 If-None-Match → 304
+    - 해당 월 / 상품 정보 변경 시 ETag 변경
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+        self.product = InventoryItem.objects.create(
+            product_id="P77000",
+            name="조건부 상품",
+            category="문구",
+        )
+        self.variant = ProductVariant.objects.create(
+            product=self.product,
+            variant_code="P77000-A",
+            option="A",
+        )
+        ProductVariantStatus.objects.create(
+            year=2026,
+            month=7,
+            product=self.product,
+            variant=self.variant,
+        )
+
+    def _list(self, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get(
+            reverse("variant-status-list"), {"year": 2026, "month": 7}, **headers
+        )
+
+    def test_variant_status_list_not_modified(self):
+        res = self._list()
+        self.assertEqual(res.status_code, 200)
+        etag = res["ETag"]
+        self.assertTrue(res.has_header("Last-Modified"))
+
+        # 기준값 집계 4번 (재고 행 / 재고조정 / 상품 / 옵션)만, 목록 조회 없음
+        with self.assertNumQueries(4):
+            res = self._list(etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res["ETag"], etag)
+
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 7, "P77000-A"]),
+            {"store_sales": 2},
+            format="json",
+        )
+        res = self._list(etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
+
+    def test_etag_follows_database_watermark(self):
+        from django.core.cache import cache
+
+        etag = self._list()["ETag"]
+
+        # 캐시 무효화를 거치지 않은 변경(캐시 버전 그대로)도 기준값(DB)으로 바로 감지
+        ProductVariantStatus.objects.filter(variant=self.variant).update(
+            store_sales=3, updated_at=timezone.now()
+        )
+        self.assertEqual(self._list(etag).status_code, 200)
+
+        # 변경 없으면 캐시가 비어도 같은 ETag
+        etag = self._list()["ETag"]
+        cache.clear()
+        self.assertEqual(self._list(etag).status_code, 304)
+
+    def test_write_without_invalidation_refreshes_body_with_etag(self):
+        etag = self._list()["ETag"]
+
+        # 캐시 버전을 올리지 않는 queryset .update()
+        ProductVariantStatus.objects.filter(variant=self.variant).update(
+            warehouse_stock_start=99, updated_at=timezone.now()
+        )
+
+        res = self._list(etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.data["results"][0]["warehouse_stock_start"], 99)
+
+        # 새 ETag로 다시 요청 → 304 (새 본문을 받은 뒤라 안전)
+        self.assertEqual(self._list(res["ETag"]).status_code, 304)
+
+    def test_category_and_option_lists(self):
+        for name in ("inventory-category", "inventory_options"):
+            res = self.client.get(reverse(name))
+            self.assertEqual(res.status_code, 200)
+            etag = res["ETag"]
+
+            res = self.client.get(reverse(name), HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(res.status_code, 304)
+
+            # 캐시 무효화 없이 바뀐 상품도 다음 요청에서 감지
+            InventoryItem.objects.filter(pk=self.product.pk).update(
+                category=f"{name}-변경", updated_at=timezone.now()
+            )
+
+            res = self.client.get(reverse(name), HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(res.status_code, 200)
+
+
+class VariantStatusCarryOverTest(APITestCase):
+    """
+    POST /inventory/variant-status/{year}/{month}
+    저번 달 기말재고 → 이번 달 창고 기초재고 (INSERT ... SELECT)
+    """
+
+    url = "/api/v1/inventory/variant-status/2026/2"
+
+    def setUp(self):
+        self.product = InventoryItem.objects.create(
+            product_id="P99100",
+            name="이월 상품",
+        )
+        self.variants = []
+        for code in ("P99100-A", "P99100-B", "P99100-C"):
+            variant = ProductVariant.objects.create(
+                product=self.product,
+                variant_code=code,
+                option=code[-1],
+            )
+            self.variants.append(variant)
+            ProductVariantStatus.objects.create(
+                year=2026,
+                month=1,
+                product=self.product,
+                variant=variant,
+                warehouse_stock_start=10,
+                inbound_quantity=5,
+                store_sales=3,
+            )
+
+        a, b, c = self.variants
+        # 저번 달 재고조정 → 이월 재고에 반영
+        InventoryAdjustment.objects.create(
+            variant=a, year=2026, month=1, delta=-2, reason="파손", created_by="t"
+        )
+        # 이번 달에 먼저 등록된 재고조정 → 이번 달 기말재고에 반영
+        InventoryAdjustment.objects.create(
+            variant=b, year=2026, month=2, delta=4, reason="실사", created_by="t"
+        )
+        # 이미 이번 달 행이 있는 variant → 스킵
+        ProductVariantStatus.objects.create(
+            year=2026,
+            month=2,
+            product=self.product,
+            variant=c,
+            warehouse_stock_start=99,
+        )
+
+    def test_carry_over_counts_and_values(self):
+        res = self.client.post(self.url)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.data["created"], 2)
+        self.assertEqual(res.data["skipped"], 1)
+
+        rows = {
+            s.variant.variant_code: s
+            for s in ProductVariantStatus.objects.filter(
+                year=2026, month=2
+            ).select_related("variant")
+        }
+        self.assertEqual(rows["P99100-A"].warehouse_stock_start, 10)
+        self.assertEqual(rows["P99100-A"].ending_stock, 10)
+        self.assertEqual(rows["P99100-B"].warehouse_stock_start, 12)
+        self.assertEqual(rows["P99100-B"].ending_stock, 16)
+        self.assertEqual(rows["P99100-C"].warehouse_stock_start, 99)
+
+        # 다시 실행 → 전부 스킵
+        res = self.client.post(self.url)
+        self.assertEqual(res.data["created"], 0)
+        self.assertEqual(res.data["skipped"], 3)
+
+    def test_missing_previous_month(self):
+        res = self.client.post("/api/v1/inventory/variant-status/2026/9")
+        self.assertEqual(res.status_code, 404)
+
+    def test_chunked_progress_and_structure_mode(self):
+        from apps.inventory.services.rollover import rollover_month
+
+        calls = []
+        result = rollover_month(
+            2026, 2, mode="structure", chunk_size=1,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        self.assertEqual((result["created"], result["skipped"]), (2, 1))
+        self.assertEqual(calls, [(1, 3), (2, 3), (3, 3)])
+
+        b = ProductVariantStatus.objects.get(
+            year=2026, month=2, variant__variant_code="P99100-B"
+        )
+        self.assertEqual(b.warehouse_stock_start, 0)
+        self.assertEqual(b.ending_stock, 4)
+
+    def test_concurrent_rollover_returns_409(self):
+        from django.db import connections
+        from apps.inventory.services.rollover import ROLLOVER_LOCK_NAMESPACE
+
+        other = connections.create_connection("default")
+        try:
+            with other.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_lock(%s, %s)",
+                    [ROLLOVER_LOCK_NAMESPACE, 202602],
+                )
+            res = self.client.post(self.url)
+            self.assertEqual(res.status_code, 409)
+            self.assertFalse(
+                ProductVariantStatus.objects.filter(
+                    year=2026, month=2, variant__variant_code="P99100-A"
+                ).exists()
+            )
+        finally:
+            # close()만으로는 서버 쪽 잠금 해제가 늦을 수 있어 명시적으로 해제
+            with other.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_unlock(%s, %s)",
+                    [ROLLOVER_LOCK_NAMESPACE, 202602],
+                )
+            other.close()
+
+        self.assertEqual(self.client.post(self.url).status_code, 201)
+
+    def test_background_mode(self):
+        res = self.client.post(self.url + "?background=true&mode=carry")
+        self.assertEqual(res.status_code, 202)
+        self.assertIn("task_id", res.data)
+        self.assertEqual(
+            ProductVariantStatus.objects.filter(year=2026, month=2).count(), 3
+        )
+
+        # 진행 상황 / 결과는 작업 조회 API로
+        res = self.client.get(
+            reverse("variant-status-job", args=[res.data["job_id"]])
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["kind"], InventoryBatchJob.KIND_ROLLOVER)
+        self.assertEqual(res.data["status"], InventoryBatchJob.STATUS_SUCCEEDED)
+        self.assertEqual((res.data["done"], res.data["total"]), (3, 3))
+        self.assertEqual(res.data["progress"], 100)
+        self.assertEqual(
+            (res.data["result"]["created"], res.data["result"]["skipped"]), (2, 1)
+        )
+
+    def test_background_mode_checks_lock_and_source_before_enqueue(self):
+        from django.db import connections
+        from apps.inventory.services.rollover import ROLLOVER_LOCK_NAMESPACE
+
+        other = connections.create_connection("default")
+        try:
+            with other.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_lock(%s, %s)",
+                    [ROLLOVER_LOCK_NAMESPACE, 202602],
+                )
+            res = self.client.post(self.url + "?background=true")
+            self.assertEqual(res.status_code, 409)
+        finally:
+            with other.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_unlock(%s, %s)",
+                    [ROLLOVER_LOCK_NAMESPACE, 202602],
+                )
+            other.close()
+
+        res = self.client.post(
+            "/api/v1/inventory/variant-status/2026/9?background=true"
+        )
+        self.assertEqual(res.status_code, 404)
+        self.assertFalse(InventoryBatchJob.objects.exists())
+
+
+class VariantStatusRecomputeTest(APITestCase):
+    """
+    POST /inventory/variant-status/recompute/{year}/{month}/
+    이후 달 이월 기초재고 / 기말재고 재계산 (누적합)
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+        self.product = InventoryItem.objects.create(
+            product_id="P99200",
+            name="재계산 상품",
+        )
+        self.a = ProductVariant.objects.create(
+            product=self.product, variant_code="P99200-A", option="A"
+        )
+        self.b = ProductVariant.objects.create(
+            product=self.product, variant_code="P99200-B", option="B"
+        )
+
+        # A: 1월 → 2월 → 3월 (연속), 5월 (4월 없음)
+        self._status(self.a, 1, warehouse_stock_start=10, inbound_quantity=5)
+        self._status(self.a, 2, warehouse_stock_start=10, store_stock_start=5,
+                     store_sales=4)
+        self._status(self.a, 3, warehouse_stock_start=11, inbound_quantity=2)
+        self._status(self.a, 5, warehouse_stock_start=50)
+        InventoryAdjustment.objects.create(
+            variant=self.a, year=2026, month=2, delta=-1, reason="파손",
+            created_by="t",
+        )
+        # B: 이미 올바른 값 → 변경 없음
+        self._status(self.b, 1, warehouse_stock_start=3)
+        self._status(self.b, 2, warehouse_stock_start=3)
+
+    def _status(self, variant, month, **stock):
+        return ProductVariantStatus.objects.create(
+            year=2026, month=month, product=self.product, variant=variant,
+            **stock,
+        )
+
+    def _get(self, variant, month):
+        return ProductVariantStatus.objects.get(
+            year=2026, month=month, variant=variant
+        )
+
+    def test_forward_recompute_after_past_correction(self):
+        # 1월 판매 정정 → 1월 기말재고 15 → 12
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 1, "P99200-A"]),
+            {"store_sales": 3},
+            format="json",
+        )
+        b_version = self._get(self.b, 2).version
+
+        res = self.client.post(
+            reverse("variant-status-recompute", args=[2026, 1]), {}, format="json"
+        )
+        self.assertEqual(res.status_code, 200)
+
+        feb = self._get(self.a, 2)
+        # 기초재고 합 = 1월 기말 12, 매장 5 유지 → 창고 7
+        self.assertEqual(feb.warehouse_stock_start, 7)
+        self.assertEqual(feb.ending_stock, 12 - 4 - 1)
+
+        mar = self._get(self.a, 3)
+        self.assertEqual(mar.warehouse_stock_start, 7)
+        self.assertEqual(mar.ending_stock, 9)
+
+        # 4월이 없으므로 5월은 그대로
+        self.assertEqual(self._get(self.a, 5).warehouse_stock_start, 50)
+
+        # 값이 같은 행은 저장하지 않음
+        self.assertEqual(self._get(self.b, 2).version, b_version)
+        self.assertEqual(res.data["updated"], 2)
+        self.assertEqual(
+            res.data["months"],
+            [
+                {"year": 2026, "month": 2, "updated": 1},
+                {"year": 2026, "month": 3, "updated": 1},
+            ],
+        )
+
+        # 다시 실행 → 변경 없음
+        res = self.client.post(
+            reverse("variant-status-recompute", args=[2026, 1]), {}, format="json"
+        )
+        self.assertEqual(res.data["updated"], 0)
+
+    def test_variant_filter_and_unknown_code(self):
+        ProductVariantStatus.objects.filter(
+            year=2026, month=2, variant=self.b
+        ).update(warehouse_stock_start=0)
+
+        res = self.client.post(
+            reverse("variant-status-recompute", args=[2026, 1]),
+            {"variant_codes": ["P99200-A"]},
+            format="json",
+        )
+        self.assertEqual(self._get(self.b, 2).warehouse_stock_start, 0)
+
+        res = self.client.post(
+            reverse("variant-status-recompute", args=[2026, 1]),
+            {"variant_codes": ["P99200-B", "NOPE"]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.data["variant_codes"], ["NOPE"])
+
+    def test_background_mode(self):
+        self.client.patch(
+            reverse("variant-status-detail", args=[2026, 1, "P99200-A"]),
+            {"store_sales": 3},
+            format="json",
+        )
+
+        res = self.client.post(
+            reverse("variant-status-recompute", args=[2026, 1])
+            + "?background=true",
+            {"variant_codes": ["P99200-A"]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(self._get(self.a, 2).warehouse_stock_start, 7)
+
+        res = self.client.get(
+            reverse("variant-status-job", args=[res.data["job_id"]])
+        )
+        self.assertEqual(res.data["kind"], InventoryBatchJob.KIND_RECOMPUTE)
+        self.assertEqual(res.data["status"], InventoryBatchJob.STATUS_SUCCEEDED)
+        self.assertEqual(res.data["params"], {"variant_ids": [self.a.id]})
+        self.assertEqual((res.data["done"], res.data["result"]["updated"]), (2, 2))
+
+        res = self.client.get(reverse("variant-status-job", args=[999999]))
+        self.assertEqual(res.status_code, 404)
+
+
+class ProductVariantExcelImportBulkTest(ExcelUploadTestMixin, APITestCase):
+    """엑셀 업로드: 행 수와 무관한 쿼리 수 / 중복 행 / 재고조정 반영"""
+
+    def _rows(self, count, prefix="P9700"):
+        return [
+            {
+                "상품코드": f"{prefix}{i % 5}-A",
+                "오프라인 품목명": f"대량 상품 {i % 5}",
+                "온라인 품목명": "",
+                "옵션": f"OPT{i}",
+                "상세옵션": "",
+                "월초창고 재고": i,
+                "월초매장 재고": 1,
+                "당월입고물량": 2,
+                "매장 판매물량": 1,
+                "쇼핑몰 판매물량": 0,
+            }
+            for i in range(count)
+        ]
+
+    def _upload(self, rows):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        url = reverse("variant-excel-upload") + "?year=2026&month=7"
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(
+                url, {"file": self.make_excel_file(rows)}, format="multipart"
+            )
+        self.assertEqual(res.status_code, 201, res.data)
+        return len(ctx.captured_queries), res
+
+    def test_query_count_is_constant(self):
+        small, _ = self._upload(self._rows(5, prefix="P9710"))
+        large, res = self._upload(self._rows(200, prefix="P9720"))
+
+        self.assertEqual(small, large)
+        self.assertEqual(res.data["summary"]["created_variants"], 200)
+        self.assertEqual(res.data["summary"]["created_status"], 200)
+
+    def test_existing_rows_locked_before_diff(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        rows = self._rows(3, prefix="P9730")
+        self._upload(rows)
+
+        url = reverse("variant-excel-upload") + "?year=2026&month=7"
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(
+                url,
+                {"file": self.make_excel_file([{**rows[0], "월초창고 재고": 50}])},
+                format="multipart",
+            )
+        sqls = [query["sql"] for query in ctx.captured_queries]
+        status_table = ProductVariantStatus._meta.db_table
+
+        # 월별 행을 FOR UPDATE로 잠근 뒤 재고조정 합을 읽음
+        lock = next(
+            i for i, sql in enumerate(sqls)
+            if sql.startswith("SELECT") and status_table in sql and "FOR UPDATE" in sql
+        )
+        adjustment = next(
+            i for i, sql in enumerate(sqls) if "inventory_adjustments" in sql
+        )
+        self.assertLess(lock, adjustment)
+
+    def test_duplicate_rows_use_last_row(self):
+        rows = self._rows(1)
+        rows.append({**rows[0], "월초창고 재고": 30})
+
+        _, res = self._upload(rows)
+
+        self.assertEqual(res.data["summary"]["created_variants"], 1)
+        self.assertEqual(res.data["summary"]["skipped_variants"], 1)
+        self.assertEqual(res.data["summary"]["created_status"], 1)
+
+        status_obj = ProductVariantStatus.objects.get(year=2026, month=7)
+        self.assertEqual(status_obj.warehouse_stock_start, 30)
+        self.assertEqual(status_obj.ending_stock, 30 + 1 + 2 - 1)
+
+    def test_existing_adjustment_included_in_ending_stock(self):
+        product = InventoryItem.objects.create(product_id="P97300", name="조정 상품")
+        variant = ProductVariant.objects.create(
+            product=product, option="RED", variant_code="P97300-OLD"
+        )
+        InventoryAdjustment.objects.create(
+            variant=variant,
+            year=2026,
+            month=7,
+            delta=-3,
+            reason="실사",
+            created_by="관리자",
+        )
+
+        _, res = self._upload([
+            {
+                "상품코드": "P97300-RED",
+                "오프라인 품목명": "조정 상품",
+                "온라인 품목명": "",
+                "옵션": "RED",
+                "상세옵션": "",
+                "월초창고 재고": 10,
+                "월초매장 재고": 0,
+                "당월입고물량": 0,
+                "매장 판매물량": 0,
+                "쇼핑몰 판매물량": 0,
+            }
+        ])
+
+        # 코드가 달라도 (상품, 옵션) 일치 → 기존 variant 사용
+        self.assertEqual(res.data["summary"]["created_variants"], 0)
+        status_obj = ProductVariantStatus.objects.get(variant=variant)
+        self.assertEqual(status_obj.ending_stock, 7)
+
+
+class ProductVariantExcelUploadBackgroundTest(ExcelUploadTestMixin, APITestCase):
+    """엑셀 업로드 백그라운드 작업 (chunk 커밋 / 진행 상황 / 롤백 정책)"""
+
+    def setUp(self):
+        import shutil
+        import tempfile
+        from django.test import override_settings
+
+        # 업로드 파일 보관 위치 격리
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.url = reverse("variant-excel-upload") + "?year=2026&month=8&background=true"
+
+    def _rows(self, count):
+        return [
+            {
+                "상품코드": f"P9800{i}-A",
+                "오프라인 품목명": f"백그라운드 상품 {i}",
+                "온라인 품목명": "",
+                "옵션": "A",
+                "상세옵션": "",
+                "월초창고 재고": 10,
+                "월초매장 재고": 0,
+                "당월입고물량": 0,
+                "매장 판매물량": 0,
+                "쇼핑몰 판매물량": 0,
+            }
+            for i in range(count)
+        ]
+
+    def _job(self, job_id):
+        res = self.client.get(
+            reverse("variant-excel-upload-job", kwargs={"job_id": job_id})
+        )
+        self.assertEqual(res.status_code, 200)
+        return res.data
+
+    def test_background_upload_commits_in_chunks(self):
+        from unittest import mock
+
+        with mock.patch(
+            "apps.inventory.services.import_job.IMPORT_JOB_CHUNK_SIZE", 2
+        ):
+            res = self.client.post(
+                self.url, {"file": self.make_excel_file(self._rows(5))}, format="multipart"
+            )
+
+        self.assertEqual(res.status_code, 202)
+        job = self._job(res.data["job_id"])
+
+        self.assertEqual(job["status"], "SUCCEEDED")
+        self.assertEqual(job["total_rows"], 5)
+        self.assertEqual(job["processed_rows"], 5)
+        self.assertEqual(job["progress"], 100)
+        self.assertEqual(job["summary"]["created_variants"], 5)
+        self.assertEqual(job["summary"]["created_status"], 5)
+        self.assertEqual(
+            ProductVariantStatus.objects.filter(year=2026, month=8).count(), 5
+        )
+        # 성공한 작업의 보관 파일은 삭제
+        self.assertFalse(InventoryImportJob.objects.get().file)
+
+    def test_invalid_file_writes_nothing(self):
+        rows = self._rows(4)
+        rows[3]["당월입고물량"] = "많음"
+
+        res = self.client.post(
+            self.url, {"file": self.make_excel_file(rows)}, format="multipart"
+        )
+        job = self._job(res.data["job_id"])
+
+        self.assertEqual(job["status"], "FAILED")
+        self.assertEqual(job["processed_rows"], 0)
+        self.assertIsNone(job["errors"][0]["rows"])
+        self.assertIn("백그라운드 상품 3", job["errors"][0]["detail"])
+        self.assertEqual(ProductVariant.objects.count(), 0)
+
+    def test_failed_chunk_keeps_committed_chunks(self):
+        from unittest import mock
+        from apps.inventory.services import import_job
+
+        calls = []
+        original = import_job.import_normalized_rows
+
+        def fail_second_chunk(rows, year, month):
+            calls.append(len(rows))
+            if len(calls) == 2:
+                original(rows, year, month)
+                raise RuntimeError("chunk 실패")
+            return original(rows, year, month)
+
+        with mock.patch.object(import_job, "IMPORT_JOB_CHUNK_SIZE", 2), \
+                mock.patch.object(import_job, "import_normalized_rows", fail_second_chunk):
+            res = self.client.post(
+                self.url, {"file": self.make_excel_file(self._rows(5))}, format="multipart"
+            )
+
+        job = self._job(res.data["job_id"])
+
+        self.assertEqual(job["status"], "FAILED")
+        self.assertEqual(job["processed_rows"], 2)
+        self.assertEqual(job["errors"][0]["rows"], [6, 7])
+        # 첫 chunk만 반영, 실패한 chunk는 롤백
+        self.assertEqual(ProductVariant.objects.count(), 2)
+        self.assertTrue(InventoryImportJob.objects.get().file)
+
+    def test_unknown_job_returns_404(self):
+        res = self.client.get(
+            reverse("variant-excel-upload-job", kwargs={"job_id": 999999})
+        )
+        self.assertEqual(res.status_code, 404)
+
+
+class StreamExcelTest(ExcelUploadTestMixin, APITestCase):
+    """stream_excel: load_excel과 같은 헤더 / 행, batch 단위 반영"""
+
+    def _rows(self, count):
+        return [
+            {
+                "상품코드": f"P9900{i}-A",
+                "오프라인 품목명": f"스트리밍 상품 {i}",
+                "온라인 품목명": "",
+                "옵션": "A",
+                "상세옵션": "",
+                "월초창고 재고": i,
+                "월초매장 재고": None if i % 2 else 1,
+                "당월입고물량": 0,
+                "매장 판매물량": 0,
+                "쇼핑몰 판매물량": 0,
+            }
+            for i in range(5)
+        ]
+
+    def test_same_headers_and_rows_as_load_excel(self):
+        from apps.inventory.utils.excel import load_excel, stream_excel
+
+        rows = self._rows(5)
+        rows[2] = {key: None for key in rows[2]}  # 중간 빈 행 유지
+
+        upload_file = self.make_excel_file(
+            [{"월초창고\n재고" if k == "월초창고 재고" else k: v for k, v in row.items()}
+             for row in rows]
+        )
+        expected = load_excel(upload_file)
+
+        upload_file.seek(0)
+        columns, batches = stream_excel(upload_file, batch_size=2)
+        batches = list(batches)
+
+        self.assertEqual(columns, list(expected.columns))
+        self.assertIn("월초창고 재고", columns)
+        self.assertEqual([len(df) for df in batches], [2, 2, 1])
+
+        streamed = pd.concat(batches)
+        self.assertEqual(len(streamed), len(expected))
+
+        # 셀 값 그대로(object) → 숫자는 값 기준, 문자는 그대로 비교
+        for col in ["월초창고 재고", "월초매장 재고"]:
+            self.assertEqual(
+                pd.to_numeric(streamed[col]).fillna(0).tolist(),
+                expected[col].fillna(0).tolist(),
+            )
+        for col in ["상품코드", "오프라인 품목명", "옵션"]:
+            self.assertEqual(
+                streamed[col].fillna("").tolist(),
+                expected[col].fillna("").tolist(),
+            )
+
+    def test_upload_spans_multiple_batches(self):
+        from unittest import mock
+
+        rows = self._rows(5)
+        rows.append({**rows[0], "월초창고 재고": 42})  # 다른 batch의 같은 variant
+
+        with mock.patch("apps.inventory.utils.excel.EXCEL_STREAM_BATCH_SIZE", 2):
+            res = self.client.post(
+                reverse("variant-excel-upload") + "?year=2026&month=9",
+                {"file": self.make_excel_file(rows)},
+                format="multipart",
+            )
+
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["summary"]["total_rows"], 6)
+        self.assertEqual(res.data["summary"]["created_variants"], 5)
+        self.assertEqual(res.data["summary"]["created_status"], 5)
+
+        status_obj = ProductVariantStatus.objects.get(
+            year=2026, month=9, variant__variant_code="P99000-A"
+        )
+        self.assertEqual(status_obj.warehouse_stock_start, 42)
+
+
+class VariantResolverIndexTest(APITestCase):
+    """VariantResolverIndex: resolve_variant와 같은 우선순위, 조회 시 쿼리 없음"""
+
+    def setUp(self):
+        self.product = InventoryItem.objects.create(product_id="P99500", name="인덱스 상품")
+        self.red = ProductVariant.objects.create(
+            product=self.product, option="RED", detail_option="M", variant_code="P99500-RED-M"
+        )
+        self.blank = ProductVariant.objects.create(
+            product=self.product, option="", detail_option="", variant_code="P99500-DEFAULT"
+        )
+
+    def test_resolve_matches_resolve_variant(self):
+        from apps.inventory.services.variant_resolver import (
+            VariantResolverIndex,
+            resolve_variant,
+        )
+
+        cases = [
+            ("BLUE", "L", "P99500-RED-M"),   # 코드 우선
+            ("RED", "M", "P99500-OTHER"),    # (상품, 옵션, 상세옵션)
+            ("", "", "P99500-NEW"),          # 옵션 없음 → 기본 variant
+            ("GREEN", "", "P99500-GREEN"),   # 없음
+        ]
+
+        with self.assertNumQueries(1):
+            index = VariantResolverIndex.build(
+                variant_codes=[code for _, _, code in cases],
+                product_ids=[self.product.pk],
+            )
+
+        with self.assertNumQueries(0):
+            resolved = [
+                index.resolve(self.product, opt, detail, code)
+                for opt, detail, code in cases
+            ]
+
+        expected = [
+            resolve_variant(self.product, opt, detail, code)
+            for opt, detail, code in cases
+        ]
+        self.assertEqual(resolved, expected)
+        self.assertEqual(resolved, [self.red, self.red, self.blank, None])
+
+    def test_added_variant_resolves_later_rows(self):
+        from apps.inventory.services.variant_resolver import VariantResolverIndex
+
+        index = VariantResolverIndex.build(product_ids=[self.product.pk])
+        new_variant = ProductVariant(
+            product=self.product, option="GREEN", detail_option="", variant_code="P99500-GREEN"
+        )
+        index.add(new_variant)
+
+        with self.assertNumQueries(0):
+            self.assertIs(index.resolve(self.product, "GREEN", "", "P99500-X"), new_variant)
+            self.assertIs(index.resolve(self.product, "", "", "P99500-GREEN"), new_variant)
+
+
+class ProductVariantExcelUploadChangeOnlyTest(ExcelUploadTestMixin, APITestCase):
+    """재업로드: 바뀐 행만 저장 (unchanged / updated / created)"""
+
+    def _rows(self):
+        return [
+            {
+                "상품코드": f"P9960{i}-A",
+                "오프라인 품목명": f"재업로드 상품 {i}",
+                "온라인 품목명": "",
+                "옵션": "A",
+                "상세옵션": "",
+                "월초창고 재고": 10 + i,
+                "월초매장 재고": 0,
+                "당월입고물량": 0,
+                "매장 판매물량": 0,
+                "쇼핑몰 판매물량": 0,
+            }
+            for i in range(4)
+        ]
+
+    def _upload(self, rows):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        url = reverse("variant-excel-upload") + "?year=2026&month=10"
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(
+                url, {"file": self.make_excel_file(rows)}, format="multipart"
+            )
+        self.assertEqual(res.status_code, 201, res.data)
+
+        writes = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        return res.data["summary"], writes
+
+    def test_unchanged_reupload_only_reads(self):
+        summary, _ = self._upload(self._rows())
+        self.assertEqual(summary["created_status"], 4)
+
+        summary, writes = self._upload(self._rows())
+
+        self.assertEqual(writes, [])
+        self.assertEqual(summary["created_status"], 0)
+        self.assertEqual(summary["updated_status"], 0)
+        self.assertEqual(summary["unchanged_status"], 4)
+
+    def test_only_changed_rows_are_written(self):
+        self._upload(self._rows())
+        before = {
+            s.variant.variant_code: s
+            for s in ProductVariantStatus.objects.select_related("variant")
+        }
+
+        rows = self._rows()
+        rows[1]["매장 판매물량"] = 3
+        rows.append({**rows[0], "상품코드": "P99609-A", "오프라인 품목명": "새 상품"})
+
+        summary, writes = self._upload(rows)
+
+        self.assertEqual(summary["created_status"], 1)
+        self.assertEqual(summary["updated_status"], 1)
+        self.assertEqual(summary["unchanged_status"], 3)
+
+        changed = ProductVariantStatus.objects.get(variant__variant_code="P99601-A")
+        self.assertEqual(changed.store_sales, 3)
+        self.assertEqual(changed.ending_stock, 11 - 3)
+        self.assertEqual(changed.version, before["P99601-A"].version + 1)
+
+        untouched = ProductVariantStatus.objects.get(variant__variant_code="P99602-A")
+        self.assertEqual(untouched.version, before["P99602-A"].version)
+        self.assertEqual(untouched.updated_at, before["P99602-A"].updated_at)
+
+
+class ProductVariantUploadFormatTest(APITestCase):
+    """CSV / Parquet 업로드 (엑셀과 같은 컬럼명)"""
+
+    url = "/api/v1/inventory/variants/upload-excel/?year=2026&month=11"
+
+    def _frame(self):
+        return pd.DataFrame([
+            {
+                "상품코드": "0123-A",
+                "오프라인 품목명": "CSV 상품",
+                "온라인 품목명": "",
+                "옵션": "A",
+                "상세옵션": "",
+                "월초창고\n재고": 7,
+                "월초매장 재고": 1,
+                "당월입고물량": 2,
+                "매장 판매물량": 1,
+                "쇼핑몰 판매물량": None,
+            }
+        ])
+
+    def _post(self, name, content):
+        upload_file = SimpleUploadedFile(name, content)
+        return self.client.post(self.url, {"file": upload_file}, format="multipart")
+
+    def _assert_imported(self, res):
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["summary"]["created_status"], 1)
+
+        # 상품코드 앞자리 0 유지
+        status_obj = ProductVariantStatus.objects.get(
+            year=2026, month=11, variant__variant_code="0123-A"
+        )
+        self.assertEqual(status_obj.warehouse_stock_start, 7)
+        self.assertEqual(status_obj.ending_stock, 7 + 1 + 2 - 1)
+
+    def test_csv_utf8_upload(self):
+        content = self._frame().to_csv(index=False).encode("utf-8-sig")
+        self._assert_imported(self._post("inventory.csv", content))
+
+    def test_csv_cp949_upload(self):
+        content = self._frame().to_csv(index=False).encode("cp949")
+        self._assert_imported(self._post("inventory.CSV", content))
+
+    def test_csv_decimal_quantity_rejected(self):
+        frame = self._frame()
+        frame["월초창고\n재고"] = "3.7"
+        res = self._post("inventory.csv", frame.to_csv(index=False).encode("utf-8"))
+
+        # 3으로 잘려 저장되지 않고 변환 실패로 거부
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("숫자 변환 실패: 3.7", res.data["detail"])
+        self.assertFalse(ProductVariantStatus.objects.exists())
+
+    def test_csv_export_round_trip(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self._assert_imported(
+            self._post("inventory.csv", self._frame().to_csv(index=False).encode())
+        )
+
+        res = self.client.get(
+            reverse("variant-export"), {"year": 2026, "month": 11, "format": "csv"}
+        )
+        self.assertEqual(res.status_code, 200)
+        content = b"".join(res.streaming_content) if res.streaming else res.content
+
+        ProductVariantStatus.objects.all().delete()
+        self._assert_imported(self._post("export.csv", content))
+
+    def test_parquet_upload(self):
+        from apps.inventory.utils import excel
+
+        if excel.pq is None:
+            self.skipTest("pyarrow 미설치")
+
+        buffer = io.BytesIO()
+        self._frame().to_parquet(buffer, index=False)
+        self._assert_imported(self._post("inventory.parquet", buffer.getvalue()))
+
+    def test_parquet_without_pyarrow_returns_400(self):
+        from unittest import mock
+
+        with mock.patch("apps.inventory.utils.excel.pq", None):
+            res = self._post("inventory.parquet", b"PAR1")
+
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("pyarrow", res.data["error"])
+
+
+class BenchmarkInventoryImportCommandTest(APITestCase):
+
+    def test_small_run_reports_and_rolls_back(self):
+        from django.core.management import call_command
+
+        out = io.StringIO()
+        call_command(
+            "benchmark_inventory_import",
+            "--rows", "20",
+            "--format", "csv",
+            "--skip-memory",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn("upload", output)
+        self.assertIn("reupload", output)
+        self.assertIn("'unchanged_status': 20", output)
+
+        # 측정 중 변경은 모두 롤백
+        self.assertFalse(InventoryItem.objects.filter(name__startswith="BIMP").exists())
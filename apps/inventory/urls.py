@@ -8,6 +8,7 @@ from .views import (
     ProductListSimpleView,
     # Upload
     ProductVariantExcelUploadView,
+    ProductVariantExcelUploadJobView,
     # ProductVariant
     ProductVariantView,
     ProductVariantDetailView,
@@ -19,6 +20,9 @@ from .views import (
     ProductVariantStatusDetailView,
     ProductVariantStatusBulkUpdateView,
     ProductVariantStatusCreateView,
+    ProductVariantStatusRecomputeView,
+    ProductVariantStatusJobView,
+    ProductVariantStatusSummaryView,
     SyncInboundFromOrdersView
 )
 
@@ -47,6 +51,11 @@ urlpatterns = [
         ProductVariantExcelUploadView.as_view(),
         name="variant-excel-upload",
     ),
+    path(
+        "variants/upload-excel/jobs/<int:job_id>/",
+        ProductVariantExcelUploadJobView.as_view(),
+        name="variant-excel-upload-job",
+    ),
 
     path(
         "variants/<str:variant_code>/",
@@ -58,6 +67,11 @@ urlpatterns = [
         ProductVariantStatusListView.as_view(),
         name="variant-status-list",
     ),
+    path(
+        "variant-status/summary/",
+        ProductVariantStatusSummaryView.as_view(),
+        name="variant-status-summary",
+    ),
     path(
     "variant-status/<int:year>/<int:month>/<str:variant_code>/",
     ProductVariantStatusDetailView.as_view(),
@@ -72,6 +86,16 @@ urlpatterns = [
     ProductVariantStatusBulkUpdateView.as_view(),
     name="variant-status-bulk"
     ),
+    path(
+        "variant-status/recompute/<int:year>/<int:month>/",
+        ProductVariantStatusRecomputeView.as_view(),
+        name="variant-status-recompute",
+    ),
+    path(
+        "variant-status/jobs/<int:job_id>/",
+        ProductVariantStatusJobView.as_view(),
+        name="variant-status-job",
+    ),
     path(
         "variant-status/sync-inbound/<int:year>/<int:month>/",
         SyncInboundFromOrdersView.as_view(),
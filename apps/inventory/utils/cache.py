@@ -0,0 +1,122 @@
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# 월별 재고 현황 응답 캐시
+# - 키에 (year, month) 버전 + 상품 정보 버전을 포함
+# - 해당 월을 수정하는 쪽에서 버전을 올리면 이전 키는 자연히 만료
+MONTH_VERSION_KEY = "inventory:variant-status:{year}:{month}:version"
+ALL_MONTHS_VERSION_KEY = "inventory:variant-status:all:version"
+CATALOG_VERSION_KEY = "inventory:catalog:version"
+
+
+def _get_version(key):
+    # 키가 없으면(최초/eviction) 현재 시각 기반 값으로 시작 → 이전 버전과 겹치지 않음
+    return cache.get_or_set(key, time.time_ns, timeout=None)
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def _bump_safely(*keys):
+    try:
+        for key in keys:
+            _bump_version(key)
+    except Exception:
+        logger.exception("inventory cache invalidation failed")
+
+
+def _bump_now_and_on_commit(*keys):
+    # 즉시 + 커밋 직후 한 번 더
+    # (커밋 전에 읽힌 이전 데이터가 새 버전 키로 저장되는 경우 방지)
+    _bump_safely(*keys)
+    transaction.on_commit(lambda: _bump_safely(*keys))
+
+
+def _params_digest(request):
+    # 쿼리 파라미터(필터, 페이지, 정렬, format) 해시
+    params = sorted(
+        (k, v) for k in request.query_params for v in request.query_params.getlist(k)
+    )
+    return hashlib.md5(repr(params).encode("utf-8")).hexdigest()
+
+
+def invalidate_variant_status_cache(year, month):
+    """해당 월 재고 현황(목록/Export) 캐시 무효화"""
+    _bump_now_and_on_commit(
+        MONTH_VERSION_KEY.format(year=int(year), month=int(month)),
+        ALL_MONTHS_VERSION_KEY,
+    )
+
+
+def invalidate_catalog_cache():
+    """상품/옵션 정보 변경 → 모든 월 재고 현황 캐시 무효화"""
+    _bump_now_and_on_commit(CATALOG_VERSION_KEY)
+
+
+def variant_status_cache_key(prefix, request, watermark=None):
+    """
+    요청 기준 캐시 키
+    - year, month 지정 시 해당 월 버전, 미지정 시 전체 버전 사용
+    - 나머지 쿼리 파라미터(필터, 페이지, 정렬)는 해시로 포함
+    - scheme + host 포함 (응답의 next/previous가 절대 URL → 프록시 / 직접 접속별로 따로 캐시)
+    - watermark(조건부 GET 기준값) 지정 시 함께 해시
+      → 캐시 무효화를 거치지 않은 변경도 ETag와 응답 본문이 같이 바뀜
+    - year/month 형식 오류면 None (캐시 사용 안 함)
+    """
+    year = request.query_params.get("year")
+    month = request.query_params.get("month")
+
+    try:
+        if year and month:
+            version_key = MONTH_VERSION_KEY.format(year=int(year), month=int(month))
+        else:
+            version_key = ALL_MONTHS_VERSION_KEY
+
+        month_version = _get_version(version_key)
+        catalog_version = _get_version(CATALOG_VERSION_KEY)
+    except ValueError:
+        return None
+    except Exception:
+        logger.exception("inventory cache unavailable")
+        return None
+
+    digest = _params_digest(request)
+    origin = f"{request.scheme}://{request.get_host()}"
+    digest += hashlib.md5(origin.encode("utf-8")).hexdigest()
+    if watermark is not None:
+        digest += hashlib.md5(repr(watermark).encode("utf-8")).hexdigest()
+
+    return (
+        f"inventory:{prefix}:{year or 'all'}:{month or 'all'}:"
+        f"{month_version}:{catalog_version}:{digest}"
+    )
+
+
+def get_cached(key):
+    if key is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception:
+        logger.exception("inventory cache get failed")
+        return None
+
+
+def set_cached(key, value):
+    if key is None:
+        return
+    try:
+        cache.set(key, value, timeout=settings.VARIANT_STATUS_CACHE_TIMEOUT)
+    except Exception:
+        logger.exception("inventory cache set failed")
@@ -0,0 +1,117 @@
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from apps.inventory.models import (
+    InventoryAdjustment,
+    InventoryItem,
+    ProductVariant,
+    ProductVariantStatus,
+)
+
+# 조건부 GET (ETag / Last-Modified)
+# - 변경 기준값(watermark): 행 수 + 최대 id + 최대 updated_at
+#   · 행 수: 삭제 감지 / 최대 id: 삭제 후 재생성 감지 / 최대 updated_at: 수정 감지
+# - 기준값은 캐시하지 않고 요청마다 DB에서 계산 (인덱스 집계, 테이블당 쿼리 1번)
+#   → 캐시 무효화를 거치지 않은 변경(관리자 / 다른 프로세스)도 바로 반영
+
+
+def _table_watermark(queryset, updated_field):
+    row = queryset.order_by().aggregate(
+        count=Count("id"),
+        last_id=Max("id"),
+        updated=Max(updated_field),
+    )
+    return [row["count"], row["last_id"], row["updated"]]
+
+
+def catalog_watermark():
+    """상품(InventoryItem) + 옵션(ProductVariant) 변경 기준값"""
+    return [
+        *_table_watermark(InventoryItem.objects.all(), "updated_at"),
+        *_table_watermark(ProductVariant.objects.all(), "updated_at"),
+    ]
+
+
+def variant_status_watermark(year, month):
+    """월별 재고 현황 변경 기준값 (재고 행 + 재고조정 + 상품 정보)"""
+    return [
+        *_table_watermark(
+            ProductVariantStatus.objects.filter(year=year, month=month),
+            "updated_at",
+        ),
+        *_table_watermark(
+            InventoryAdjustment.objects.filter(year=year, month=month),
+            "created_at",
+        ),
+        *catalog_watermark(),
+    ]
+
+
+def variant_status_request_watermark(request):
+    # year/month 누락·형식 오류는 뷰에서 400 처리 → 조건부 처리 생략
+    try:
+        year = int(request.query_params.get("year"))
+        month = int(request.query_params.get("month"))
+    except (TypeError, ValueError):
+        return None
+
+    return variant_status_watermark(year, month)
+
+
+def catalog_request_watermark(request):
+    return catalog_watermark()
+
+
+def conditional_get(watermark_func):
+    """
+    APIView.get 데코레이터
+    - 기준값 + 요청 URL + 응답 형식으로 ETag 생성
+    - If-None-Match 일치 → 304 (직렬화 없음)
+    - 기준값은 request.conditional_watermark로 뷰에 전달 (응답 캐시 키용)
+    - 200 응답에 ETag / Last-Modified 헤더 추가
+
+    Last-Modified는 정보 제공용으로만 내려줌
+    (삭제는 updated_at으로 드러나지 않아 If-Modified-Since 단독 판단은 하지 않음)
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            watermark = watermark_func(request)
+            if watermark is None:
+                return view_method(self, request, *args, **kwargs)
+
+            # 뷰의 응답 캐시 키에도 같은 기준값 사용 (ETag와 본문 일치)
+            request.conditional_watermark = watermark
+
+            source = repr(
+                (
+                    watermark,
+                    request.get_full_path(),
+                    getattr(request, "accepted_media_type", None),
+                )
+            )
+            etag = quote_etag(hashlib.md5(source.encode("utf-8")).hexdigest())
+
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                return not_modified
+
+            response = view_method(self, request, *args, **kwargs)
+
+            if response.status_code == 200:
+                response["ETag"] = etag
+                updated = [value for value in watermark if hasattr(value, "timestamp")]
+                if updated:
+                    response["Last-Modified"] = http_date(max(updated).timestamp())
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,16 +1,274 @@
+import codecs
+import io
+from contextlib import contextmanager
+from itertools import chain, repeat
+from zipfile import BadZipFile
+
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
 
-def load_excel(file):
-    df = pd.read_excel(file, header=2)
-    df.columns = (
-        df.columns
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 미설치 환경은 Parquet 업로드 불가 (400)
+    pq = None
+
+
+# 업로드 필수 컬럼 (load_excel 헤더 정규화 이후 기준)
+REQUIRED_COLUMNS = [
+    "상품코드",
+    "오프라인 품목명",
+    "온라인 품목명",
+    "옵션",
+    "상세옵션",
+    "월초창고 재고",
+    "월초매장 재고",
+    "당월입고물량",
+    "매장 판매물량",
+    "쇼핑몰 판매물량",
+]
+
+# 다운로드 컬럼 (엑셀 컬럼명, ProductVariantStatus 기준 조회 필드)
+# - 업로드 양식과 동일한 컬럼명 → 내려받은 파일을 그대로 다시 업로드 가능
+# - 업로드 시 참고용 컬럼(재고조정, 기말 재고)은 무시됨
+EXPORT_COLUMNS = [
+    ("상품코드", "variant__variant_code"),
+    ("오프라인 품목명", "product__name"),
+    ("온라인 품목명", "product__online_name"),
+    ("옵션", "variant__option"),
+    ("상세옵션", "variant__detail_option"),
+    ("월초창고 재고", "warehouse_stock_start"),
+    ("월초매장 재고", "store_stock_start"),
+    ("당월입고물량", "inbound_quantity"),
+    ("매장 판매물량", "store_sales"),
+    ("쇼핑몰 판매물량", "online_sales"),
+    ("재고조정", "adjustment_total"),
+    ("기말 재고", "ending_stock"),
+    ("카테고리", "product__category"),
+    ("대분류", "product__big_category"),
+    ("중분류", "product__middle_category"),
+    ("설명", "product__description"),
+]
+
+# load_excel(header=2) 기준 헤더 위 2행
+EXCEL_HEADER_ROW = 2
+
+
+# stream_excel 한 번에 돌려주는 행 수
+EXCEL_STREAM_BATCH_SIZE = 5000
+
+
+def normalize_headers(columns):
+    # 줄바꿈 / 연속 공백 → 공백 하나
+    return (
+        pd.Index(columns)
         .str.replace("\n", " ", regex=False)
         .str.replace(r"\s+", " ", regex=True)
         .str.strip()
     )
+
+
+def load_excel(file):
+    df = pd.read_excel(file, header=EXCEL_HEADER_ROW)
+    df.columns = normalize_headers(df.columns)
     return df
 
 
+def _header_labels(header_row):
+    # pd.read_excel과 같은 이름 규칙 (빈 칸: "Unnamed: i", 중복: "이름.1")
+    labels, seen = [], {}
+    for i, value in enumerate(header_row):
+        label = f"Unnamed: {i}" if value is None else str(value)
+        if label in seen:
+            seen[label] += 1
+            label = f"{label}.{seen[label]}"
+        else:
+            seen[label] = 0
+        labels.append(label)
+    return labels
+
+
+def _iter_sheet_batches(workbook, rows, width, columns, batch_size):
+    # index: 엑셀 행 번호 (헤더 바로 다음 행부터)
+    batch, start, pending_blank = [], EXCEL_HEADER_ROW + 2, 0
+
+    def frame():
+        return pd.DataFrame(
+            batch,
+            columns=columns,
+            index=pd.RangeIndex(start, start + len(batch)),
+            dtype=object,
+        )
+
+    try:
+        for row in rows:
+            values = (tuple(row[:width]) + (None,) * width)[:width]
+
+            # 빈 행: 뒤에 값 있는 행이 나올 때만 반영 (read_excel은 끝쪽 빈 행 제외)
+            if all(value is None for value in values):
+                pending_blank += 1
+                continue
+
+            for values_row in chain(repeat((None,) * width, pending_blank), [values]):
+                batch.append(values_row)
+                if len(batch) >= batch_size:
+                    yield frame()
+                    start += len(batch)
+                    batch = []
+            pending_blank = 0
+
+        if batch:
+            yield frame()
+    finally:
+        workbook.close()
+
+
+def stream_excel(file, batch_size=None):
+    """
+    load_excel 스트리밍 버전 (메모리 사용량 = batch 크기 기준)
+
+    - openpyxl read_only 모드로 첫 번째 시트를 한 행씩 읽음
+    - 헤더 위치 / 헤더 정규화는 load_excel과 동일
+    - 값은 셀 값 그대로(object dtype) → batch마다 타입 추론이 달라지지 않음
+    - xlsx가 아닌 파일(xls)은 load_excel로 읽어 batch로 나눔
+
+    반환값: (컬럼 목록, DataFrame batch generator)
+      batch index = 엑셀 행 번호
+    """
+    batch_size = batch_size or EXCEL_STREAM_BATCH_SIZE
+
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except (InvalidFileException, BadZipFile):
+        file.seek(0)
+        df = load_excel(file)
+        df.index += EXCEL_HEADER_ROW + 2
+        batches = (
+            df.iloc[start:start + batch_size]
+            for start in range(0, len(df), batch_size)
+        )
+        return list(df.columns), batches
+
+    rows = workbook.worksheets[0].iter_rows(values_only=True)
+    for _ in range(EXCEL_HEADER_ROW):
+        next(rows, None)
+
+    header_row = next(rows, None) or ()
+    columns = list(normalize_headers(_header_labels(header_row)))
+
+    return columns, _iter_sheet_batches(
+        workbook, rows, len(columns), columns, batch_size
+    )
+
+
+# 업로드 파일 형식 (확장자 기준, 그 외는 엑셀)
+CSV_EXTENSIONS = (".csv",)
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+
+def _csv_encoding(file):
+    # 앞부분이 UTF-8로 읽히면 utf-8-sig(BOM 허용), 아니면 엑셀 기본 CSV 인코딩(cp949)
+    file.seek(0)
+    sample = file.read(64 * 1024)
+    file.seek(0)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8-sig"
+
+
+@contextmanager
+def _text_stream(file, encoding):
+    # 업로드 파일(mode 없음)은 pandas가 encoding을 무시 → 직접 텍스트로 감쌈
+    # (끝나면 detach: 업로드 파일은 닫지 않음)
+    file.seek(0)
+    text = io.TextIOWrapper(file, encoding=encoding, newline="")
+    try:
+        yield text
+    finally:
+        text.detach()
+
+
+def stream_csv(file, batch_size=None):
+    """
+    CSV 업로드 읽기 (첫 줄 헤더, 헤더 정규화는 load_excel과 동일)
+
+    - batch_size 행씩 pd.read_csv(chunksize)로 읽음
+    - 인코딩: UTF-8(BOM 허용) 또는 CP949 자동 판별
+    - 값은 문자열 그대로 (상품코드 앞자리 0 유지, 수량 변환은 int_column)
+    - 빈 줄은 건너뜀
+
+    반환값: (컬럼 목록, DataFrame batch generator)
+      batch index = CSV 줄 번호 (헤더 = 1)
+    """
+    batch_size = batch_size or EXCEL_STREAM_BATCH_SIZE
+    encoding = _csv_encoding(file)
+
+    with _text_stream(file, encoding) as text:
+        header = pd.read_csv(text, dtype=str, nrows=0)
+    columns = list(normalize_headers(header.columns))
+
+    def batches():
+        with _text_stream(file, encoding) as text:
+            with pd.read_csv(text, dtype=str, chunksize=batch_size) as reader:
+                for df in reader:
+                    df.columns = columns
+                    df.index += 2
+                    yield df
+
+    return columns, batches()
+
+
+def stream_parquet(file, batch_size=None):
+    """
+    Parquet 업로드 읽기 (컬럼명 정규화는 load_excel과 동일)
+
+    - pyarrow row group을 batch_size 행씩 읽어 DataFrame으로 변환
+      (숫자 컬럼은 복사 없이 변환)
+    - pyarrow 미설치 시 ValueError
+
+    반환값: (컬럼 목록, DataFrame batch generator)
+      batch index = 행 번호 (1부터)
+    """
+    if pq is None:
+        raise ValueError("Parquet 업로드에는 pyarrow 패키지가 필요합니다.")
+
+    batch_size = batch_size or EXCEL_STREAM_BATCH_SIZE
+    parquet_file = pq.ParquetFile(file)
+    columns = list(normalize_headers(parquet_file.schema_arrow.names))
+
+    def batches():
+        start = 1
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+            df = record_batch.to_pandas()
+            df.columns = columns
+            df.index = pd.RangeIndex(start, start + len(df))
+            start += len(df)
+            yield df
+
+    return columns, batches()
+
+
+def stream_upload(file, file_name=None, batch_size=None):
+    """
+    업로드 파일 형식별 스트리밍 읽기 (확장자 기준)
+    - .csv: stream_csv / .parquet, .pq: stream_parquet / 그 외: stream_excel
+    - 컬럼명은 모두 엑셀 업로드 양식(REQUIRED_COLUMNS) 기준
+
+    반환값: (컬럼 목록, DataFrame batch generator)
+      batch index = 원본 파일 행 번호 (오류 위치 표시용)
+    """
+    name = (file_name or getattr(file, "name", "") or "").lower()
+
+    if name.endswith(CSV_EXTENSIONS):
+        return stream_csv(file, batch_size)
+    if name.endswith(PARQUET_EXTENSIONS):
+        return stream_parquet(file, batch_size)
+    return stream_excel(file, batch_size)
+
+
 def safe_str(row, col):
     val = row.get(col)
     if pd.isna(val):
@@ -33,3 +291,47 @@ def safe_int(row, col):
         return int(val)
     except (ValueError, TypeError):
         raise ValueError(f"{col} 숫자 변환 실패: {val}")
+
+
+# ----- 컬럼 단위 변환 (safe_str / safe_int의 벡터 버전) -----
+
+def str_column(df, col):
+    """
+    safe_str 컬럼 버전
+    - NaN / 컬럼 없음 → ""
+    - 나머지는 str(값).strip()
+    """
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+
+    values = df[col]
+    return values.astype(str).str.strip().where(values.notna(), "")
+
+
+def int_column(df, col):
+    """
+    safe_int 컬럼 버전
+    - NaN / 빈 문자열 / 컬럼 없음 → 0
+    - 소수("3.7", 3.7)는 버리지 않고 변환 실패로 표시 (수량이 조용히 잘리지 않도록)
+    - 반환값: (int64 Series, 변환 실패 행 mask)
+    """
+    if col not in df.columns:
+        zeros = pd.Series(0, index=df.index, dtype="int64")
+        return zeros, pd.Series(False, index=df.index)
+
+    values = df[col]
+
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        numbers = values.astype("float64")
+        blank = values.isna()
+    else:
+        text = values.astype(str).str.strip()
+        blank = values.isna() | (text == "")
+        numbers = pd.to_numeric(text.where(~blank, "0"), errors="coerce")
+
+    numbers = numbers.where(~blank, 0)
+    finite = numbers.fillna(0)
+    invalid = numbers.isna() | ~np.isfinite(finite) | (finite != np.trunc(finite))
+
+    result = numbers.where(~invalid, 0).astype("int64")
+    return result, invalid
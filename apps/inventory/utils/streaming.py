@@ -0,0 +1,67 @@
+import csv
+import tempfile
+
+from django.http import FileResponse, StreamingHttpResponse
+from openpyxl import Workbook
+
+
+class Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 pseudo buffer"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(header, rows):
+    """
+    header + rows를 CSV 한 줄씩 yield
+    - 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함
+    """
+    writer = csv.writer(Echo())
+
+    yield "\ufeff" + writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def csv_response(filename, header, rows):
+    """
+    CSV 스트리밍 응답
+    - rows는 iterator로 받아 한 줄씩 전송 → 메모리 사용량 일정
+    """
+    response = StreamingHttpResponse(
+        iter_csv(header, rows),
+        content_type="text/csv; charset=utf-8",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def xlsx_response(filename, header, rows, title_rows=()):
+    """
+    XLSX 다운로드 응답
+    - openpyxl write-only 모드: 행을 바로 임시 파일에 기록 (메모리 사용량 일정)
+    - title_rows: 헤더 위에 들어갈 행 (업로드 양식의 header=2 위치 맞춤용)
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+
+    for title_row in title_rows:
+        sheet.append(list(title_row))
+
+    sheet.append(list(header))
+    for row in rows:
+        sheet.append(list(row))
+
+    tmp = tempfile.TemporaryFile()
+    workbook.save(tmp)
+    tmp.seek(0)
+
+    return FileResponse(
+        tmp,
+        as_attachment=True,
+        filename=filename,
+        content_type=(
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        ),
+    )
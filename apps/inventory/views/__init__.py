@@ -4,5 +4,6 @@ from .variant import *
 from .variant_upload import *
 from .variant_status_export import *
 from .variant_status import *
+from .variant_status_summary import *
 from .adjustment import *
 from .sync_data import *
@@ -4,6 +4,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status, generics
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
 
 # Swagger
 from drf_yasg import openapi
@@ -21,6 +22,7 @@ from ..models import (
 )
 
 from ..filters import InventoryAdjustmentFilter
+from ..utils.cache import invalidate_variant_status_cache
 
 class InventoryAdjustmentView(generics.ListCreateAPIView):
     """
@@ -33,8 +35,8 @@ class InventoryAdjustmentView(generics.ListCreateAPIView):
 
     POST /inventory/adjustments/
     - 재고 조정 이력 생성
-    - 생성 시 ProductVariantStatus(year, month)에
-      stock_adjustment 누적 반영
+    - 생성 시 ProductVariantStatus(year, month)의
+      ending_stock 누적 반영
     """
 
     permission_classes = [AllowAny]
@@ -108,7 +110,7 @@ class InventoryAdjustmentView(generics.ListCreateAPIView):
             "처리 흐름:\n"
             "1. InventoryAdjustment 생성 (이력 저장)\n"
             "2. 해당 year/month의 ProductVariantStatus 조회 또는 생성\n"
-            "3. stock_adjustment에 delta 누적 반영\n\n"
+            "3. ending_stock(기말재고)에 delta 누적 반영\n\n"
         ),
         tags=["inventory - Stock Adjust"],
         request_body=openapi.Schema(
@@ -150,17 +152,21 @@ class InventoryAdjustmentView(generics.ListCreateAPIView):
             context={"request": request} 
         )
         serializer.is_valid(raise_exception=True)
-        adjustment = serializer.save()
 
-        # ProductVariantStatus 반영
-        ProductVariantStatus.objects.get_or_create(
-            year=adjustment.year,
-            month=adjustment.month,
-            variant=adjustment.variant,
-            defaults={
-                "product": adjustment.variant.product,
-            },
-        )
+        with transaction.atomic():
+            # 기존 ProductVariantStatus가 있으면 ending_stock에 delta 누적
+            adjustment = serializer.save()
+
+            # 없으면 생성 (생성 시 ending_stock은 조정 합 포함 재계산)
+            ProductVariantStatus.objects.get_or_create(
+                year=adjustment.year,
+                month=adjustment.month,
+                variant=adjustment.variant,
+                defaults={
+                    "product": adjustment.variant.product,
+                },
+            )
+            invalidate_variant_status_cache(adjustment.year, adjustment.month)
 
         output_serializer = InventoryAdjustmentSerializer(adjustment)
 
@@ -19,6 +19,7 @@ from ..models import (
     InventoryItem,
     ProductVariant
 )
+from ..utils.conditional import catalog_request_watermark, conditional_get
 
 # 빠른 값 조회용 엔드포인트
 class ProductOptionListView(APIView):
@@ -33,6 +34,7 @@ class ProductOptionListView(APIView):
         responses={200: InventoryItemSummarySerializer(many=True)},
         tags=["inventory - View"],
     )
+    @conditional_get(catalog_request_watermark)
     def get(self, request):
         variants = (
             ProductVariant.objects
@@ -87,6 +89,7 @@ class InventoryCategoryListView(APIView):
         },
         tags=["inventory - View"],
     )
+    @conditional_get(catalog_request_watermark)
     def get(self, request):
         qs = InventoryItem.objects.all()
 
@@ -1,9 +1,3 @@
-# Django
-from datetime import date
-
-from django.db import transaction
-from django.db.models import Sum, Q
-
 # DRF
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -13,28 +7,29 @@ from rest_framework.permissions import AllowAny
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
-# Models
-from apps.orders.models import Order, OrderItem
-from apps.inventory.models import (
-    ProductVariant,
-    ProductVariantStatus,
-)
+# Services
+from apps.inventory.services.inbound_sync import sync_inbound_from_orders
 
 
 class SyncInboundFromOrdersView(APIView):
     permission_classes = [AllowAny]
 
     @swagger_auto_schema(
-        operation_summary="발주 기준 재고 입고량 자동 반영",
+        operation_summary="발주 기준 입고량 대사",
         operation_description=(
-            "해당 월 발주 데이터를 기준으로\n"
-            "ProductVariantStatus.inbound_quantity를 자동 갱신합니다.\n\n"
+            "해당 월 완료 발주 수량과\n"
+            "ProductVariantStatus.order_inbound_quantity(발주 입고분)를 비교해 어긋난 행만 바로잡습니다.\n"
+            "(입고량은 주문 완료 / 삭제 시 자동 반영되므로 평소에는 호출할 필요 없음)\n\n"
             "기준:\n"
-            "- completed_at 있으면 completed_at\n"
-            "- 없으면 expected_delivery_date\n\n"
+            "- COMPLETED 주문의 completed_at (설정 시간대 기준 날짜)\n\n"
             "동작:\n"
-            "- variant별 발주 수량 합계\n"
-            "- inbound_quantity 덮어쓰기"
+            "- variant별 완료 발주 수량 합계\n"
+            "- 해당 월 행 없으면 생성, 발주 입고분이 다르면 그 차이만큼 입고량 / 기말재고 조정\n"
+            "- 입고량 중 수기 / 엑셀 입력분은 유지\n"
+            "- 완료 발주가 없어진 행의 발주 입고분은 0으로\n\n"
+            "응답: checked = 대사한 variant 수, "
+            "updated = 바로잡은 행 수, discrepancies = 바로잡은 행 목록 "
+            "(before / after: 발주 입고분, 행이 없었으면 before null)"
         ),
         manual_parameters=[
             openapi.Parameter(
@@ -52,11 +47,19 @@ class SyncInboundFromOrdersView(APIView):
         ],
         responses={
             200: openapi.Response(
-                description="동기화 결과",
+                description="대사 결과",
                 examples={
                     "application/json": {
                         "message": "발주 데이터 반영 완료",
-                        "updated": 12
+                        "checked": 12,
+                        "updated": 1,
+                        "discrepancies": [
+                            {
+                                "variant_code": "P00000XN000A",
+                                "before": 3,
+                                "after": 7,
+                            }
+                        ],
                     }
                 }
             )
@@ -71,64 +74,6 @@ class SyncInboundFromOrdersView(APIView):
                 status=400
             )
 
-        start = date(year, month, 1)
-        if month == 12:
-            end = date(year + 1, 1, 1)
-        else:
-            end = date(year, month + 1, 1)
-
-        # 1. 해당 월 주문 필터
-        orders = Order.objects.filter(
-            Q(
-                completed_at__isnull=False,
-                completed_at__gte=start,
-                completed_at__lt=end,
-            )
-            |
-            Q(
-                completed_at__isnull=True,
-                expected_delivery_date__gte=start,
-                expected_delivery_date__lt=end,
-            )
-        )
-
-        # 2. variant별 수량 집계
-        summary = (
-            OrderItem.objects
-            .filter(order__in=orders)
-            .values("variant")
-            .annotate(total_qty=Sum("quantity"))
-        )
-
-        updated = 0
-
-        with transaction.atomic():
-
-            for row in summary:
-                variant_id = row["variant"]
-                qty = row["total_qty"]
-
-                variant = ProductVariant.objects.get(id=variant_id)
-
-                status_obj, _ = ProductVariantStatus.objects.get_or_create(
-                    year=year,
-                    month=month,
-                    variant=variant,
-                    defaults={
-                        "product": variant.product,
-                        "inbound_quantity": qty,
-                    }
-                )
-
-                # 이미 있으면 덮어쓰기
-                status_obj.inbound_quantity = qty
-                status_obj.save(update_fields=["inbound_quantity"])
-
-                updated += 1
+        result = sync_inbound_from_orders(year, month)
 
-        return Response(
-            {
-                "message": "발주 데이터 반영 완료",
-                "updated": updated
-            }
-        )
+        return Response({"message": "발주 데이터 반영 완료", **result})
@@ -4,6 +4,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.settings import api_settings
 from django_filters.rest_framework import DjangoFilterBackend
 
 # Swagger
@@ -22,6 +23,8 @@ from ..models import (
 )
 
 from ..filters import ProductVariantFilter
+from ..renderers import CompactJSONRenderer
+from ..utils.cache import invalidate_catalog_cache
 
 # 상품 상세 정보 관련 View
 class ProductVariantView(APIView):
@@ -33,6 +36,7 @@ class ProductVariantView(APIView):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProductVariantFilter
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, CompactJSONRenderer]
 
     @swagger_auto_schema(
         operation_summary="상품 상세 정보 생성",
@@ -162,6 +166,7 @@ class ProductVariantView(APIView):
 
         if serializer.is_valid():
             serializer.save()
+            invalidate_catalog_cache()
             return Response(
                 ProductVariantSerializer(serializer.instance).data,
                 status=201
@@ -216,6 +221,14 @@ class ProductVariantView(APIView):
                 type=openapi.TYPE_STRING,
                 description="소분류",
             ),
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["compact"],
+                required=False,
+                description="compact: 컬럼형 JSON (columns + rows)",
+            ),
         ],
         responses={200: ProductVariantSerializer(many=True)},
     )
@@ -333,6 +346,7 @@ class ProductVariantDetailView(APIView):
 
         if serializer.is_valid():
             serializer.save()
+            invalidate_catalog_cache()
 
             return Response(
                 ProductVariantSerializer(
@@ -368,6 +382,7 @@ class ProductVariantDetailView(APIView):
 
         variant.is_active = False
         variant.save(update_fields=["is_active"])
+        invalidate_catalog_cache()
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -7,8 +7,12 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
 
-from django.db import transaction
-from django.db.models import Sum
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from rest_framework.filters import OrderingFilter
 
 # Swagger
 from drf_yasg import openapi
@@ -17,17 +21,39 @@ from drf_yasg.utils import swagger_auto_schema
 
 # Serializer, Model
 from ..serializers import (
-   ProductVariantStatusSerializer
+   InventoryBatchJobSerializer,
+   ProductVariantStatusSerializer,
 )
 
 from ..models import (
+    InventoryBatchJob,
     ProductVariant,
     ProductVariantStatus,
-    InventoryAdjustment
 )
 
 from ..filters import ProductVariantStatusFilter
-from rest_framework.pagination import PageNumberPagination
+from ..services.rollover import (
+    ROLLOVER_MODES,
+    RolloverLocked,
+    is_rollover_locked,
+    previous_month,
+    rollover_month,
+)
+from ..services.recompute import recompute_forward
+from ..services.status_bulk_save import bulk_save_statuses
+from ..tasks import recompute_forward_task, rollover_month_task
+from ..renderers import CompactJSONRenderer
+from ..utils.conditional import conditional_get, variant_status_request_watermark
+from ..utils.cache import (
+    get_cached,
+    set_cached,
+    invalidate_variant_status_cache,
+    variant_status_cache_key,
+)
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.settings import api_settings
 
 class ProductVariantStatusCreateView(APIView):
     """
@@ -46,6 +72,10 @@ class ProductVariantStatusCreateView(APIView):
                 "- 저번 달 데이터가 없으면 404\n"
                 "- 이미 이번 달 데이터가 있으면 스킵\n"
                 "- 저번 달 기말재고 → 이번 달 창고 기초재고로 이월\n"
+                "- mode=structure: 상품 목록만 생성 (재고 0)\n"
+                "- background=true: 백그라운드 작업으로 실행 (202 + job_id)\n"
+                "  진행 상황은 GET /inventory/variant-status/jobs/{job_id}/ 로 조회\n"
+                "- 같은 월 이월이 실행 중이면 409 (background도 등록 전에 확인)\n"
             ),
             manual_parameters=[
                 openapi.Parameter(
@@ -62,6 +92,21 @@ class ProductVariantStatusCreateView(APIView):
                     required=True,
                     description="생성할 월 (1~12)",
                 ),
+                openapi.Parameter(
+                    name="mode",
+                    in_=openapi.IN_QUERY,
+                    type=openapi.TYPE_STRING,
+                    enum=list(ROLLOVER_MODES),
+                    required=False,
+                    description="carry: 기말재고 이월 (default) / structure: 상품 목록만",
+                ),
+                openapi.Parameter(
+                    name="background",
+                    in_=openapi.IN_QUERY,
+                    type=openapi.TYPE_BOOLEAN,
+                    required=False,
+                    description="true: 백그라운드 작업으로 실행",
+                ),
             ],
             responses={
                 201: openapi.Response(
@@ -76,8 +121,19 @@ class ProductVariantStatusCreateView(APIView):
                         }
                     },
                 ),
-                400: "잘못된 요청 (year/month 형식 오류)",
+                202: openapi.Response(
+                    description="백그라운드 작업 등록",
+                    examples={
+                        "application/json": {
+                            "job_id": 12,
+                            "task_id": "b1f0...",
+                            "status": "PENDING",
+                        }
+                    },
+                ),
+                400: "잘못된 요청 (year/month/mode 형식 오류)",
                 404: "저번 달 데이터 없음",
+                409: "같은 월 이월 실행 중",
             },
             tags=["inventory - Variant Status (엑셀 행 하나)"],
         )
@@ -99,83 +155,62 @@ class ProductVariantStatusCreateView(APIView):
                 status=400
             )
 
-        # -------- 저번달 계산 --------
-        if month == 1:
-            prev_year = year - 1
-            prev_month = 12
-        else:
-            prev_year = year
-            prev_month = month - 1
-
-        # -------- 저번달 데이터 --------
-        prev_status_qs = ProductVariantStatus.objects.select_related(
-            "variant", "product"
-        ).filter(
-            year=prev_year,
-            month=prev_month,
-        )
-
-        if not prev_status_qs.exists():
+        mode = request.query_params.get("mode", "carry")
+        if mode not in ROLLOVER_MODES:
             return Response(
-                {"detail": "저번 달 재고 데이터가 없습니다."},
-                status=404
+                {"detail": f"mode는 {', '.join(ROLLOVER_MODES)} 중 하나여야 합니다."},
+                status=400
             )
 
-        created_count = 0
-        skipped_count = 0
-
-        with transaction.atomic():
-
-            for prev in prev_status_qs:
-
-                # 이미 이번달 데이터 있으면 skip
-                if ProductVariantStatus.objects.filter(
-                    year=year,
-                    month=month,
-                    variant=prev.variant
-                ).exists():
-                    skipped_count += 1
-                    continue
-
-                adjustment_sum = (
-                    InventoryAdjustment.objects.filter(
-                        variant=prev.variant,
-                        year=prev_year,
-                        month=prev_month,
-                    ).aggregate(total=Sum("delta"))["total"]
-                    or 0
+        if request.query_params.get("background") in ("true", "1"):
+            # 실행 중 / 저번 달 없음은 작업 등록 전에 동기 응답과 같은 코드로
+            if is_rollover_locked(year, month):
+                return Response(
+                    {"detail": f"{year}-{month} 이월이 이미 실행 중입니다."},
+                    status=status.HTTP_409_CONFLICT,
                 )
-
-                ending_stock = (
-                    prev.warehouse_stock_start
-                    + prev.store_stock_start
-                    + prev.inbound_quantity
-                    - (prev.store_sales + prev.online_sales)
-                    + adjustment_sum
+            prev_year, prev_month = previous_month(year, month)
+            if not ProductVariantStatus.objects.filter(
+                year=prev_year, month=prev_month
+            ).exists():
+                return Response(
+                    {"detail": "저번 달 재고 데이터가 없습니다."},
+                    status=404
                 )
 
-                # -------- 이번달 생성 --------
-                ProductVariantStatus.objects.create(
-                    product=prev.product,
-                    variant=prev.variant,
-                    year=year,
-                    month=month,
-                    warehouse_stock_start=ending_stock,
-                    store_stock_start=0,
-                    inbound_quantity=0,
-                    store_sales=0,
-                    online_sales=0,
-                )
+            job = InventoryBatchJob.objects.create(
+                kind=InventoryBatchJob.KIND_ROLLOVER,
+                year=year,
+                month=month,
+                params={"mode": mode},
+            )
+            task = rollover_month_task.delay(job.id)
+            job.refresh_from_db(fields=["status"])
+            return Response(
+                {"job_id": job.id, "task_id": task.id, "status": job.status},
+                status=status.HTTP_202_ACCEPTED,
+            )
 
-                created_count += 1
+        # -------- 저번달 → 이번달 (chunk 단위 INSERT ... SELECT) --------
+        try:
+            result = rollover_month(year, month, mode=mode)
+        except RolloverLocked as e:
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+
+        if not result["source"]:
+            return Response(
+                {"detail": "저번 달 재고 데이터가 없습니다."},
+                status=404
+            )
 
         return Response(
             {
                 "message": "이번 달 재고 스냅샷 생성 완료",
                 "year": year,
                 "month": month,
-                "created": created_count,
-                "skipped": skipped_count,
+                "mode": mode,
+                "created": result["created"],
+                "skipped": result["skipped"],
             },
             status=status.HTTP_201_CREATED,
         )
@@ -185,16 +220,146 @@ class VariantStatusPagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 200            # 안전장치
 
+
+class VariantStatusKeysetPagination(BasePagination):
+    """
+    (product_id, variant_code) 기준 Keyset(커서) 페이지네이션
+    - OFFSET / COUNT(*) 없이 마지막 행 키 다음부터 조회 → 깊은 페이지도 일정한 비용
+    - next / previous: 불투명 커서가 담긴 URL
+    - with_count=true 일 때만 전체 행 수 계산
+    """
+
+    page_size = VariantStatusPagination.page_size
+    page_size_query_param = "page_size"
+    max_page_size = VariantStatusPagination.max_page_size
+    cursor_query_param = "cursor"
+    ordering = ("product__product_id", "variant__variant_code")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count = None
+
+        if request.query_params.get("with_count") in ("true", "1"):
+            self.count = queryset.count()
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["reverse"])
+
+        if cursor:
+            product_id, variant_code = cursor["key"]
+            if reverse:
+                queryset = queryset.filter(
+                    Q(product__product_id__lt=product_id)
+                    | Q(product__product_id=product_id, variant__variant_code__lt=variant_code)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(product__product_id__gt=product_id)
+                    | Q(product__product_id=product_id, variant__variant_code__gt=variant_code)
+                )
+
+        order = [f"-{f}" for f in self.ordering] if reverse else list(self.ordering)
+        rows = list(queryset.order_by(*order)[: self.page_size + 1])
+
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.first_key = self.row_key(rows[0]) if rows else None
+        self.last_key = self.row_key(rows[-1]) if rows else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        body = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            body = {"count": self.count, **body}
+        return Response(body)
+
+    def get_next_link(self):
+        if not (self.has_next and self.last_key):
+            return None
+        return self.build_link(self.last_key, reverse=False)
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.first_key):
+            return None
+        return self.build_link(self.first_key, reverse=True)
+
+    def build_link(self, key, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(key, reverse)
+        )
+
+    @staticmethod
+    def row_key(obj):
+        return [obj.product.product_id, obj.variant.variant_code]
+
+    @staticmethod
+    def encode_cursor(key, reverse):
+        raw = json.dumps({"k": key, "r": int(reverse)}, ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            product_id, variant_code = raw["k"]
+            return {
+                "key": (str(product_id), str(variant_code)),
+                "reverse": bool(raw.get("r")),
+            }
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound("유효하지 않은 cursor 입니다.")
+
 class ProductVariantStatusListView(generics.ListAPIView):
     """
     GET: 월별 재고 현황 조회 (year, month 필수)
     """
     permission_classes = [AllowAny]
     serializer_class = ProductVariantStatusSerializer
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ProductVariantStatusFilter
+    ordering_fields = [
+        "product__product_id",
+        "variant__variant_code",
+        "ending_stock",
+    ]
     ordering = ["product__product_id", "variant__variant_code"]
     pagination_class = VariantStatusPagination
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, CompactJSONRenderer]
+
+    @property
+    def paginator(self):
+        # pagination=cursor 일 때 Keyset 페이지네이션 사용
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == "cursor":
+                self._paginator = VariantStatusKeysetPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     @swagger_auto_schema(
         operation_summary="재고 현황 확인",
@@ -225,12 +390,76 @@ class ProductVariantStatusListView(generics.ListAPIView):
                 required=False,
                 description="페이지당 행 수 (default: 10, max: 200)",
             ),
+            openapi.Parameter(
+                "pagination",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["page", "cursor"],
+                required=False,
+                description=(
+                    "cursor: (상품코드, variant_code) 기준 커서 페이지네이션 "
+                    "(next/previous URL 사용, ordering 무시)"
+                ),
+            ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                required=False,
+                description="커서 (next/previous URL에 포함된 값)",
+            ),
+            openapi.Parameter(
+                "with_count",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+                description="cursor 모드에서 전체 행 수(count) 포함 여부 (default: false)",
+            ),
+            openapi.Parameter(
+                "ordering",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                required=False,
+                description="정렬 필드 (예: ending_stock, -ending_stock)",
+            ),
+            openapi.Parameter(
+                "low_stock",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+                description="true: 기말재고가 최소재고(min_stock) 이하인 행만",
+            ),
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["compact"],
+                required=False,
+                description="compact: 컬럼형 JSON (columns + rows)",
+            ),
         ],
         tags=["inventory - Variant Status (엑셀 행 하나)"],
     )
+    @conditional_get(variant_status_request_watermark)
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
+    def list(self, request, *args, **kwargs):
+        # 월별 응답 캐시 (해당 월 수정 시 버전 증가로 무효화)
+        # 키에 ETag 기준값 포함 → 무효화 없이 바뀐 행도 새 ETag와 새 본문이 함께 나감
+        cache_key = variant_status_cache_key(
+            "variant-status-list",
+            request,
+            getattr(request, "conditional_watermark", None),
+        )
+        data = get_cached(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        set_cached(cache_key, response.data)
+        return response
+
     def get_queryset(self):
         year = self.request.query_params.get("year")
         month = self.request.query_params.get("month")
@@ -384,10 +613,16 @@ class ProductVariantStatusDetailView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        for field, value in update_data.items():
-            setattr(status_obj, field, value)
+        # 재고 필드 반영 + ending_stock F() 증분 + version 증가 (UPDATE 한 번)
+        try:
+            status_obj.apply_stock_changes(update_data)
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "수량 필드는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        status_obj.save(update_fields=list(update_data.keys()))
+        invalidate_variant_status_cache(year, month)
 
         serializer = ProductVariantStatusSerializer(status_obj)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -455,6 +690,7 @@ class ProductVariantStatusDetailView(APIView):
         )
 
         status_obj.delete()
+        invalidate_variant_status_cache(year, month)
 
         return Response(
             {
@@ -475,10 +711,11 @@ class ProductVariantStatusBulkUpdateView(APIView):
             "동작 방식:\n"
             "1. GET API에서 각 행의 version 값을 받습니다.\n"
             "2. 저장 시 동일한 version 값을 함께 전송해야 합니다.\n"
-            "3. 서버 version과 다르면 해당 행은 저장되지 않고 conflicts에 반환됩니다.\n\n"
+            "3. 서버 version과 다르면 해당 행은 저장되지 않고 conflicts에 반환됩니다.\n"
+            "   (version 조건부 UPDATE로 저장 → 조회와 저장 사이에 끼어든 수정도 충돌 처리)\n\n"
             "응답 필드:\n"
             "- updated: 정상 저장된 행 수\n"
-            "- conflicts: 동시 수정 충돌 발생 행 목록\n"
+            "- conflicts: 동시 수정 충돌 발생 행 목록 (server_values: 현재 서버 값)\n"
             "- errors: 잘못된 데이터 행 목록\n"
         ),
         request_body=openapi.Schema(
@@ -560,7 +797,15 @@ class ProductVariantStatusBulkUpdateView(APIView):
                             {
                                 "variant_code": "P00000FE000B",
                                 "server_version": 2,
-                                "client_version": 1
+                                "client_version": 1,
+                                "server_values": {
+                                    "warehouse_stock_start": 120,
+                                    "store_stock_start": 30,
+                                    "inbound_quantity": 50,
+                                    "store_sales": 20,
+                                    "online_sales": 10,
+                                    "ending_stock": 170,
+                                },
                             }
                         ],
                         "errors": []
@@ -584,84 +829,148 @@ class ProductVariantStatusBulkUpdateView(APIView):
                 status=400
             )
 
-        allowed = {
-            "warehouse_stock_start",
-            "store_stock_start",
-            "inbound_quantity",
-            "store_sales",
-            "online_sales"
-        }
-
-        updated = 0
-        conflicts = []
-        errors = []
-
-        with transaction.atomic():
-
-            for row in rows:
-
-                variant_code = row.get("variant_code")
-                client_version = row.get("version")
-
-                if not variant_code:
-                    continue
-
-                # 1. Variant 조회
-                try:
-                    variant = ProductVariant.objects.get(
-                        variant_code=variant_code,
-                        is_active=True
-                    )
-                except ProductVariant.DoesNotExist:
-                    errors.append({
-                        "variant_code": variant_code,
-                        "error": "존재하지 않는 variant"
-                    })
-                    continue
-
-                # 2. Status 조회
-                try:
-                    status_obj = ProductVariantStatus.objects.get(
-                        year=year,
-                        month=month,
-                        variant=variant
-                    )
-                except ProductVariantStatus.DoesNotExist:
-                    errors.append({
-                        "variant_code": variant_code,
-                        "error": "해당 월 재고 데이터 없음"
-                    })
-                    continue
-
-                # 3. version 충돌 체크
-                if client_version != status_obj.version:
-                    conflicts.append({
-                        "variant_code": variant_code,
-                        "server_version": status_obj.version,
-                        "client_version": client_version,
-                    })
-                    continue
-
-                # 4. 실제 업데이트
-                dirty = []
-
-                for k, v in row.items():
-                    if k in allowed:
-                        setattr(status_obj, k, v)
-                        dirty.append(k)
-
-                if dirty:
-                    status_obj.version += 1
-                    dirty.append("version")
-
-                    status_obj.save(update_fields=dirty)
-                    updated += 1
+        result = bulk_save_statuses(year, month, rows)
 
         return Response(
             {
                 "message": "벌크 저장 완료",
-                "updated": updated,
-                "conflicts": conflicts,
-                "errors": errors
+                **result,
             }
         )
+
+
+class ProductVariantStatusRecomputeView(APIView):
+    """
+    POST /inventory/variant-status/recompute/{year}/{month}/
+    지난 달 수정 후 이후 모든 달의 이월 기초재고 / 기말재고 재계산
+    """
+
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="이후 달 이월 재고 재계산",
+        operation_description=(
+            "{year}/{month} 이후 모든 달의 창고 기초재고를\n"
+            "바로 전 달 기말재고 기준으로 다시 계산합니다.\n\n"
+            "- 시작 월의 기초재고는 유지\n"
+            "- 매장 기초재고는 유지, 창고 기초재고로 합계를 맞춤\n"
+            "- 값이 바뀐 행만 저장 (version 증가)\n"
+            "- variant_codes 지정 시 해당 상품만 재계산\n"
+            "- background=true: 백그라운드 작업으로 실행 (202 + job_id)\n"
+            "  진행 상황은 GET /inventory/variant-status/jobs/{job_id}/ 로 조회"
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "year",
+                openapi.IN_PATH,
+                type=openapi.TYPE_INTEGER,
+                required=True,
+                description="수정한 연도 (예: 2026)",
+            ),
+            openapi.Parameter(
+                "month",
+                openapi.IN_PATH,
+                type=openapi.TYPE_INTEGER,
+                required=True,
+                description="수정한 월 (1~12)",
+            ),
+            openapi.Parameter(
+                "background",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+                description="true: 백그라운드 작업으로 실행",
+            ),
+        ],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "variant_codes": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Items(type=openapi.TYPE_STRING),
+                    description="재계산할 상품 옵션 코드 (미입력 시 전체)",
+                ),
+            },
+        ),
+        responses={
+            200: openapi.Response(
+                description="재계산 결과",
+                examples={
+                    "application/json": {
+                        "updated": 3,
+                        "months": [
+                            {"year": 2026, "month": 3, "updated": 2},
+                            {"year": 2026, "month": 4, "updated": 1},
+                        ],
+                    }
+                },
+            ),
+            400: "잘못된 요청 (month 범위 / 존재하지 않는 variant_code)",
+        },
+        tags=["inventory - Variant Status (엑셀 전체 대응)"],
+    )
+    def post(self, request, year: int, month: int):
+        if not (1 <= month <= 12):
+            return Response({"detail": "month는 1~12 사이여야 합니다."}, status=400)
+
+        variant_ids = None
+        variant_codes = request.data.get("variant_codes")
+
+        if variant_codes:
+            found = dict(
+                ProductVariant.objects.filter(
+                    variant_code__in=variant_codes
+                ).values_list("variant_code", "id")
+            )
+            missing = [code for code in variant_codes if code not in found]
+            if missing:
+                return Response(
+                    {"detail": "존재하지 않는 variant_code", "variant_codes": missing},
+                    status=400,
+                )
+            variant_ids = list(found.values())
+
+        if request.query_params.get("background") in ("true", "1"):
+            job = InventoryBatchJob.objects.create(
+                kind=InventoryBatchJob.KIND_RECOMPUTE,
+                year=year,
+                month=month,
+                params={"variant_ids": variant_ids},
+            )
+            task = recompute_forward_task.delay(job.id)
+            job.refresh_from_db(fields=["status"])
+            return Response(
+                {"job_id": job.id, "task_id": task.id, "status": job.status},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        return Response(recompute_forward(year, month, variant_ids))
+
+
+class ProductVariantStatusJobView(APIView):
+    """
+    GET: 월 이월 / 이후 달 재계산 백그라운드 작업 진행 상황
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="월 이월 / 재계산 작업 상태 조회",
+        operation_description=(
+            "background=true 이월 / 재계산 작업의 진행 상황을 조회합니다.\n\n"
+            "- kind: ROLLOVER / RECOMPUTE\n"
+            "- status: PENDING / RUNNING / SUCCEEDED / FAILED\n"
+            "- done / total: 처리한 행 수 / 전체 행 수 (이월은 chunk마다 갱신)\n"
+            "- result: 완료 시 동기 실행과 같은 결과\n"
+            "- errors: 실패 원인"
+        ),
+        responses={
+            200: InventoryBatchJobSerializer,
+            404: "작업 없음",
+        },
+        tags=["inventory - Variant Status (엑셀 전체 대응)"],
+    )
+    def get(self, request, job_id):
+        job = get_object_or_404(InventoryBatchJob, pk=job_id)
+        return Response(
+            InventoryBatchJobSerializer(job).data, status=status.HTTP_200_OK
+        )
@@ -1,10 +1,8 @@
-from django.db import models
-from django.db.models import Sum, F, Q
-
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.settings import api_settings
 from django_filters.rest_framework import DjangoFilterBackend
 
 # Swagger
@@ -14,6 +12,14 @@ from drf_yasg.utils import swagger_auto_schema
 from ..models import ProductVariantStatus
 from ..serializers import ProductVariantStatusSerializer
 from ..filters import ProductVariantStatusFilter
+from ..renderers import CSVRenderer, CompactJSONRenderer, XLSXRenderer
+from ..services.ending_stock import adjustment_total_expression
+from ..utils.excel import EXPORT_COLUMNS, EXCEL_HEADER_ROW
+from ..utils.streaming import csv_response, xlsx_response
+from ..utils.cache import get_cached, set_cached, variant_status_cache_key
+
+# 서버 사이드 커서로 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 2000
 
 class ProductVariantExportView(APIView):
     """
@@ -24,13 +30,21 @@ class ProductVariantExportView(APIView):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProductVariantStatusFilter
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        CSVRenderer,
+        XLSXRenderer,
+        CompactJSONRenderer,
+    ]
 
     @swagger_auto_schema(
         operation_summary="상품 재고 현황 Export (엑셀용)",
         operation_description=(
             "월별 ProductVariantStatus 기준으로\n"
             "상품 / 옵션 / 재고 / 판매 / 재고조정 정보를 한 행으로 반환합니다.\n\n"
-            "엑셀 다운로드 및 관리 화면 테이블 출력 용도입니다."
+            "엑셀 다운로드 및 관리 화면 테이블 출력 용도입니다.\n\n"
+            "format=xlsx 또는 format=csv 지정 시\n"
+            "업로드 양식과 동일한 컬럼으로 파일을 스트리밍 다운로드합니다."
         ),
         tags=["inventory - Export"],
         manual_parameters=[
@@ -66,28 +80,67 @@ class ProductVariantExportView(APIView):
                 type=openapi.TYPE_STRING,
                 description="카테고리 필터 (부분 일치)",
             ),
+            openapi.Parameter(
+                "format",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=["xlsx", "csv", "compact"],
+                description=(
+                    "xlsx/csv: 파일 다운로드, compact: 컬럼형 JSON (columns + rows), "
+                    "미입력 시 JSON"
+                ),
+            ),
         ],
         responses={200: ProductVariantStatusSerializer(many=True)},
     )
     
     def get(self, request):
-        queryset = (
-            ProductVariantStatus.objects
-            .select_related("product", "variant")
-            .annotate(
-                adjustment_total=Sum(
-                    "variant__adjustments__delta",
-                    filter=Q(
-                        variant__adjustments__year=F("year"),
-                        variant__adjustments__month=F("month"),
-                    ),
-                )
-            )
+        # 재고조정 합계/내역은 ProductVariantStatusSerializer(many=True)가
+        # 전체 행에 대해 한 번의 쿼리로 일괄 계산
+        queryset = ProductVariantStatus.objects.select_related(
+            "product", "variant"
         )
 
         # filtering
         for backend in list(self.filter_backends):
             queryset = backend().filter_queryset(request, queryset, self)
 
-        serializer = ProductVariantStatusSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        file_format = getattr(request.accepted_renderer, "format", None)
+        if file_format in ("csv", "xlsx"):
+            return self._file_response(request, queryset, file_format)
+
+        # 월별 응답 캐시 (해당 월 수정 시 버전 증가로 무효화)
+        cache_key = variant_status_cache_key("variant-export", request)
+        data = get_cached(cache_key)
+        if data is None:
+            data = ProductVariantStatusSerializer(queryset, many=True).data
+            set_cached(cache_key, data)
+
+        return Response(data, status=status.HTTP_200_OK)
+
+    def _file_response(self, request, queryset, file_format):
+        """
+        업로드 양식 컬럼 그대로 파일 생성
+        - 재고조정 합은 서브쿼리로 함께 조회 (행별 추가 쿼리 없음)
+        - iterator(): 서버 사이드 커서로 청크 단위 조회 → 메모리 사용량 일정
+        """
+        header = [name for name, _ in EXPORT_COLUMNS]
+        rows = (
+            queryset.annotate(adjustment_total=adjustment_total_expression())
+            .order_by("product__product_id", "variant__variant_code")
+            .values_list(*[field for _, field in EXPORT_COLUMNS])
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+
+        year = request.query_params.get("year")
+        month = request.query_params.get("month")
+        period = f"{year}_{month}" if year and month else "all"
+        filename = f"inventory_{period}.{file_format}"
+
+        if file_format == "csv":
+            return csv_response(filename, header, rows)
+
+        # 업로드(load_excel)는 3번째 행을 헤더로 읽음
+        title = f"{year}년 {month}월 재고 현황" if year and month else "재고 현황"
+        title_rows = [[title]] + [[] for _ in range(EXCEL_HEADER_ROW - 1)]
+        return xlsx_response(filename, header, rows, title_rows=title_rows)
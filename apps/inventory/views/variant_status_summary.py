@@ -0,0 +1,136 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework import status
+
+# Swagger
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from ..services.category_rollup import build_category_rollup
+from ..utils.cache import get_cached, set_cached, variant_status_cache_key
+
+
+class ProductVariantStatusSummaryView(APIView):
+    """
+    GET: 월별 카테고리 집계 (대분류 / 중분류 / 카테고리 소계 + 전체 합계)
+    """
+
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="월별 카테고리 재고 집계",
+        operation_description=(
+            "해당 월 ProductVariantStatus를 대분류 > 중분류 > 카테고리 기준으로 집계합니다.\n\n"
+            "- rows: 카테고리 행 + 중분류/대분류 소계 행 (level로 구분)\n"
+            "- total: 전체 합계\n\n"
+            "소계 행은 하위 행 바로 뒤에 위치합니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                "year",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                required=True,
+                description="조회 연도 (예: 2025)",
+            ),
+            openapi.Parameter(
+                "month",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                required=True,
+                description="조회 월 (1~12)",
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="카테고리 집계",
+                examples={
+                    "application/json": {
+                        "year": 2025,
+                        "month": 6,
+                        "rows": [
+                            {
+                                "level": "category",
+                                "big_category": "의류",
+                                "middle_category": "상의",
+                                "category": "티셔츠",
+                                "variant_count": 12,
+                                "warehouse_stock_start": 120,
+                                "store_stock_start": 30,
+                                "inbound_quantity": 40,
+                                "store_sales": 25,
+                                "online_sales": 15,
+                                "adjustment_total": -2,
+                                "ending_stock": 148,
+                            },
+                            {
+                                "level": "middle_category",
+                                "big_category": "의류",
+                                "middle_category": "상의",
+                                "category": None,
+                                "variant_count": 12,
+                                "warehouse_stock_start": 120,
+                                "store_stock_start": 30,
+                                "inbound_quantity": 40,
+                                "store_sales": 25,
+                                "online_sales": 15,
+                                "adjustment_total": -2,
+                                "ending_stock": 148,
+                            },
+                        ],
+                        "total": {
+                            "level": "total",
+                            "big_category": None,
+                            "middle_category": None,
+                            "category": None,
+                            "variant_count": 12,
+                            "warehouse_stock_start": 120,
+                            "store_stock_start": 30,
+                            "inbound_quantity": 40,
+                            "store_sales": 25,
+                            "online_sales": 15,
+                            "adjustment_total": -2,
+                            "ending_stock": 148,
+                        },
+                    }
+                },
+            ),
+            400: "year/month 누락 또는 형식 오류",
+        },
+        tags=["inventory - Variant Status (엑셀 행 하나)"],
+    )
+    def get(self, request):
+        year = request.query_params.get("year")
+        month = request.query_params.get("month")
+
+        if not year or not month:
+            return Response(
+                {"detail": "year, month 쿼리 파라미터는 필수입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            year = int(year)
+            month = int(month)
+        except ValueError:
+            return Response(
+                {"detail": "year와 month는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not (1 <= month <= 12):
+            return Response(
+                {"detail": "month는 1~12 사이여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 월별 응답 캐시 (해당 월/상품 정보 수정 시 버전 증가로 무효화)
+        cache_key = variant_status_cache_key("variant-status-summary", request)
+        data = get_cached(cache_key)
+        if data is None:
+            rows, total = build_category_rollup(year, month)
+            data = {"year": year, "month": month, "rows": rows, "total": total}
+            set_cached(cache_key, data)
+
+        return Response(data, status=status.HTTP_200_OK)
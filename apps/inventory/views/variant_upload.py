@@ -9,27 +9,44 @@ from drf_yasg.utils import swagger_auto_schema
 
 from django.utils import timezone
 from django.db import transaction
+from django.shortcuts import get_object_or_404
 
-from apps.inventory.models import (
-    InventoryItem,
-    ProductVariant,
-    ProductVariantStatus,
+from apps.inventory.utils.excel import (
+    REQUIRED_COLUMNS,
+    stream_upload,
+)
+from apps.inventory.models import InventoryImportJob
+from apps.inventory.serializers import InventoryImportJobSerializer
+from apps.inventory.services.inventory_import import import_inventory_batches
+from apps.inventory.tasks import import_inventory_job_task
+from apps.inventory.utils.cache import (
+    invalidate_catalog_cache,
+    invalidate_variant_status_cache,
 )
-
-from apps.inventory.utils.excel import load_excel, safe_str, safe_int
-from apps.inventory.utils.variant_code import build_variant_code
-from apps.inventory.services.variant_resolver import resolve_variant
 
 
 class ProductVariantExcelUploadView(APIView):
     """
-    POST: 재고 관리 엑셀 업로드
+    POST: 재고 관리 엑셀 업로드 (xlsx / xls / csv / parquet)
+    - background=true: 파일 보관 후 백그라운드 작업으로 반영 (202 + job_id)
     """
     permission_classes = [AllowAny]
     parser_classes = [MultiPartParser, FormParser]
 
     @swagger_auto_schema(
         operation_summary="상품 재고 엑셀 업로드",
+        operation_description=(
+            "업로드 파일을 읽어 상품 / 옵션 / 월별 재고를 반영합니다.\n\n"
+            "- 파일 형식(확장자 기준): xlsx / xls (3번째 행 헤더), "
+            "csv (첫 줄 헤더, UTF-8 또는 CP949), parquet\n"
+            "  컬럼명은 모든 형식이 엑셀 업로드 양식과 동일 (상품코드, 월초창고 재고, ...)\n"
+            "- 기본: 요청 안에서 한 트랜잭션으로 반영 (201 + summary)\n"
+            "  월별 재고는 현재 값과 비교해 바뀐 행만 저장 "
+            "(created_status / updated_status / unchanged_status)\n"
+            "- background=true: 파일을 보관하고 작업 id를 바로 반환 (202)\n"
+            "  진행 상황은 GET variants/upload-excel/jobs/{job_id}/ 로 조회\n"
+            "  (chunk 단위 커밋, 실패 시 해당 chunk만 롤백)"
+        ),
         tags=["inventory"],
         consumes=["multipart/form-data"],
         manual_parameters=[
@@ -49,7 +66,22 @@ class ProductVariantExcelUploadView(APIView):
                 in_=openapi.IN_QUERY,
                 type=openapi.TYPE_INTEGER,
             ),
+            openapi.Parameter(
+                name="background",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+                description="true: 백그라운드 작업으로 반영 (202 + job_id)",
+            ),
         ],
+        responses={
+            201: "업로드 완료 (summary)",
+            202: openapi.Response(
+                description="백그라운드 작업 등록",
+                examples={"application/json": {"job_id": 12, "status": "PENDING"}},
+            ),
+            400: "파일 누락 / 엑셀 형식 오류",
+        },
     )
     def post(self, request):
         file = request.FILES.get("file")
@@ -59,140 +91,89 @@ class ProductVariantExcelUploadView(APIView):
         year = int(request.query_params.get("year", timezone.now().year))
         month = int(request.query_params.get("month", timezone.now().month))
 
+        if request.query_params.get("background") in ("true", "1"):
+            job = InventoryImportJob.objects.create(
+                year=year,
+                month=month,
+                file=file,
+                file_name=file.name,
+            )
+            import_inventory_job_task.delay(job.id)
+            job.refresh_from_db(fields=["status"])
+            return Response(
+                {"job_id": job.id, "status": job.status},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        # 전체 파일을 DataFrame으로 올리지 않고 batch 단위로 읽어 반영
         try:
-            df = load_excel(file)
+            columns, batches = stream_upload(file)
         except Exception as e:
-            return Response({"error": f"엑셀 로드 실패: {str(e)}"}, status=400)
-
-        REQUIRED_COLUMNS = [
-            "상품코드",
-            "오프라인 품목명",
-            "온라인 품목명",
-            "옵션",
-            "상세옵션",
-            "월초창고 재고",
-            "월초매장 재고",
-            "당월입고물량",
-            "매장 판매물량",
-            "쇼핑몰 판매물량",
-        ]
-
-        missing_cols = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+            return Response({"error": f"파일 로드 실패: {str(e)}"}, status=400)
+
+        missing_cols = [c for c in REQUIRED_COLUMNS if c not in columns]
         if missing_cols:
             return Response({"error": f"필수 컬럼 누락: {missing_cols}"}, status=400)
 
-        created_variants = 0
-        skipped_variants = 0
-        created_status = 0
-
         try:
             with transaction.atomic():
-                for _, row in df.iterrows():
-                    raw_variant_code = safe_str(row, "상품코드")
-                    product_name = safe_str(row, "오프라인 품목명") or "상품명 없음"
-                    option = safe_str(row, "옵션")
-                    detail_option = safe_str(row, "상세옵션")
-
-                    if raw_variant_code and "-" in raw_variant_code:
-                        product_id = raw_variant_code.split("-", 1)[0]
-                    else:
-                        product_id = raw_variant_code or None
-
-                    variant_code = build_variant_code(
-                        product_id=product_id,
-                        product_name=product_name,
-                        option=option,
-                        detail_option=detail_option,
-                        allow_auto=True,
-                    )
-
-                    if not product_id:
-                        product_id = variant_code.split("-", 1)[0]
-
-
-                    option = option or ""
-                    online_name = safe_str(row, "온라인 품목명")
-
-                    warehouse_start = safe_int(row, "월초창고 재고")
-                    store_start = safe_int(row, "월초매장 재고")
-                    inbound = safe_int(row, "당월입고물량")
-                    store_sales = safe_int(row, "매장 판매물량")
-                    online_sales = safe_int(row, "쇼핑몰 판매물량")
-
-                    channels = ["offline"]
-                    if online_name:
-                        channels = ["online", "offline"]
-
-                    product, _ = InventoryItem.objects.get_or_create(
-                        product_id=product_id,
-                        defaults={
-                            "name": product_name,
-                            "online_name": online_name,
-                            "category": safe_str(row, "카테고리"),
-                            "big_category": safe_str(row, "대분류"),
-                            "middle_category": safe_str(row, "중분류"),
-                            "description": safe_str(row, "설명"),
-                        },
-                    )
-
-                    variant = resolve_variant(
-                        product=product,
-                        option=option,
-                        detail_option=detail_option,
-                        variant_code=variant_code,
-                    )
-
-                    if variant:
-                        skipped_variants += 1
-                    else:
-                        variant = ProductVariant.objects.create(
-                            product=product,
-                            option=option,
-                            detail_option=detail_option,
-                            variant_code=variant_code,
-                            price=0,
-                            min_stock=0,
-                            channels=channels,
-                            is_active=True,
-                        )
-                        created_variants += 1
-
-                    _, status_created = ProductVariantStatus.objects.update_or_create(
-                        year=year,
-                        month=month,
-                        variant=variant,
-                        defaults={
-                            "product": product,
-                            "warehouse_stock_start": warehouse_start,
-                            "store_stock_start": store_start,
-                            "inbound_quantity": inbound,
-                            "store_sales": store_sales,
-                            "online_sales": online_sales,
-                        },
-                    )
-
-                    if status_created:
-                        created_status += 1
-
+                result = import_inventory_batches(batches, year, month)
         except Exception as e:
             return Response(
                 {
-                    "error": "엑셀 업로드 중 오류 발생",
-                    "detail": f"[{product_name}] {str(e)}",
+                    "error": "파일 업로드 중 오류 발생",
+                    "detail": str(e),
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # 변경 없는 재업로드는 캐시 유지
+        if result["created_status"] or result["updated_status"]:
+            invalidate_variant_status_cache(year, month)
+        if result["created_variants"] or result["created_products"]:
+            invalidate_catalog_cache()
+
         return Response(
             {
                 "summary": {
                     "year": year,
                     "month": month,
-                    "total_rows": len(df),
-                    "created_variants": created_variants,
-                    "skipped_variants": skipped_variants,
-                    "created_status": created_status,
+                    "total_rows": result["total_rows"],
+                    "created_variants": result["created_variants"],
+                    "skipped_variants": result["skipped_variants"],
+                    "created_status": result["created_status"],
+                    "updated_status": result["updated_status"],
+                    "unchanged_status": result["unchanged_status"],
                 }
             },
             status=status.HTTP_201_CREATED,
-        )
\ No newline at end of file
+        )
+
+
+class ProductVariantExcelUploadJobView(APIView):
+    """
+    GET: 엑셀 업로드 백그라운드 작업 진행 상황
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="엑셀 업로드 작업 상태 조회",
+        operation_description=(
+            "background=true 업로드 작업의 진행 상황을 조회합니다.\n\n"
+            "- status: PENDING / RUNNING / SUCCEEDED / FAILED\n"
+            "- processed_rows: 커밋 완료된 행 수 (chunk 단위)\n"
+            "- errors: 실패 원인 (rows: 실패한 엑셀 행 범위, 검사 단계 실패 시 null)\n\n"
+            "FAILED여도 processed_rows만큼은 반영된 상태이며, "
+            "같은 파일을 다시 올리면 이어서 반영됩니다."
+        ),
+        responses={
+            200: InventoryImportJobSerializer,
+            404: "작업 없음",
+        },
+        tags=["inventory"],
+    )
+    def get(self, request, job_id):
+        job = get_object_or_404(InventoryImportJob, pk=job_id)
+        return Response(
+            InventoryImportJobSerializer(job).data, status=status.HTTP_200_OK
+        )
@@ -8,10 +8,18 @@ class OrderFilter(django_filters.FilterSet):
     status = django_filters.CharFilter(field_name='status', lookup_expr='exact')
     start_date = django_filters.DateFilter(field_name='order_date', lookup_expr='gte')
     end_date = django_filters.DateFilter(field_name='order_date', lookup_expr='lte')
+    # annotate_order_totals 적용된 queryset 전용
+    min_total_price = django_filters.NumberFilter(field_name='total_price', lookup_expr='gte')
+    max_total_price = django_filters.NumberFilter(field_name='total_price', lookup_expr='lte')
+    min_total_quantity = django_filters.NumberFilter(field_name='total_quantity', lookup_expr='gte')
+    max_total_quantity = django_filters.NumberFilter(field_name='total_quantity', lookup_expr='lte')
 
     class Meta:
         model = Order
-        fields = ['product_name', 'supplier', 'status', 'start_date', 'end_date']
+        fields = [
+            'product_name', 'supplier', 'status', 'start_date', 'end_date',
+            'min_total_price', 'max_total_price', 'min_total_quantity', 'max_total_quantity',
+        ]
 
     def filter_by_product_name(self, queryset, name, value):
         return queryset.filter(items__variant__product__name__icontains=value).distinct()
\ No newline at end of file
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_order_completed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='cost_price',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_order_item_cost_price'),
+        ('inventory', '0010_inventory_import_jobs'),
+    ]
+
+    operations = [
+        # 품목명 / 원가를 저장하기 전에 만들어진 품목은 현재 variant 값으로 채움
+        # (이후 응답 / 내보내기는 저장된 값만 사용)
+        migrations.RunSQL(
+            sql="""
+            UPDATE order_items AS i
+               SET item_name = CASE WHEN i.item_name = '' THEN p.name ELSE i.item_name END,
+                   cost_price = CASE WHEN i.cost_price = 0 THEN v.cost_price ELSE i.cost_price END
+              FROM product_variants AS v
+              JOIN products AS p ON p.id = v.product_id
+             WHERE v.id = i.variant_id
+               AND (i.item_name = '' OR i.cost_price = 0);
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
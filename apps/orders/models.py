@@ -59,6 +59,7 @@ class OrderItem(models.Model):
     unit = models.CharField(max_length=20, default='EA')
     quantity = models.PositiveIntegerField()
     unit_price = models.PositiveIntegerField()
+    cost_price = models.PositiveIntegerField(default=0)  # 주문 시점 variant 원가 (원가 변경 대비하여 저장)
     remark = models.CharField(max_length=255, blank=True, null=True)
 
     @property
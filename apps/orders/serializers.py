@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import serializers
 from apps.orders.models import Order, OrderItem
 from apps.inventory.models import ProductVariant
@@ -8,16 +9,14 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 class OrderItemSerializer(serializers.ModelSerializer):
-    item_name = serializers.SerializerMethodField()
+    # item_name / cost_price는 주문 시점에 저장된 값 (이후 상품명 / 원가 변경과 무관)
     variant_code = serializers.CharField(source='variant.variant_code', read_only=True)
     option = serializers.CharField(source='variant.option', read_only=True)
 
     class Meta:
         model = OrderItem
-        fields = ['id', 'variant_code', 'option', 'item_name', 'quantity', 'unit', 'unit_price', 'remark', 'spec']
+        fields = ['id', 'variant_code', 'option', 'item_name', 'quantity', 'unit', 'unit_price', 'cost_price', 'remark', 'spec']
 
-    def get_item_name(self, obj):
-        return obj.variant.product.name if obj.variant and obj.variant.product else None
 # READ 전용
 class OrderReadSerializer(serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, read_only=True)
@@ -50,15 +49,18 @@ class OrderItemWriteSerializer(serializers.ModelSerializer):
         model = OrderItem
         fields = ['variant_code', 'quantity', 'unit_price', 'remark', 'spec']
 
-    def create(self, validated_data):
-        variant_code = validated_data.pop('variant_code')
-        try:
-            variant = ProductVariant.objects.get(variant_code=variant_code)
-        except ProductVariant.DoesNotExist:
-            raise serializers.ValidationError({
-                "variant_code": f"variant_code '{variant_code}' does not exist."
-            })
-        return OrderItem(variant=variant, **validated_data)
+
+def build_order_item(variant, item_data):
+    """
+    저장 전 OrderItem 생성 (품목명 / 원가는 주문 시점 variant 값으로 저장)
+    - variant는 product를 함께 조회한 객체
+    """
+    return OrderItem(
+        variant=variant,
+        item_name=variant.product.name,
+        cost_price=variant.cost_price,
+        **item_data,
+    )
     
 
 class OrderWriteSerializer(serializers.ModelSerializer):
@@ -84,6 +86,18 @@ class OrderWriteSerializer(serializers.ModelSerializer):
     def validate_items(self, value):
         if not value:
             raise serializers.ValidationError("items 리스트는 비어 있을 수 없습니다.")
+
+        # variant_code 전체를 쿼리 한 번으로 조회, 없는 코드는 한 번에 보고
+        codes = {item['variant_code'] for item in value}
+        self._variants = ProductVariant.objects.select_related('product').in_bulk(
+            codes, field_name='variant_code'
+        )
+
+        missing = sorted(codes - self._variants.keys())
+        if missing:
+            raise serializers.ValidationError(
+                [f"variant_code '{code}' does not exist." for code in missing]
+            )
         return value
 
     def validate(self, data):
@@ -105,19 +119,28 @@ class OrderWriteSerializer(serializers.ModelSerializer):
                 "manager_name": f"'{manager_name}'이라는 이름을 가진 사용자가 존재하지 않습니다."
             })
 
-        order = Order.objects.create(manager=manager, **validated_data)
+        # 주문 + 품목 bulk insert를 한 트랜잭션으로 (품목 저장 실패 시 주문도 롤백)
+        with transaction.atomic():
+            order = Order.objects.create(manager=manager, **validated_data)
+
+            items = []
+            for item_data in items_data:
+                variant = self._variants[item_data.pop('variant_code')]
+                item = build_order_item(variant, item_data)
+                item.order = order
+                items.append(item)
 
-        for item_data in items_data:
-            item = OrderItemWriteSerializer().create(item_data)
-            item.order = order
-            item.save()
+            OrderItem.objects.bulk_create(items)
 
         return order
 
 class OrderCompactSerializer(serializers.ModelSerializer):
-    total_quantity = serializers.SerializerMethodField()
-    total_price = serializers.SerializerMethodField()
-    product_names = serializers.SerializerMethodField()
+    # annotate_order_totals로 DB에서 계산한 값
+    total_quantity = serializers.IntegerField(read_only=True)
+    total_price = serializers.IntegerField(read_only=True)
+    product_names = serializers.ListField(
+        child=serializers.CharField(), read_only=True
+    )
     supplier = serializers.CharField(source='supplier.name', read_only=True)
     manager = serializers.CharField(source='manager.first_name', read_only=True)
     expected_delivery_date = serializers.DateField(read_only=True)
@@ -136,16 +159,3 @@ class OrderCompactSerializer(serializers.ModelSerializer):
             'total_price',
             'product_names'
         ]
-
-    def get_total_quantity(self, obj):
-        return sum(item.quantity for item in obj.items.all())
-
-    def get_total_price(self, obj):
-        return sum(item.quantity * item.unit_price for item in obj.items.all())
-
-    def get_product_names(self, obj):
-        names = set()
-        for item in obj.items.all():
-            if item.variant and item.variant.product:
-                names.add(item.variant.product.name)
-        return list(names)
\ No newline at end of file
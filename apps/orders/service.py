@@ -1,15 +1,89 @@
-from django.db import transaction
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce
 from django.utils import timezone
 
-from apps.orders.models import Order
+from apps.inventory.services.inbound_sync import apply_inbound_deltas
+from apps.orders.models import Order, OrderItem
+
+
+def _order_items_subquery(aggregate):
+    # 주문 1건의 품목 집계 (상관 서브쿼리)
+    return Subquery(
+        OrderItem.objects.filter(order_id=OuterRef("pk"))
+        .order_by()
+        .values("order_id")
+        .annotate(value=aggregate)
+        .values("value")
+    )
+
+
+def _order_totals():
+    return {
+        "total_quantity": Coalesce(_order_items_subquery(Sum("quantity")), 0),
+        # 수량 × 단가는 int 범위를 넘을 수 있어 bigint로 계산
+        "total_price": Coalesce(
+            _order_items_subquery(
+                Sum(Cast("quantity", models.BigIntegerField()) * F("unit_price"))
+            ),
+            0,
+            output_field=models.BigIntegerField(),
+        ),
+        "product_names": Coalesce(
+            _order_items_subquery(
+                ArrayAgg("item_name", distinct=True)
+            ),
+            Value([]),
+            output_field=ArrayField(models.CharField()),
+        ),
+    }
+
+
+def annotate_order_totals(queryset):
+    """
+    주문 목록용 품목 집계를 DB에서 계산 (품목 / 상품 prefetch 없이 주문당 한 행)
+    - total_quantity: 수량 합
+    - total_price: 수량 × 단가 합
+    - product_names: 주문 시점에 저장된 품목명 (중복 제거, 이름순)
+    서브쿼리라 상품명 필터의 JOIN과 섞여도 합계가 부풀지 않고,
+    total_price / total_quantity로 정렬 / 필터 가능
+    """
+    return queryset.select_related("supplier", "manager").annotate(**_order_totals())
+
+
+def alias_order_totals(queryset):
+    """
+    annotate_order_totals의 alias 버전 (품목을 따로 읽는 파일 Export용)
+    - 같은 이름으로 필터 / 정렬 가능
+    - SELECT에는 포함되지 않고, 필터 / 정렬에 쓰인 집계만 SQL에 들어감
+    """
+    return queryset.select_related("supplier", "manager").alias(**_order_totals())
+
+
+def _apply_order_inbound(order: Order, sign: int):
+    """
+    주문 품목 수량(variant별 합)을 completed_at 월 입고량에 반영
+    - sign: 1(완료) / -1(완료 취소)
+    """
+    completed_at = timezone.localtime(order.completed_at)
+
+    deltas = {
+        row["variant_id"]: sign * row["quantity"]
+        for row in order.items.values("variant_id").annotate(
+            quantity=Sum("quantity")
+        )
+    }
+    return apply_inbound_deltas(completed_at.year, completed_at.month, deltas)
 
 
 @transaction.atomic
 def complete_order(order: Order):
     """
     Order를 COMPLETED 처리
-    - 통계(ProductVariantStatus)는 건드리지 않음
-    - Sync API에서 일괄 계산
+    - 같은 트랜잭션에서 completed_at 월 ProductVariantStatus 입고량 증가 (F() 증분)
+    - Sync API는 어긋난 값만 바로잡는 대사용
     """
 
     if order.status == Order.STATUS_COMPLETED:
@@ -19,4 +93,19 @@ def complete_order(order: Order):
 
     order.status = Order.STATUS_COMPLETED
     order.completed_at = completed_at
-    order.save(update_fields=["status", "completed_at"])
\ No newline at end of file
+    order.save(update_fields=["status", "completed_at"])
+
+    _apply_order_inbound(order, 1)
+
+
+@transaction.atomic
+def delete_order(order: Order):
+    """
+    Order 삭제
+    - complete_order로 완료된 주문이면 반영했던 입고량을 같은 트랜잭션에서 되돌림
+      (completed_at 없는 COMPLETED 주문은 입고 반영 이력이 없으므로 그대로 삭제)
+    """
+    if order.status == Order.STATUS_COMPLETED and order.completed_at:
+        _apply_order_inbound(order, -1)
+
+    order.delete()
@@ -1,8 +1,12 @@
+import io
+import json
+
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
 
 from apps.orders.models import Order, OrderItem
+from apps.orders.service import complete_order
 from apps.inventory.models import InventoryItem, ProductVariant, ProductVariantStatus
 from apps.supplier.models import Supplier
 from apps.hr.models import Employee
@@ -108,6 +112,81 @@ class OrderAPITestCase(APITestCase):
         r = self.client.post(url, payload, format="json")
         self.assertEqual(r.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_order_creation_batches_items_and_snapshots_variant(self):
+        self.variant.cost_price = 3200
+        self.variant.save(update_fields=["cost_price"])
+
+        other_product = InventoryItem.objects.create(product_id="P0002", name="다른상품")
+        variants = [self.variant] + [
+            ProductVariant.objects.create(
+                product=other_product,
+                variant_code=f"P0002-{i:03d}",
+                option=str(i),
+                cost_price=100 * i,
+            )
+            for i in range(1, 30)
+        ]
+
+        payload = {
+            "supplier": self.supplier.id,
+            "manager_name": self.manager.first_name,
+            "order_date": "2025-07-23",
+            "expected_delivery_date": "2025-07-30",
+            "status": "PENDING",
+            "items": [
+                {"variant_code": v.variant_code, "quantity": 1, "unit_price": 1000}
+                for v in variants
+            ],
+        }
+
+        # 공급업체 + variant + 담당자 + 주문 INSERT + 품목 bulk INSERT (+ savepoint 2)
+        # + 응답 조회 (주문 / 품목 / variant)
+        with self.assertNumQueries(10):
+            r = self.client.post("/api/v1/orders/", payload, format="json")
+        self.assertEqual(r.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(r.data["items"]), 30)
+
+        item = OrderItem.objects.get(variant=self.variant)
+        self.assertEqual((item.item_name, item.cost_price), ("테스트상품", 3200))
+
+        # 이후 상품명 / variant 원가가 바뀌어도 주문 품목은 저장된 값으로 응답
+        self.variant.cost_price = 9999
+        self.variant.save(update_fields=["cost_price"])
+        self.product.name = "바뀐상품"
+        self.product.save(update_fields=["name"])
+
+        r = self.client.get(f"/api/v1/orders/{item.order_id}/")
+        served = next(
+            row for row in r.data["items"]
+            if row["variant_code"] == self.variant.variant_code
+        )
+        self.assertEqual((served["item_name"], served["cost_price"]), ("테스트상품", 3200))
+
+    def test_order_creation_reports_all_unknown_variants(self):
+        payload = {
+            "supplier": self.supplier.id,
+            "manager_name": self.manager.first_name,
+            "order_date": "2025-07-23",
+            "expected_delivery_date": "2025-07-30",
+            "status": "PENDING",
+            "items": [
+                {"variant_code": "NOPE-B", "quantity": 1, "unit_price": 1000},
+                {"variant_code": self.variant.variant_code, "quantity": 1, "unit_price": 1000},
+                {"variant_code": "NOPE-A", "quantity": 1, "unit_price": 1000},
+            ],
+        }
+
+        r = self.client.post("/api/v1/orders/", payload, format="json")
+        self.assertEqual(r.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            r.data["items"],
+            [
+                "variant_code 'NOPE-A' does not exist.",
+                "variant_code 'NOPE-B' does not exist.",
+            ],
+        )
+        self.assertEqual(Order.objects.count(), 0)
+
     def test_order_creation_with_invalid_variant(self):
         url = "/api/v1/orders/"
         payload = {
@@ -144,6 +223,75 @@ class OrderAPITestCase(APITestCase):
         self.assertEqual(r.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(r.data["results"]), 1)
 
+    def test_order_list_totals_sort_and_filter(self):
+        other_product = InventoryItem.objects.create(
+            product_id="P0002", name="다른상품"
+        )
+        other_variant = ProductVariant.objects.create(
+            product=other_product, variant_code="P0002-001", option="기본"
+        )
+
+        small = Order.objects.create(
+            supplier=self.supplier,
+            manager=self.manager,
+            order_date="2025-07-20",
+            status="PENDING",
+        )
+        OrderItem.objects.create(
+            order=small, variant=self.variant, item_name="테스트상품",
+            quantity=2, unit_price=1000,
+        )
+        large = Order.objects.create(
+            supplier=self.supplier,
+            manager=self.manager,
+            order_date="2025-07-21",
+            status="PENDING",
+        )
+        for variant, quantity in ((self.variant, 3), (self.variant, 4), (other_variant, 1)):
+            OrderItem.objects.create(
+                order=large, variant=variant, item_name=variant.product.name,
+                quantity=quantity, unit_price=100000,
+            )
+        empty = Order.objects.create(
+            supplier=self.supplier,
+            manager=self.manager,
+            order_date="2025-07-22",
+            status="PENDING",
+        )
+
+        # count + 주문 목록 (품목 / 상품 prefetch 없음)
+        with self.assertNumQueries(2):
+            r = self.client.get("/api/v1/orders/", {"ordering": "-total_price"})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+
+        rows = {row["id"]: row for row in r.data["results"]}
+        self.assertEqual(
+            [row["id"] for row in r.data["results"]], [large.id, small.id, empty.id]
+        )
+        self.assertEqual(
+            (rows[large.id]["total_quantity"], rows[large.id]["total_price"]),
+            (8, 800000),
+        )
+        self.assertEqual(rows[large.id]["product_names"], ["다른상품", "테스트상품"])
+        self.assertEqual(
+            (rows[empty.id]["total_quantity"], rows[empty.id]["total_price"], rows[empty.id]["product_names"]),
+            (0, 0, []),
+        )
+
+        # 상품명 필터(JOIN)와 같이 써도 합계 그대로
+        r = self.client.get(
+            "/api/v1/orders/",
+            {"product_name": "테스트", "min_total_quantity": 5},
+        )
+        self.assertEqual([row["id"] for row in r.data["results"]], [large.id])
+        self.assertEqual(r.data["results"][0]["total_price"], 800000)
+
+        r = self.client.get(
+            "/api/v1/orders/export/",
+            {"min_total_price": 1, "max_total_price": 2000},
+        )
+        self.assertEqual([row["id"] for row in r.data], [small.id])
+
     def test_order_detail_view(self):
         order = Order.objects.create(
             supplier=self.supplier,
@@ -231,6 +379,60 @@ class OrderAPITestCase(APITestCase):
         )
         self.assertEqual(status_obj.inbound_quantity, 7)
 
+    def test_order_completion_increments_existing_status_and_delete_reverts(self):
+        now = timezone.localtime()
+        status_obj = ProductVariantStatus.objects.create(
+            year=now.year,
+            month=now.month,
+            product=self.product,
+            variant=self.variant,
+            warehouse_stock_start=10,
+            inbound_quantity=3,
+        )
+        order = Order.objects.create(
+            supplier=self.supplier,
+            manager=self.manager,
+            order_date="2025-07-20",
+            expected_delivery_date="2025-07-25",
+            status="APPROVED",
+        )
+        for quantity in (4, 5):
+            OrderItem.objects.create(
+                order=order,
+                variant=self.variant,
+                quantity=quantity,
+                unit_price=4000,
+            )
+
+        r = self.client.patch(
+            f"/api/v1/orders/{order.id}/",
+            {"status": "COMPLETED"},
+            format="json",
+        )
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+
+        status_obj.refresh_from_db()
+        self.assertEqual(status_obj.inbound_quantity, 12)
+        self.assertEqual(status_obj.order_inbound_quantity, 9)
+        self.assertEqual(status_obj.ending_stock, 22)
+        self.assertEqual(status_obj.version, 1)
+
+        # 대사: 발주 입고분(9) = 완료 발주 합계 → 수기 입력분(3)이 있어도 불일치 없음
+        r = self.client.post(
+            f"/api/v1/inventory/variant-status/sync-inbound/{now.year}/{now.month}/"
+        )
+        self.assertEqual((r.data["checked"], r.data["updated"]), (1, 0))
+        self.assertEqual(r.data["discrepancies"], [])
+
+        # 완료 주문 삭제 → 반영했던 발주 입고분만 차감, 수기 입력분은 유지
+        r = self.client.delete(f"/api/v1/orders/{order.id}/")
+        self.assertEqual(r.status_code, status.HTTP_204_NO_CONTENT)
+
+        status_obj.refresh_from_db()
+        self.assertEqual(status_obj.inbound_quantity, 3)
+        self.assertEqual(status_obj.order_inbound_quantity, 0)
+        self.assertEqual(status_obj.ending_stock, 13)
+
     def test_completed_order_cannot_be_changed(self):
         order = Order.objects.create(
             supplier=self.supplier,
@@ -265,3 +467,145 @@ class OrderAPITestCase(APITestCase):
         )
 
         self.assertEqual(r.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # -------------------------------
+    # Export (compact 형식)
+    # -------------------------------
+    def test_order_export_compact_format(self):
+        Order.objects.create(
+            supplier=self.supplier,
+            manager=self.manager,
+            order_date="2025-07-20",
+            expected_delivery_date="2025-07-25",
+            status="PENDING",
+        )
+
+        r = self.client.get("/api/v1/orders/export/", {"format": "compact"})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+
+        body = json.loads(r.content)
+        self.assertIn("status", body["columns"])
+        self.assertEqual(len(body["rows"]), 1)
+        self.assertEqual(
+            body["rows"][0][body["columns"].index("status")], "PENDING"
+        )
+
+    def test_order_export_csv_streams_one_row_per_item(self):
+        import csv
+        from unittest import mock
+
+        from apps.orders import views as order_views
+
+        orders = []
+        for day in (20, 21, 22):
+            order = Order.objects.create(
+                supplier=self.supplier,
+                manager=self.manager,
+                order_date=f"2025-07-{day}",
+                status="PENDING",
+            )
+            for quantity in (1, 2):
+                OrderItem.objects.create(
+                    order=order,
+                    variant=self.variant,
+                    item_name="테스트상품",
+                    quantity=quantity,
+                    unit_price=500,
+                )
+            orders.append(order)
+        Order.objects.create(
+            supplier=None,
+            manager=None,
+            order_date="2025-07-23",
+            status="PENDING",
+        )
+
+        # 주문 4건을 2건씩: 서버 사이드 커서 1 + 청크마다 품목 prefetch 1
+        with mock.patch.object(order_views, "ORDER_EXPORT_CHUNK_SIZE", 2):
+            r = self.client.get(
+                "/api/v1/orders/export/",
+                {"format": "csv", "ordering": "order_date"},
+            )
+            self.assertEqual(r.status_code, status.HTTP_200_OK)
+            self.assertIn("text/csv", r["Content-Type"])
+
+            with self.assertNumQueries(3):
+                content = b"".join(r.streaming_content).decode("utf-8-sig")
+
+        rows = list(csv.reader(io.StringIO(content)))
+        header, rows = rows[0], rows[1:]
+        self.assertEqual(header, order_views.ORDER_EXPORT_HEADER)
+        self.assertEqual(len(rows), 7)
+
+        first = dict(zip(header, rows[0]))
+        self.assertEqual(first["주문번호"], str(orders[0].id))
+        self.assertEqual(first["공급업체"], "테스트공급업체")
+        self.assertEqual((first["상품코드"], first["상품명"]), ("P0001-001", "테스트상품"))
+        self.assertEqual((first["수량"], first["금액"]), ("1", "500"))
+        self.assertEqual(rows[1][0], str(orders[0].id))
+
+        # 품목 없는 주문 → 품목 컬럼 빈 한 행
+        last = dict(zip(header, rows[-1]))
+        self.assertEqual((last["공급업체"], last["상품코드"]), ("", ""))
+
+    def test_order_export_csv_skips_total_subqueries(self):
+        import csv
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        small = Order.objects.create(
+            supplier=self.supplier, manager=self.manager, order_date="2025-07-20"
+        )
+        OrderItem.objects.create(order=small, variant=self.variant, quantity=1, unit_price=100)
+        large = Order.objects.create(
+            supplier=self.supplier, manager=self.manager, order_date="2025-07-21"
+        )
+        OrderItem.objects.create(order=large, variant=self.variant, quantity=5, unit_price=100)
+
+        def export(params):
+            r = self.client.get("/api/v1/orders/export/", {"format": "csv", **params})
+            self.assertEqual(r.status_code, status.HTTP_200_OK)
+            with CaptureQueriesContext(connection) as ctx:
+                content = b"".join(r.streaming_content).decode("utf-8-sig")
+            rows = list(csv.reader(io.StringIO(content)))[1:]
+            return [int(row[0]) for row in rows], ctx.captured_queries[0]["sql"]
+
+        # 집계 필터 / 정렬 없음 → 주문 조회에 품목 서브쿼리 없음
+        ids, sql = export({"ordering": "order_date"})
+        self.assertEqual(ids, [small.id, large.id])
+        self.assertNotIn("order_items", sql)
+
+        # 집계로 정렬 / 필터 → 필요한 서브쿼리만 사용
+        ids, sql = export({"ordering": "-total_price"})
+        self.assertEqual(ids, [large.id, small.id])
+        self.assertNotIn("ARRAY_AGG", sql)
+
+        ids, _ = export({"min_total_quantity": 2})
+        self.assertEqual(ids, [large.id])
+
+    def test_order_export_xlsx(self):
+        from openpyxl import load_workbook
+
+        order = Order.objects.create(
+            supplier=self.supplier,
+            manager=self.manager,
+            order_date="2025-07-20",
+            status="PENDING",
+        )
+        OrderItem.objects.create(
+            order=order, variant=self.variant, quantity=3, unit_price=700
+        )
+        complete_order(order)
+
+        r = self.client.get("/api/v1/orders/export/", {"format": "xlsx"})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+
+        content = b"".join(r.streaming_content)
+        sheet = load_workbook(io.BytesIO(content), read_only=True).active
+        header, row = list(sheet.iter_rows(values_only=True))
+        row = dict(zip(header, row))
+
+        self.assertEqual(row["상태"], "COMPLETED")
+        self.assertIsNotNone(row["완료일시"])
+        self.assertEqual(row["금액"], 2100)
+
@@ -1,10 +1,18 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from apps.orders.service import complete_order
+from apps.orders.service import (
+    alias_order_totals,
+    annotate_order_totals,
+    complete_order,
+    delete_order,
+)
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.filters import OrderingFilter
+from rest_framework.settings import api_settings
+from apps.inventory.renderers import CSVRenderer, CompactJSONRenderer, XLSXRenderer
+from apps.inventory.utils.streaming import csv_response, xlsx_response
 from django.core.paginator import Paginator
 from apps.orders.filters import OrderFilter
 from rest_framework import status
@@ -13,33 +21,48 @@ from apps.inventory.models import ProductVariant
 from .serializers import OrderWriteSerializer, OrderReadSerializer, OrderCompactSerializer
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from django.db.models import Q, Sum
+from django.db.models import Prefetch, Q, Sum
+from django.utils import timezone
 from datetime import date
 
+# 파일 Export: 서버 사이드 커서로 한 번에 가져올 주문 수 (품목은 청크마다 prefetch)
+ORDER_EXPORT_CHUNK_SIZE = 500
+
+# 파일 Export 컬럼 (품목 1개당 1행, 주문 컬럼은 반복)
+ORDER_EXPORT_HEADER = [
+    "주문번호", "주문일", "입고예정일", "상태", "완료일시", "공급업체", "담당자",
+    "VAT 포함", "포장 포함", "주문 메모",
+    "상품코드", "상품명", "옵션", "규격", "단위", "수량", "단가", "금액", "품목 비고",
+]
+
 
 class OrderListView(APIView):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = OrderFilter
-    ordering_fields = ['order_date', 'expected_delivery_date'] 
+    ordering_fields = ['order_date', 'expected_delivery_date', 'total_price', 'total_quantity'] 
 
     @swagger_auto_schema(
             operation_summary="전체 주문 보기",
             operation_description="필터링, 정렬, 페이지네이션이 가능한 주문 리스트",
             manual_parameters=[
-                openapi.Parameter('ordering', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='정렬 필드 (order_date, expected_delivery_date)'),
+                openapi.Parameter('ordering', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='정렬 필드 (order_date, expected_delivery_date, total_price, total_quantity)'),
                 openapi.Parameter('product_name', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='상품명'),
                 openapi.Parameter('supplier', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='공급업체 이름'),
                 openapi.Parameter('status', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='주문 상태'),
                 openapi.Parameter('start_date', openapi.IN_QUERY, type=openapi.TYPE_STRING, format='date', description='조회 시작일 (예: 2025-07-01)'),
                 openapi.Parameter('end_date', openapi.IN_QUERY, type=openapi.TYPE_STRING, format='date',  description='조회 종료일 (예: 2025-08-01)'),
+                openapi.Parameter('min_total_price', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='총 금액 이상'),
+                openapi.Parameter('max_total_price', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='총 금액 이하'),
+                openapi.Parameter('min_total_quantity', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='총 수량 이상'),
+                openapi.Parameter('max_total_quantity', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='총 수량 이하'),
                 openapi.Parameter('page', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='페이지 번호 (default: 1)'),
             ],
             responses={200: OrderCompactSerializer(many=True)}
         )
     
     def get(self, request):
-        queryset = Order.objects.prefetch_related("items__variant__product").all()
+        queryset = annotate_order_totals(Order.objects.all())
 
         for backend in self.filter_backends:
             queryset = backend().filter_queryset(request, queryset, self)
@@ -89,7 +112,12 @@ class OrderListView(APIView):
         serializer = OrderWriteSerializer(data=request.data)
         if serializer.is_valid():
             order = serializer.save()
-            # 응답은 읽기용으로 직렬화
+            # 응답은 읽기용으로 직렬화 (품목 / variant를 한 번에 조회)
+            order = (
+                Order.objects.select_related("supplier", "manager")
+                .prefetch_related("items__variant")
+                .get(pk=order.pk)
+            )
             read_serializer = OrderReadSerializer(order)
             return Response(read_serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -117,14 +145,14 @@ class OrderDetailView(APIView):
 
     @swagger_auto_schema(
         operation_summary="주문 삭제하기",
-        operation_description="Delete a specific order by its ID.",
+        operation_description="Delete a specific order by its ID. (COMPLETED 주문은 반영된 입고량 차감)",
         responses={204: "No Content", 404: "Not Found"}
     )
     def delete(self, request, order_id):
         order = self.get_object(order_id)
         if not order:
             return Response({"error": "Order not found"}, status=status.HTTP_404_NOT_FOUND)
-        order.delete()
+        delete_order(order)
         return Response({"message": "Order deleted successfully"}, status=status.HTTP_204_NO_CONTENT)
 
     def get_object(self, order_id):
@@ -199,11 +227,21 @@ class OrderExportView(APIView):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = OrderFilter
-    ordering_fields = ['order_date', 'expected_delivery_date']
+    ordering_fields = ['order_date', 'expected_delivery_date', 'total_price', 'total_quantity']
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        CSVRenderer,
+        XLSXRenderer,
+        CompactJSONRenderer,
+    ]
 
     @swagger_auto_schema(
         operation_summary="전체 주문 Export (엑셀용)",
-        operation_description="필터링/정렬은 유지하며 pagination 없이 모든 주문 데이터를 반환합니다.",
+        operation_description=(
+            "필터링/정렬은 유지하며 pagination 없이 모든 주문 데이터를 반환합니다.\n\n"
+            "format=csv 또는 format=xlsx 지정 시 품목 1개당 1행(주문 컬럼 반복)으로\n"
+            "파일을 스트리밍 다운로드합니다. (기간이 길어도 메모리 사용량 일정)"
+        ),
         manual_parameters=[
             openapi.Parameter('ordering', openapi.IN_QUERY, type=openapi.TYPE_STRING),
             openapi.Parameter('product_name', openapi.IN_QUERY, type=openapi.TYPE_STRING),
@@ -211,11 +249,21 @@ class OrderExportView(APIView):
             openapi.Parameter('status', openapi.IN_QUERY, type=openapi.TYPE_STRING),
             openapi.Parameter('start_date', openapi.IN_QUERY, type=openapi.TYPE_STRING, format='date'),
             openapi.Parameter('end_date', openapi.IN_QUERY, type=openapi.TYPE_STRING, format='date'),
+            openapi.Parameter('min_total_price', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter('max_total_price', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter('min_total_quantity', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter('max_total_quantity', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter('format', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=['csv', 'xlsx', 'compact'], description='csv/xlsx: 품목 단위 파일 다운로드, compact: 컬럼형 JSON (columns + rows)'),
         ],
         responses={200: OrderCompactSerializer(many=True)}
     )
     def get(self, request):
-        queryset = Order.objects.prefetch_related("items__variant__product").all()
+        file_format = getattr(request.accepted_renderer, "format", None)
+        is_file = file_format in ("csv", "xlsx")
+
+        # 파일은 품목을 직접 출력 → 집계 서브쿼리는 필터 / 정렬에 쓰일 때만
+        totals = alias_order_totals if is_file else annotate_order_totals
+        queryset = totals(Order.objects.all())
 
         for backend in self.filter_backends:
             queryset = backend().filter_queryset(request, queryset, self)
@@ -224,5 +272,70 @@ class OrderExportView(APIView):
         if ordering:
             queryset = queryset.order_by(ordering)
 
+        if is_file:
+            return self._file_response(request, queryset, file_format)
+
         serializer = OrderCompactSerializer(queryset, many=True)
-        return Response(serializer.data, status=200)
\ No newline at end of file
+        return Response(serializer.data, status=200)
+
+    def _file_response(self, request, queryset, file_format):
+        """
+        주문 + 품목을 한 행씩 파일로 출력
+        - iterator(chunk_size): 서버 사이드 커서로 주문을 청크 단위 조회,
+          품목 / variant는 청크마다 prefetch → 기간과 관계없이 메모리 사용량 일정
+        - 품목 없는 주문은 품목 컬럼을 비운 한 행
+        """
+        items = OrderItem.objects.select_related("variant").order_by("id")
+        orders = (
+            queryset.prefetch_related(Prefetch("items", queryset=items))
+            .iterator(chunk_size=ORDER_EXPORT_CHUNK_SIZE)
+        )
+
+        start_date = request.query_params.get("start_date")
+        end_date = request.query_params.get("end_date")
+        period = f"{start_date or 'start'}_{end_date or 'end'}" if start_date or end_date else "all"
+        filename = f"orders_{period}.{file_format}"
+
+        rows = self._iter_item_rows(orders)
+        if file_format == "csv":
+            return csv_response(filename, ORDER_EXPORT_HEADER, rows)
+        return xlsx_response(filename, ORDER_EXPORT_HEADER, rows)
+
+    @staticmethod
+    def _iter_item_rows(orders):
+        for order in orders:
+            # xlsx는 timezone 있는 datetime을 쓸 수 없어 현지 시간으로 변환
+            completed_at = (
+                timezone.localtime(order.completed_at).replace(tzinfo=None)
+                if order.completed_at else None
+            )
+            order_columns = [
+                order.id,
+                order.order_date,
+                order.expected_delivery_date,
+                order.status,
+                completed_at,
+                order.supplier.name if order.supplier else "",
+                order.manager.first_name if order.manager else "",
+                "Y" if order.vat_included else "N",
+                "Y" if order.packaging_included else "N",
+                order.note or "",
+            ]
+
+            items = order.items.all()
+            if not items:
+                yield order_columns + [""] * 9
+                continue
+
+            for item in items:
+                yield order_columns + [
+                    item.variant.variant_code,
+                    item.item_name,
+                    item.variant.option,
+                    item.spec or "",
+                    item.unit,
+                    item.quantity,
+                    item.unit_price,
+                    item.quantity * item.unit_price,
+                    item.remark or "",
+                ]
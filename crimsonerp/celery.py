@@ -0,0 +1,11 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "crimsonerp.settings")
+
+app = Celery("crimsonerp")
+
+# CELERY_ 접두사 설정 사용
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
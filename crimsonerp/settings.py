@@ -13,7 +13,9 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -162,6 +164,39 @@ DATABASES = {
     }
 }
 
+# Cache
+# REDIS_URL 있으면 Redis
+# 없으면 개발(DEBUG) / 테스트에서만 로컬 메모리 캐시 허용
+# - 로컬 메모리 캐시는 프로세스마다 따로라 gunicorn worker 여러 개면 무효화가 전달되지 않음
+#   → 운영에서 REDIS_URL 누락 시 조용히 넘어가지 않고 시작 단계에서 실패
+REDIS_URL = config("REDIS_URL", default="")
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "crimsonerp",
+        }
+    }
+elif DEBUG or TESTING:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "crimsonerp",
+        }
+    }
+else:
+    raise ImproperlyConfigured(
+        "REDIS_URL이 설정되지 않았습니다. (DEBUG가 아닌 환경에서는 공유 캐시가 필요합니다)"
+    )
+
+# 월별 재고 현황 응답 캐시 유지 시간 (초)
+VARIANT_STATUS_CACHE_TIMEOUT = config(
+    "VARIANT_STATUS_CACHE_TIMEOUT", default=600, cast=int
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -180,6 +215,15 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Celery
+# 브로커는 캐시(REDIS_URL)와 별개로 명시적으로 설정
+# - CELERY_BROKER_URL 설정 시 worker 프로세스 필요 (celery -A crimsonerp worker, 배포 시 재시작)
+# - 미설정(개발/테스트) 시 작업을 요청 안에서 바로 실행
+CELERY_BROKER_URL = config("CELERY_BROKER_URL", default="")
+CELERY_RESULT_BACKEND = config("CELERY_RESULT_BACKEND", default="") or None
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_TIMEZONE = "Asia/Seoul"
+
 CELERY_BEAT_SCHEDULE = {
     "cleanup-expired-reservations": {
         "task": "inventory.tasks.cleanup_expired_reservations",